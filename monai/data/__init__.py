@@ -10,8 +10,21 @@
 # limitations under the License.
 
 from .csv_saver import CSVSaver
-from .dataset import Dataset, PersistentDataset, CacheDataset, ZipDataset, ArrayDataset
+from .dataset import (
+    Dataset,
+    PersistentDataset,
+    CacheDataset,
+    SmartCacheDataset,
+    DistributedCacheDataset,
+    ZipDataset,
+    ArrayDataset,
+)
+from .shared_cache import SharedCache
+from .pack_store import PackedCacheStore
 from .grid_dataset import GridPatchDataset
+from .lazy_array import LazyArray
+from .gzip_index import get_gzip_index_path, open_indexed_gzip, read_indexed_gzip
+from .patch_dataset import PatchQueueDataset
 from .nifti_reader import NiftiDataset
 from .nifti_saver import NiftiSaver
 from .nifti_writer import write_nifti
@@ -20,4 +33,6 @@ from .utils import *
 from .png_saver import PNGSaver
 from .png_writer import write_png
 from .decathalon_datalist import load_decathalon_datalist
+from .manifest import scan_datalist, load_manifest
 from .dataloader import *
+from .samplers import *
@@ -9,12 +9,73 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 
+import numpy as np
 import torch
+from torch.utils.data import Dataset, IterableDataset
+from torch.utils.data._utils.pin_memory import pin_memory as _pin_memory
+
 from monai.data import list_data_collate, worker_init_fn
+from monai.transforms import Randomizable
+
+__all__ = ["DataLoader", "ThreadDataLoader"]
+
+
+def _copy_randomizable(obj):
+    """
+    A shallow copy of `obj` with its own copies of the nested :py:class:`monai.transforms.Randomizable`
+    members (including the items of the list and tuple members), so that the random states of the copy
+    are independent of `obj`. The other members, such as the arrays and a profiler, are shared.
+    """
+    if type(obj) in (list, tuple):
+        return type(obj)(_copy_randomizable(o) for o in obj)
+    if not isinstance(obj, Randomizable):
+        return obj
+    obj = copy.copy(obj)
+    for name, value in list(getattr(obj, "__dict__", {}).items()):
+        if isinstance(value, Randomizable) or type(value) in (list, tuple):
+            setattr(obj, name, _copy_randomizable(value))
+    return obj
+
 
-__all__ = ["DataLoader"]
+def _copy_dataset(dataset, seeds):
+    """
+    A shallow copy of `dataset` with its own copies of the :py:class:`monai.transforms.Randomizable` members
+    (such as `transform`, see :py:func:`_copy_randomizable`), of the nested datasets (such as the datasets of
+    :py:class:`monai.data.ZipDataset` and :py:class:`monai.data.ArrayDataset`) and of the dataset itself if it is
+    Randomizable. Every copied random state is reseeded with the next seed of the iterator `seeds`, starting
+    with the `transform` of `dataset`.
+    """
+    dataset = copy.copy(dataset)
+    members = getattr(dataset, "__dict__", {})
+    for name in sorted(members, key=lambda n: n != "transform"):
+        value = members[name]
+        if isinstance(value, Dataset):
+            setattr(dataset, name, _copy_dataset(value, seeds))
+        elif type(value) in (list, tuple) and value and isinstance(value[0], Dataset):
+            setattr(dataset, name, type(value)(_copy_dataset(d, seeds) for d in value))
+        elif isinstance(value, Randomizable):
+            value = _copy_randomizable(value)
+            value.set_random_state(next(seeds))
+            setattr(dataset, name, value)
+    if isinstance(dataset, Randomizable):
+        dataset.set_random_state(next(seeds))
+    return dataset
+
+
+def _thread_seeds(seed: int):
+    """
+    The seeds of the random states of a thread, the first one is the seed of :py:func:`monai.data.worker_init_fn`.
+    """
+    seed = seed % (2 ** 32)
+    yield seed
+    rand_state = np.random.RandomState(seed)
+    while True:
+        yield int(rand_state.randint(2 ** 31))
 
 
 class DataLoader(torch.utils.data.DataLoader):
@@ -46,6 +107,9 @@ class DataLoader(torch.utils.data.DataLoader):
         timeout (numeric, optional): if positive, the timeout value for collecting a batch
             from workers. Should always be non-negative. (default: ``0``)
         multiprocessing_context: specify a valid start method for multi-processing.
+        collate_fn: merges a list of samples to form a mini-batch, default is
+            :py:func:`monai.data.list_data_collate`. Use :py:func:`monai.data.pad_list_data_collate`
+            for the samples of different shapes.
 
     """
 
@@ -61,6 +125,7 @@ class DataLoader(torch.utils.data.DataLoader):
         drop_last=False,
         timeout=0,
         multiprocessing_context: Optional[Callable] = None,
+        collate_fn: Callable = list_data_collate,
     ):
         super().__init__(
             dataset=dataset,
@@ -69,10 +134,111 @@ class DataLoader(torch.utils.data.DataLoader):
             sampler=sampler,
             batch_sampler=batch_sampler,
             num_workers=num_workers,
-            collate_fn=list_data_collate,
+            collate_fn=collate_fn,
             pin_memory=pin_memory,
             drop_last=drop_last,
             timeout=timeout,
             worker_init_fn=worker_init_fn,
             multiprocessing_context=multiprocessing_context,
         )
+
+
+class ThreadDataLoader(DataLoader):
+    """
+    Same as :py:class:`monai.data.DataLoader`, but the batches are loaded by `num_workers` threads in the
+    main process instead of the worker processes. For a dataset in memory (for example a fully cached
+    :py:class:`monai.data.CacheDataset`) with only cheap random transforms left, it avoids pickling the
+    batches between the processes and copying the dataset into every worker process.
+
+    Every thread loads the batches in turn with its own copy of the random transforms of the dataset, the dataset
+    `transform` is seeded like :py:func:`monai.data.worker_init_fn`. The random transforms of the nested datasets
+    (for example, the `img_transform` and `seg_transform` of :py:class:`monai.data.ArrayDataset` or the datasets
+    of :py:class:`monai.data.ZipDataset`) and the random datasets themselves are copied and reseeded too.
+    The deterministic transforms, the members of the random transforms other than the random transforms
+    (such as the arrays or a profiler) and the other attributes of the datasets (such as the cache) are shared
+    by the threads.
+    The batches are yielded in the order of the sampler, at most `num_workers * prefetch_factor` batches are
+    loaded ahead. With `num_workers=0` or an `IterableDataset`, the batches are loaded in the iterating thread.
+
+    Args:
+        dataset (Dataset): dataset from which to load the data.
+        batch_size: how many samples per batch to load (default: ``1``).
+        shuffle: set to ``True`` to have the data reshuffled at every epoch (default: ``False``).
+        sampler (Sampler, optional): defines the strategy to draw samples from the dataset.
+        batch_sampler (Sampler, optional): like :attr:`sampler`, but returns a batch of indices at a time.
+        num_workers: how many threads to use for data loading. ``0`` means that the data will be loaded
+            in the iterating thread. (default: ``0``)
+        pin_memory: If ``True``, the threads copy the tensors into CUDA pinned memory before returning them.
+        drop_last: set to ``True`` to drop the last incomplete batch. (default: ``False``)
+        timeout (numeric, optional): if positive, the timeout value for collecting a batch from the threads.
+        collate_fn: merges a list of samples to form a mini-batch, default is
+            :py:func:`monai.data.list_data_collate`.
+        prefetch_factor: number of batches loaded in advance by each thread. (default: ``2``)
+
+    """
+
+    def __init__(
+        self,
+        dataset,
+        batch_size: Optional[int] = 1,
+        shuffle: bool = False,
+        sampler=None,
+        batch_sampler=None,
+        num_workers: Optional[int] = 0,
+        pin_memory=False,
+        drop_last=False,
+        timeout=0,
+        collate_fn: Callable = list_data_collate,
+        prefetch_factor: int = 2,
+    ):
+        super().__init__(
+            dataset=dataset,
+            batch_size=batch_size,
+            shuffle=shuffle,
+            sampler=sampler,
+            batch_sampler=batch_sampler,
+            num_workers=0,
+            pin_memory=pin_memory,
+            drop_last=drop_last,
+            timeout=timeout,
+            collate_fn=collate_fn,
+        )
+        self.num_threads = num_workers or 0
+        self.prefetch_factor = max(prefetch_factor, 1)
+
+    def _thread_dataset(self, seed: int):
+        return _copy_dataset(self.dataset, _thread_seeds(seed))
+
+    def __iter__(self):
+        if self.num_threads == 0 or isinstance(self.dataset, IterableDataset):
+            yield from super().__iter__()
+            return
+
+        # like the worker processes, the batches are assigned to the threads in turn, so that
+        # the random states of the transforms don't depend on the scheduling of the threads
+        base_seed = int(torch.empty((), dtype=torch.int64).random_().item())
+        datasets = [self._thread_dataset(base_seed + i) for i in range(self.num_threads)]
+        executors = [ThreadPoolExecutor(1) for _ in range(self.num_threads)]
+
+        def _fetch(dataset, index):
+            if self._auto_collation:
+                data = self.collate_fn([dataset[i] for i in index])
+            else:
+                data = self.collate_fn(dataset[index])
+            return _pin_memory(data) if self.pin_memory else data
+
+        timeout = self.timeout if self.timeout > 0 else None
+        futures: deque = deque()
+        try:
+            for i, index in enumerate(self._index_sampler):
+                thread_id = i % self.num_threads
+                futures.append(executors[thread_id].submit(_fetch, datasets[thread_id], index))
+                if len(futures) >= self.num_threads * self.prefetch_factor:
+                    yield futures.popleft().result(timeout)
+            while futures:
+                yield futures.popleft().result(timeout)
+        finally:
+            for future in futures:
+                future.cancel()
+            for executor in executors:
+                executor.shutdown()
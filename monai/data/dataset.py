@@ -10,9 +10,14 @@
 # limitations under the License.
 
 import hashlib
+import io
 import json
+import os
+import pickle
+import shutil
 import sys
 import threading
+from multiprocessing import Pool
 from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from typing import Callable, Optional
@@ -21,9 +26,23 @@ import numpy as np
 import torch
 from torch.utils.data import Dataset as _TorchDataset
 
+from monai.data.pack_store import PackedCacheStore
+from monai.data.shared_cache import SharedCache, pack_item, unpack_item
+from monai.data.utils import get_transform_fingerprint, partition_dataset
 from monai.transforms import Compose, Randomizable, Transform
 from monai.transforms.utils import apply_transform
-from monai.utils import get_seed, process_bar
+from monai.utils import get_seed, process_bar, profiling_segment
+
+
+def _first_random_index(transforms) -> int:
+    """
+    The index of the first random transform or callable not a `Transform` in `transforms`,
+    the results of the transforms before it are cached by the datasets.
+    """
+    for idx, _transform in enumerate(transforms):
+        if isinstance(_transform, Randomizable) or not isinstance(_transform, Transform):
+            return idx
+    return len(transforms)
 
 
 class Dataset(_TorchDataset):
@@ -91,9 +110,31 @@ class PersistentDataset(Dataset):
 
     Subsequent uses of a dataset directly read pre-processed results from `cache_dir`
     followed by applying the random dependant parts of transform processing.
+
+    The cache file names are computed from the input data item and a fingerprint of the
+    deterministic transforms (the class and the attributes of each transform), so that
+    changing the pre-processing transforms will not load the stale results from `cache_dir`.
+
+    Three storage formats are supported:
+
+        - ``"pt"``: every item is pickled into a single file by `torch.save` and fully loaded on read.
+        - ``"npy"``: every item is a folder, the top level numpy arrays are stored as raw `.npy` files and
+          the rest of the item is pickled into a small `meta.pkl` sidecar. The arrays are loaded with
+          `np.load(mmap_mode=mmap_mode)`, so that a cache hit only reads the pages from the OS page cache
+          and the workers reading the same item share the same physical memory.
+        - ``"pack"``: every item is serialized by `torch.save` and appended to a single pack file with an index
+          of the offsets (see :py:class:`monai.data.PackedCacheStore`), so that a cold start opens two files
+          instead of one file per item, this is faster on the network file systems.
     """
 
-    def __init__(self, data, transform: Optional[Callable] = None, cache_dir=None):
+    def __init__(
+        self,
+        data,
+        transform: Optional[Callable] = None,
+        cache_dir=None,
+        cache_format: str = "pt",
+        mmap_mode: Optional[str] = "r",
+    ):
         """
         Args:
             data (Iterable): input data to load and transform to generate dataset for model.
@@ -101,13 +142,28 @@ class PersistentDataset(Dataset):
             cache_dir (Path or str or None): If specified, this is the location for persistent storage
                 of pre-computed transformed data tensors. The cache_dir is computed once, and
                 persists on disk until explicitly removed.  Different runs, programs, experiments
-                may share a common cache dir provided that the transforms pre-processing is
-                consistent.
+                may share a common cache dir, the deterministic transforms are part of the cache names.
+            cache_format: the storage format of the cache, ``"pt"``, ``"npy"`` or ``"pack"``.
+            mmap_mode: the `mmap_mode` of `np.load` to read the arrays when `cache_format="npy"`, default is
+                ``"r"``, the arrays are read-only. Use ``"c"`` (copy-on-write) if the following random transforms
+                modify the arrays in place, or None to fully load the arrays into memory.
+
+        Raises:
+            ValueError: cache_format must be "pt", "npy" or "pack".
+
         """
         if not isinstance(transform, Compose):
             transform = Compose(transform)
         super().__init__(data=data, transform=transform)
         self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if cache_format not in ("pt", "npy", "pack"):
+            raise ValueError(f"cache_format must be 'pt', 'npy' or 'pack', got {cache_format}.")
+        self.cache_format = cache_format
+        self._pack_store: Optional[PackedCacheStore] = None
+        self.mmap_mode = mmap_mode
+        transforms = self.transform.transforms  # pytype: disable=attribute-error
+        deterministic_transforms = transforms[: _first_random_index(transforms)]
+        self.transform_fingerprint = get_transform_fingerprint(deterministic_transforms)
 
     def _pre_first_random_transform(self, item_transformed):
         """
@@ -119,12 +175,11 @@ class PersistentDataset(Dataset):
             the transformed element up to the first identified
             random transform object
         """
-        for _transform in self.transform.transforms:  # pytype: disable=attribute-error
+        transform = self.transform
+        with profiling_segment(transform.profiler, "cached"):  # pytype: disable=attribute-error
             # execute all the deterministic transforms
-            if isinstance(_transform, Randomizable) or not isinstance(_transform, Transform):
-                break
-            item_transformed = apply_transform(_transform, item_transformed)
-        return item_transformed
+            stop = _first_random_index(transform.transforms)  # pytype: disable=attribute-error
+            return transform.apply_range(item_transformed, 0, stop)  # pytype: disable=attribute-error
 
     def _first_random_and_beyond_transform(self, item_transformed):
         """
@@ -134,16 +189,57 @@ class PersistentDataset(Dataset):
         Returns:
             the transformed element through the random transforms
         """
-        start_post_randomize_run = False
-        for _transform in self.transform.transforms:  # pytype: disable=attribute-error
-            if (
-                start_post_randomize_run
-                or isinstance(_transform, Randomizable)
-                or not isinstance(_transform, Transform)
-            ):
-                start_post_randomize_run = True
-                item_transformed = apply_transform(_transform, item_transformed)
-        return item_transformed
+        transform = self.transform
+        with profiling_segment(transform.profiler, "uncached"):  # pytype: disable=attribute-error
+            start = _first_random_index(transform.transforms)  # pytype: disable=attribute-error
+            return transform.apply_range(item_transformed, start)  # pytype: disable=attribute-error
+
+    def _load_cache(self, loader: Callable, *args):
+        """
+        Load a cached item by ``loader(*args)``, recorded as "load_cache" in the "cached" segment when profiling.
+        """
+        profiler = self.transform.profiler  # pytype: disable=attribute-error
+        if profiler is None:
+            return loader(*args)
+        with profiler.segment("cached"):
+            return profiler.profile("load_cache", loader, *args)
+
+    def _save_npy(self, item_transformed, cache_path: Path):
+        """
+        Save the top level numpy arrays of a dictionary as `.npy` files and the rest of the data
+        into a pickled `meta.pkl` sidecar, in the folder `cache_path`.
+        """
+        # NOTE: Writing to a temporary folder and then using a nearly atomic rename operation
+        #       to make the cache more robust to manual killing of parent process
+        #       which may leave partially written cache files in an incomplete state
+        temp_path = cache_path.with_suffix(f".temp_write_cache{os.getpid()}")
+        temp_path.mkdir(parents=True, exist_ok=True)
+        array_keys = list()
+        others = dict()
+        for key, value in item_transformed.items():
+            if isinstance(value, np.ndarray) and value.dtype != object:
+                np.save(temp_path / f"{len(array_keys)}.npy", value, allow_pickle=False)
+                array_keys.append(key)
+            else:
+                others[key] = value
+        with open(temp_path / "meta.pkl", "wb") as f:
+            pickle.dump({"array_keys": array_keys, "others": others}, f)
+        try:
+            temp_path.rename(cache_path)
+        except OSError:
+            # another process has written the same item
+            shutil.rmtree(temp_path, ignore_errors=True)
+
+    def _load_npy(self, cache_path: Path):
+        """
+        Load an item saved by `_save_npy`, the arrays are memory-mapped with `self.mmap_mode`.
+        """
+        with open(cache_path / "meta.pkl", "rb") as f:
+            meta = pickle.load(f)
+        item = meta["others"]
+        for i, key in enumerate(meta["array_keys"]):
+            item[key] = np.load(cache_path / f"{i}.npy", mmap_mode=self.mmap_mode, allow_pickle=False)
+        return item
 
     def _pre_first_random_cachecheck(self, item_transformed):
         """
@@ -158,44 +254,85 @@ class PersistentDataset(Dataset):
             The transformed data_element, either from cache, or explicitly computing it.
 
         Warning:
-            The current implementation does not encode transform information as part of the
-            hashing mechanism used for generating cache names.  If the transforms applied are
-            changed in any way, the objects in the cache dir will be invalid.  The hash for the
-            cache is ONLY dependant on the input filename paths.
+            The hash for the cache is computed from the input data and the attributes of the deterministic
+            transforms. Changes that are not reflected in the attributes of the transforms (for example,
+            the code of a transform class or the content of the input files) are not detected,
+            the `cache_dir` should be cleared manually in that case.
         """
         if item_transformed.get("cached", False) is False:
-            hashfile = None
+            hashfile: Optional[Path] = None
+            pack_key: Optional[str] = None
             if self.cache_dir is not None:
                 cache_dir_path: Path = Path(self.cache_dir)
                 if cache_dir_path.is_dir():
-                    # TODO: Find way to hash transforms content as part of the cache
                     data_item_md5 = hashlib.md5(
-                        json.dumps(item_transformed, sort_keys=True).encode("utf-8")
+                        (json.dumps(item_transformed, sort_keys=True) + self.transform_fingerprint).encode("utf-8")
                     ).hexdigest()
-                    hashfile: Path = Path(cache_dir_path) / f"{data_item_md5}.pt"
-
-            if hashfile is not None and hashfile.is_file():
-                item_transformed = torch.load(hashfile)
+                    if self.cache_format == "npy":
+                        hashfile = Path(cache_dir_path) / data_item_md5
+                    elif self.cache_format == "pack":
+                        pack_key = data_item_md5
+                        if self._pack_store is None:
+                            self._pack_store = PackedCacheStore(cache_dir_path)
+                    else:
+                        hashfile = Path(cache_dir_path) / f"{data_item_md5}.pt"
+
+            if hashfile is not None and self.cache_format == "npy" and hashfile.is_dir():
+                item_transformed = self._load_cache(self._load_npy, hashfile)
+            elif hashfile is not None and self.cache_format == "pt" and hashfile.is_file():
+                item_transformed = self._load_cache(torch.load, hashfile)
+            elif pack_key is not None and pack_key in self._pack_store:
+                item_transformed = self._load_cache(lambda k: torch.load(io.BytesIO(self._pack_store.get(k))), pack_key)
             else:
                 item_transformed = self._pre_first_random_transform(item_transformed)
-                if hashfile is not None:
+                if hashfile is not None or pack_key is not None:
                     # add sentinel flag to indicate that the transforms have already been computed.
-                    item_transformed["cache"] = True
-                    # NOTE: Writing to ".temp_write_cache" and then using a nearly atomic rename operation
-                    #       to make the cache more robust to manual killing of parent process
-                    #       which may leave partially written cache files in an incomplete state
-                    temp_hash_file: Path = hashfile.with_suffix(".temp_write_cache")
-                    torch.save(item_transformed, temp_hash_file)
-                    temp_hash_file.rename(hashfile)
+                    item_transformed["cached"] = True
+                    if pack_key is not None:
+                        buffer = io.BytesIO()
+                        torch.save(item_transformed, buffer)
+                        self._pack_store.put(pack_key, buffer.getvalue())
+                    elif self.cache_format == "npy":
+                        self._save_npy(item_transformed, hashfile)
+                    else:
+                        # NOTE: Writing to ".temp_write_cache" and then using a nearly atomic rename operation
+                        #       to make the cache more robust to manual killing of parent process
+                        #       which may leave partially written cache files in an incomplete state
+                        temp_hash_file: Path = hashfile.with_suffix(".temp_write_cache")
+                        torch.save(item_transformed, temp_hash_file)
+                        temp_hash_file.rename(hashfile)
 
         return item_transformed
 
     def __getitem__(self, index):
         pre_random_item = self._pre_first_random_cachecheck(self.data[index])
         post_random_item = self._first_random_and_beyond_transform(pre_random_item)
+        if self.transform.profiler is not None:  # pytype: disable=attribute-error
+            self.transform.profiler.flush()  # pytype: disable=attribute-error
         return post_random_item
 
 
+_process_transform: Optional[Compose] = None
+
+
+def _init_cache_process(transform):
+    global _process_transform
+    _process_transform = transform
+
+
+def _load_cache_item_process(item):
+    """
+    Execute the deterministic transforms on `item` in a worker process of `CacheDataset`,
+    the result is packed into shared memory for the main process.
+    """
+    transform = _process_transform
+    with profiling_segment(transform.profiler, "cached"):
+        item = transform.apply_range(item, 0, _first_random_index(transform.transforms))
+    if transform.profiler is not None:
+        transform.profiler.flush()
+    return pack_item(item)
+
+
 class CacheDataset(Dataset):
     """
     Dataset with cache mechanism that can load data and cache deterministic transforms' result during training.
@@ -228,10 +365,30 @@ class CacheDataset(Dataset):
     can be cached. During training, the dataset will load the cached results and run
     ``RandCropByPosNegLabeld`` and ``ToTensord``, as ``RandCropByPosNegLabeld`` is a randomized transform
     and the outcome not cached.
+
+    The cache is computed by `num_workers` threads by default. For the transform chains spending most of the time
+    in the code holding the GIL (pure python code, header parsing, `Orientation`, `one_hot`...), `worker_type="process"`
+    computes the items in a process pool instead, the workers send the numpy arrays back to the main process through
+    shared memory rather than pickling them. Both keep the cache in the order of `data`.
+
+    With `shared_memory=True`, the numpy arrays of the cached items are moved into a
+    :py:class:`monai.data.SharedCache` after caching, so that the DataLoader worker processes read the same
+    physical memory instead of copying the cache into every worker. The cached arrays are read-only in this mode,
+    the following transforms should not modify the input arrays in place.
+
+    With a lazy `Compose` (``Compose(transforms, lazy=True)``), the deterministic transforms are resampled once
+    before caching, and the random transforms once after loading from the cache.
     """
 
     def __init__(
-        self, data, transform: Callable, cache_num: int = sys.maxsize, cache_rate: float = 1.0, num_workers: int = 0
+        self,
+        data,
+        transform: Callable,
+        cache_num: int = sys.maxsize,
+        cache_rate: float = 1.0,
+        num_workers: int = 0,
+        shared_memory: bool = False,
+        worker_type: str = "thread",
     ):
         """
         Args:
@@ -243,59 +400,343 @@ class CacheDataset(Dataset):
                 will take the minimum of (cache_num, data_length x cache_rate, data_length).
             num_workers: the number of worker threads to use.
                 If 0 a single thread will be used. Default is 0.
+            shared_memory: whether to store the numpy arrays of the cache in shared memory. Default is False.
+            worker_type: the type of workers when `num_workers > 0`, ``"thread"`` or ``"process"``.
+                Default is ``"thread"``. The transforms must be picklable to use process workers if the
+                start method of multiprocessing is not ``"fork"``.
+
+        Raises:
+            ValueError: worker_type must be "thread" or "process".
+
         """
         if not isinstance(transform, Compose):
             transform = Compose(transform)
+        if worker_type not in ("thread", "process"):
+            raise ValueError(f"worker_type must be 'thread' or 'process', got {worker_type}.")
         super().__init__(data, transform)
         self.cache_num = min(cache_num, int(len(self) * cache_rate), len(self))
         if self.cache_num > 0:
-            self._cache = [None] * self.cache_num
-            print("Load and cache transformed data...")
-            if num_workers > 0:
-                self._item_processed = 0
-                self._thread_lock = threading.Lock()
-                with ThreadPool(num_workers) as p:
-                    p.map(
-                        self._load_cache_item_thread,
-                        [(i, data[i], transform.transforms) for i in range(self.cache_num)],
-                    )
-            else:
-                for i in range(self.cache_num):
-                    self._cache[i] = self._load_cache_item(data[i], transform.transforms)
-                    process_bar(i + 1, self.cache_num)
+            self._fill_cache(num_workers, worker_type)
+            if shared_memory:
+                self._cache = SharedCache(self._cache)
 
-    def _load_cache_item(self, item, transforms):
-        for _transform in transforms:
-            # execute all the deterministic transforms
-            if isinstance(_transform, Randomizable) or not isinstance(_transform, Transform):
-                break
-            item = apply_transform(_transform, item)
-        return item
+    def _fill_cache(self, num_workers: int, worker_type: str = "thread"):
+        """
+        Compute the cache of the first `cache_num` items of `data`.
+        """
+        self._cache = [None] * self.cache_num
+        print("Load and cache transformed data...")
+        if num_workers > 0 and worker_type == "process":
+            self._load_cache_process(self.data, num_workers)
+        elif num_workers > 0:
+            self._item_processed = 0
+            self._thread_lock = threading.Lock()
+            with ThreadPool(num_workers) as p:
+                p.map(
+                    self._load_cache_item_thread,
+                    [(i, self.data[i]) for i in range(self.cache_num)],
+                )
+        else:
+            for i in range(self.cache_num):
+                self._cache[i] = self._load_cache_item(self.data[i])
+                process_bar(i + 1, self.cache_num)
+
+    def _load_cache_item(self, item):
+        """
+        Execute the deterministic transforms on `item`, the pending affines of a lazy `Compose`
+        are evaluated before caching.
+        """
+        transform = self.transform
+        with profiling_segment(transform.profiler, "cached"):  # pytype: disable=attribute-error
+            stop = _first_random_index(transform.transforms)  # pytype: disable=attribute-error
+            return transform.apply_range(item, 0, stop)  # pytype: disable=attribute-error
+
+    def _load_cache_process(self, data, num_workers: int):
+        try:
+            from multiprocessing import resource_tracker
+
+            # the workers must share the resource tracker of the main process to hand over the shared memory
+            resource_tracker.ensure_running()
+        except ImportError:  # python < 3.8
+            raise RuntimeError("process workers require multiprocessing.shared_memory (python >= 3.8).")
+        with Pool(num_workers, initializer=_init_cache_process, initargs=(self.transform,)) as p:
+            packed_items = p.imap(_load_cache_item_process, (data[i] for i in range(self.cache_num)))
+            for i, (name, skeleton) in enumerate(packed_items):
+                self._cache[i] = unpack_item(name, skeleton)
+                process_bar(i + 1, self.cache_num)
 
     def _load_cache_item_thread(self, args):
-        i, item, transforms = args
-        self._cache[i] = self._load_cache_item(item, transforms)
+        i, item = args
+        self._cache[i] = self._load_cache_item(item)
         with self._thread_lock:
             self._item_processed += 1
             process_bar(self._item_processed, self.cache_num)
 
     def __getitem__(self, index):
+        profiler = self.transform.profiler  # pytype: disable=attribute-error
         if index < self.cache_num:
             # load data from cache and execute from the first random transform
-            start_run = False
             data = self._cache[index]
-            for _transform in self.transform.transforms:  # pytype: disable=attribute-error
-                if not start_run and not isinstance(_transform, Randomizable) and isinstance(_transform, Transform):
-                    continue
-                else:
-                    start_run = True
-                data = apply_transform(_transform, data)
+            with profiling_segment(profiler, "uncached"):
+                start = _first_random_index(self.transform.transforms)  # pytype: disable=attribute-error
+                data = self.transform.apply_range(data, start)  # pytype: disable=attribute-error
+            if profiler is not None:
+                profiler.flush()
         else:
             # no cache for this data, execute all the transforms directly
-            data = super(CacheDataset, self).__getitem__(index)
+            with profiling_segment(profiler, "uncached"):
+                data = super(CacheDataset, self).__getitem__(index)
         return data
 
 
+class SmartCacheDataset(CacheDataset):
+    """
+    Re-implementation of the SmartCache mechanism of NVIDIA Clara-train SDK.
+    At any time, the cache holds a fixed-size window of `cache_num` items of the whole dataset, and the length
+    of the dataset is `cache_num`, so that every epoch trains entirely from the cached items.
+    Between epochs, :py:meth:`update_cache` replaces the `replace_num` oldest items in the window with the
+    next items of `data` (in a circular order), these replacement items are pre-computed by a background thread
+    during the training epoch. So the whole dataset is covered in `ceil(len(data) / replace_num)` updates
+    while the deterministic transforms are never on the training path.
+
+    For example, a typical training loop::
+
+        dataset = SmartCacheDataset(data, transform, replace_rate=0.2, cache_num=100)
+        dataset.start()
+        for epoch in range(epochs):
+            for batch in DataLoader(dataset, batch_size=2, shuffle=True, num_workers=4):
+                ...
+            dataset.update_cache()
+        dataset.shutdown()
+
+    Note:
+        The cache is swapped in the main process, so the DataLoader must re-create its worker processes for
+        every epoch (the default behavior), otherwise the workers keep reading the previous window.
+
+    """
+
+    def __init__(
+        self,
+        data,
+        transform: Callable,
+        replace_rate: float = 0.1,
+        cache_num: int = sys.maxsize,
+        cache_rate: float = 1.0,
+        num_init_workers: int = 0,
+        num_replace_workers: int = 0,
+    ):
+        """
+        Args:
+            data (Iterable): input data to load and transform to generate dataset for model.
+            transform: transforms to execute operations on input data.
+            replace_rate: percentage of the cached items to replace in every update, default is 0.1.
+                at least 1 item is replaced per update, and at most `len(data) - cache_num` items.
+            cache_num: number of items in the cache window. Default is `sys.maxsize`.
+                will take the minimum of (cache_num, data_length x cache_rate, data_length).
+            cache_rate: percentage of data in the cache window, default is 1.0 (cache all).
+                will take the minimum of (cache_num, data_length x cache_rate, data_length).
+            num_init_workers: the number of worker threads to initialize the cache.
+                If 0 a single thread will be used. Default is 0.
+            num_replace_workers: the number of worker threads to compute the replacement items in the background.
+                If 0 a single background thread will be used. Default is 0.
+
+        Raises:
+            ValueError: cache_num must be greater than 0.
+
+        """
+        if not isinstance(transform, Compose):
+            transform = Compose(transform)
+        Dataset.__init__(self, data, transform)
+        data_len = len(self.data)
+        self.cache_num = min(cache_num, int(data_len * cache_rate), data_len)
+        if self.cache_num <= 0:
+            raise ValueError(f"cache_num must be greater than 0, got {self.cache_num}.")
+        self.replace_num = min(max(int(self.cache_num * replace_rate), 1), data_len - self.cache_num)
+        self.num_replace_workers = num_replace_workers
+
+        self._cache_idx = list(range(self.cache_num))
+        self._next_idx = self.cache_num % data_len
+        self._replace_idx: list = list()
+        self._replacements: Optional[list] = None
+        self._replace_error: Optional[BaseException] = None
+        self._replace_thread: Optional[threading.Thread] = None
+
+        self._fill_cache(num_init_workers)
+
+    def __len__(self):
+        return self.cache_num
+
+    def _compute_replacements(self):
+        try:
+            if self.num_replace_workers > 0:
+                with ThreadPool(self.num_replace_workers) as p:
+                    self._replacements = p.map(lambda i: self._load_cache_item(self.data[i]), self._replace_idx)
+            else:
+                self._replacements = [self._load_cache_item(self.data[i]) for i in self._replace_idx]
+        except BaseException as e:
+            self._replace_error = e
+
+    def start(self):
+        """
+        Start computing the next `replace_num` items of `data` in a background thread.
+        Does nothing if the computation is already running or its results are not consumed yet.
+        """
+        if self.replace_num <= 0 or self._replace_thread is not None:
+            return
+        data_len = len(self.data)
+        self._replace_idx = [(self._next_idx + i) % data_len for i in range(self.replace_num)]
+        self._next_idx = (self._next_idx + self.replace_num) % data_len
+        self._replacements = None
+        self._replace_error = None
+        self._replace_thread = threading.Thread(target=self._compute_replacements, daemon=True)
+        self._replace_thread.start()
+
+    def update_cache(self):
+        """
+        Replace the `replace_num` oldest items of the cache with the items computed in the background,
+        waits for the background computation if it's not finished, then starts computing the next replacements.
+
+        Raises:
+            RuntimeError: failed to compute the replacement items, the original error is chained.
+
+        """
+        if self.replace_num <= 0:
+            return
+        self.start()
+        self._replace_thread.join()
+        self._replace_thread = None
+        if self._replace_error is not None:
+            raise RuntimeError("failed to compute the replacement items of the cache.") from self._replace_error
+        self._cache = self._cache[self.replace_num :] + self._replacements
+        self._cache_idx = self._cache_idx[self.replace_num :] + self._replace_idx
+        self._replacements = None
+        self.start()
+
+    def shutdown(self):
+        """
+        Wait for the background computation to finish and discard its results.
+        """
+        if self._replace_thread is not None:
+            self._replace_thread.join()
+            self._replace_thread = None
+        self._replacements = None
+        self._replace_error = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the background computation and the lock stay in the main process
+        for key in ("_replace_thread", "_replacements", "_replace_error", "_thread_lock"):
+            state[key] = None
+        return state
+
+
+class DistributedCacheDataset(CacheDataset):
+    """
+    CacheDataset for distributed data parallel training, every rank only caches its own partition of `data`
+    instead of the whole dataset, the partitions are computed deterministically by
+    :py:func:`monai.data.partition_dataset` with the same `seed` on all the ranks, and have the same length.
+
+    The length of the dataset is the length of the partition, so that a regular (non-distributed) sampler is used
+    on every rank, for example ``DataLoader(dataset, shuffle=True)`` reshuffles the items within the partition
+    in every epoch. To reshuffle the items across the partitions, :py:meth:`exchange` sends a random subset of
+    the cached items of every rank to the next rank and receives the items of the previous rank (a ring), so that
+    the items move between the ranks over the epochs without computing the cache again. It requires
+    `torch.distributed` to be initialized (any backend supporting `send` and `recv`, including "gloo" on CPU)::
+
+        dataset = DistributedCacheDataset(data, transform, shuffle=True, exchange_rate=0.2)
+        for epoch in range(epochs):
+            dataset.exchange(epoch)
+            for batch in DataLoader(dataset, batch_size=2, shuffle=True):
+                ...
+
+    """
+
+    def __init__(
+        self,
+        data,
+        transform: Callable,
+        num_replicas: Optional[int] = None,
+        rank: Optional[int] = None,
+        shuffle: bool = True,
+        seed: int = 0,
+        exchange_rate: float = 0.0,
+        cache_num: int = sys.maxsize,
+        cache_rate: float = 1.0,
+        num_workers: int = 0,
+    ):
+        """
+        Args:
+            data (Iterable): input data to load and transform to generate dataset for model.
+            transform: transforms to execute operations on input data.
+            num_replicas: the number of ranks, default is the world size of `torch.distributed`.
+            rank: the rank of the current process, default is the rank of `torch.distributed`.
+            shuffle: whether to shuffle the indices before partitioning. Default is True.
+            seed: the random seed to partition the data and to select the exchanged items,
+                it must be the same on all the ranks. Default is 0.
+            exchange_rate: percentage of the cached items to send to the next rank in :py:meth:`exchange`.
+            cache_num: number of items to be cached in the partition. Default is `sys.maxsize`.
+            cache_rate: percentage of cached data of the partition, default is 1.0 (cache all).
+            num_workers: the number of worker threads to use.
+                If 0 a single thread will be used. Default is 0.
+
+        Raises:
+            ValueError: rank must be in the range of [0, num_replicas).
+
+        """
+        if num_replicas is None:
+            num_replicas = torch.distributed.get_world_size()
+        if rank is None:
+            rank = torch.distributed.get_rank()
+        if not 0 <= rank < num_replicas:
+            raise ValueError(f"rank must be in the range of [0, {num_replicas}), got {rank}.")
+        self.num_replicas = num_replicas
+        self.rank = rank
+        self.seed = seed
+        self.exchange_rate = exchange_rate
+        self.indices = partition_dataset(len(data), num_replicas, shuffle=shuffle, seed=seed)[rank]
+        super().__init__(
+            [data[i] for i in self.indices],
+            transform,
+            cache_num=cache_num,
+            cache_rate=cache_rate,
+            num_workers=num_workers,
+        )
+
+    def exchange(self, epoch: int):
+        """
+        Send `exchange_rate` of the cached items to the next rank and replace them with the items received
+        from the previous rank. All the ranks must call this method with the same `epoch`.
+        """
+        exchange_num = min(int(self.cache_num * self.exchange_rate), self.cache_num)
+        if self.num_replicas <= 1 or exchange_num <= 0:
+            return
+        # the same positions on all the ranks, every rank has the same cache_num
+        positions = np.random.RandomState(self.seed + epoch).choice(self.cache_num, exchange_num, replace=False)
+        outgoing = [(self.indices[i], self.data[i], self._cache[i]) for i in positions]
+        incoming = _ring_exchange(outgoing, (self.rank + 1) % self.num_replicas, (self.rank - 1) % self.num_replicas)
+        if isinstance(self._cache, SharedCache):
+            self._cache = [self._cache[i] for i in range(len(self._cache))]
+        for i, (index, item, cached) in zip(positions, incoming):
+            self.indices[i], self.data[i], self._cache[i] = index, item, cached
+
+
+def _ring_exchange(obj, dst: int, src: int):
+    """
+    Send the picklable `obj` to rank `dst` and receive an object from rank `src` with `torch.distributed`.
+    """
+    payload = torch.from_numpy(np.frombuffer(pickle.dumps(obj), dtype=np.uint8).copy())
+    size = torch.tensor([payload.numel()], dtype=torch.int64)
+    recv_size = torch.zeros(1, dtype=torch.int64)
+    request = torch.distributed.isend(size, dst)
+    torch.distributed.recv(recv_size, src)
+    request.wait()
+    recv_payload = torch.empty(int(recv_size.item()), dtype=torch.uint8)
+    request = torch.distributed.isend(payload, dst)
+    torch.distributed.recv(recv_payload, src)
+    request.wait()
+    return pickle.loads(recv_payload.numpy().tobytes())
+
+
 class ZipDataset(Dataset):
     """
     Zip several PyTorch datasets and output data(with the same index) together in a tuple.
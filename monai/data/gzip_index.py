@@ -0,0 +1,131 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import math
+import os
+from multiprocessing.pool import ThreadPool
+from pathlib import Path
+from typing import Optional
+
+try:
+    import indexed_gzip
+except ImportError:
+    indexed_gzip = None
+
+__all__ = ["get_gzip_index_path", "open_indexed_gzip", "read_indexed_gzip"]
+
+DEFAULT_SPACING = 4 * 2 ** 20
+
+
+def _check_indexed_gzip():
+    if indexed_gzip is None:
+        raise RuntimeError(
+            "the gzip seek-point indexes require the `indexed_gzip` package, install it by `pip install monai[gzip]`."
+        )
+
+
+def get_gzip_index_path(filename, index_dir=None) -> Path:
+    """
+    Get the path of the seek-point index of a gzip file.
+
+    Args:
+        filename (str or Path): the gzip file.
+        index_dir (str or Path or None): the folder of the index files, if None the index file
+            is beside the gzip file, named ``{filename}.gzidx``. Otherwise the index file is named
+            by the md5 of the absolute path of the gzip file.
+    """
+    filename = Path(filename)
+    if index_dir is None:
+        return filename.with_name(f"{filename.name}.gzidx")
+    name_md5 = hashlib.md5(str(filename.resolve()).encode("utf-8")).hexdigest()
+    return Path(index_dir) / f"{name_md5}.gzidx"
+
+
+def open_indexed_gzip(filename, index_dir=None, spacing: int = DEFAULT_SPACING):
+    """
+    Open a gzip file for random access reading, with a seek-point index (the inflate state every `spacing` bytes
+    of the uncompressed data), so that a `seek` followed by a `read` only decompresses the chunks covering the
+    requested range. The index is loaded from the index file if it's newer than the gzip file, otherwise it's
+    built by decompressing the whole file once and saved to the index file for the later uses.
+
+    Args:
+        filename (str or Path): the gzip file.
+        index_dir (str or Path or None): the folder of the index files, see :py:func:`get_gzip_index_path`.
+        spacing: the number of uncompressed bytes between the seek points, default is 4 MB.
+
+    Returns:
+        a file object of the uncompressed data, `indexed_gzip.IndexedGzipFile`.
+
+    Raises:
+        RuntimeError: the gzip seek-point indexes require the `indexed_gzip` package.
+
+    """
+    _check_indexed_gzip()
+    index_path = get_gzip_index_path(filename, index_dir)
+    gzip_file = indexed_gzip.IndexedGzipFile(str(filename), spacing=spacing)
+    if index_path.is_file() and index_path.stat().st_mtime >= os.stat(filename).st_mtime:
+        gzip_file.import_index(str(index_path))
+        return gzip_file
+    gzip_file.build_full_index()
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    # NOTE: Writing to a temporary file and then using a nearly atomic rename operation
+    #       so that the other processes never import a partially written index
+    temp_path = index_path.with_suffix(f".temp_write_cache{os.getpid()}")
+    gzip_file.export_index(str(temp_path))
+    os.replace(temp_path, index_path)
+    return gzip_file
+
+
+def _read_range(gzip_file, view: memoryview, start: int):
+    gzip_file.seek(start)
+    offset = 0
+    while offset < len(view):
+        size = gzip_file.readinto(view[offset:])
+        if not size:
+            raise EOFError(f"unexpected end of the gzip data at {start + offset}.")
+        offset += size
+
+
+def read_indexed_gzip(
+    filename, index_dir=None, num_workers: int = 1, spacing: int = DEFAULT_SPACING, size: Optional[int] = None
+) -> bytearray:
+    """
+    Read the uncompressed data of a gzip file with the seek-point index, see :py:func:`open_indexed_gzip`.
+    With `num_workers > 1`, the data is split into `num_workers` ranges decompressed by independent
+    file objects in a thread pool, the decompression of `indexed_gzip` releases the GIL.
+
+    Args:
+        filename (str or Path): the gzip file.
+        index_dir (str or Path or None): the folder of the index files, see :py:func:`get_gzip_index_path`.
+        num_workers: the number of threads to decompress the data.
+        spacing: the number of uncompressed bytes between the seek points, default is 4 MB.
+        size: the number of bytes to read from the start of the uncompressed data, if None read all the data.
+
+    """
+    with open_indexed_gzip(filename, index_dir, spacing) as gzip_file:
+        total = gzip_file.seek(0, os.SEEK_END)
+        size = total if size is None else min(size, total)
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        chunk = int(math.ceil(size / max(num_workers, 1)))
+        if num_workers <= 1 or chunk < spacing:
+            _read_range(gzip_file, view, 0)
+            return buffer
+
+    def _read(start: int):
+        # every thread uses its own file object to seek independently, the index file exists at this point
+        with open_indexed_gzip(filename, index_dir, spacing) as f:
+            _read_range(f, view[start : start + chunk], start)
+
+    with ThreadPool(num_workers) as p:
+        p.map(_read, range(0, size, chunk))
+    return buffer
@@ -0,0 +1,126 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+
+import numpy as np
+
+__all__ = ["LazyArray"]
+
+
+def _to_python_int(k):
+    if isinstance(k, slice):
+        return slice(*(None if i is None else int(i) for i in (k.start, k.stop, k.step)))
+    return int(k)
+
+
+class _SharedFile:
+    """
+    The file object shared by a proxy and the proxies derived from it, closed with the last of them.
+    """
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+
+    def close(self):
+        if not self.fileobj.closed:
+            self.fileobj.close()
+
+    def __del__(self):
+        self.close()
+
+
+class LazyArray:
+    """
+    A read-only proxy of the image data that is not loaded yet, for example the `dataobj` of a nibabel image.
+    Indexing the proxy with integers and slices (such as the crop transforms ``img[slices]``) only reads the
+    selected region of the file and returns a numpy array, so that a crop following the loading transform
+    doesn't load the whole volume. Adding the leading axes (``img[None]``, for example by ``AddChannel``)
+    returns a new proxy without loading the data.
+
+    All the other numpy operations load the whole data by `np.asarray(proxy)`, the other attributes and methods
+    of numpy arrays (such as ``proxy.astype(...)`` or ``proxy.mean()``) are those of the loaded data.
+
+    Args:
+        dataobj: the array-like data, it must support the `shape` attribute and the basic slicing.
+        dtype (np.dtype): the data type of the loaded arrays.
+        num_new_axes: the number of 1-length leading axes added to the shape of `dataobj`.
+        fileobj: the file object read by `dataobj`, if not None it is closed by :py:meth:`close` or when
+            the proxy and the proxies derived from it (for example ``proxy[None]``) are garbage collected.
+
+    """
+
+    def __init__(self, dataobj, dtype=np.float64, num_new_axes: int = 0, fileobj=None):
+        self.dataobj = dataobj
+        self.dtype = np.dtype(dtype)
+        self.num_new_axes = num_new_axes
+        self._file = fileobj if fileobj is None or isinstance(fileobj, _SharedFile) else _SharedFile(fileobj)
+
+    def close(self):
+        """
+        Close the file object of the proxy, the proxy can't read the data afterwards.
+        """
+        if self._file is not None:
+            self._file.close()
+
+    def __getattr__(self, name):
+        # only called for the attributes not defined by the proxy
+        if name.startswith("_") or "dataobj" not in self.__dict__:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return getattr(np.asarray(self), name)
+
+    @property
+    def shape(self):
+        return (1,) * self.num_new_axes + tuple(self.dataobj.shape)
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self, dtype: Optional[np.dtype] = None):
+        array = np.asarray(self.dataobj).astype(self.dtype, copy=False)
+        array = array.reshape(self.shape)
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+    def __getitem__(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        if not all(k is None or k is Ellipsis or isinstance(k, (slice, int, np.integer)) for k in key):
+            # advanced indexing
+            return np.asarray(self)[key]
+        num_none = 0
+        while num_none < len(key) and key[num_none] is None:
+            num_none += 1
+        if num_none > 0 and all(k is Ellipsis for k in key[num_none:]) and len(key) - num_none <= 1:
+            return LazyArray(self.dataobj, self.dtype, self.num_new_axes + num_none, self._file)
+        if any(k is None for k in key):
+            return np.asarray(self)[key]
+
+        if Ellipsis in key:
+            i = key.index(Ellipsis)
+            key = key[:i] + (slice(None),) * (self.ndim - len(key) + 1) + key[i + 1 :]
+        key = key + (slice(None),) * (self.ndim - len(key))
+        # the file readers may not support the numpy integers, such as the `np.uint16` ROI of `SpatialCrop`
+        key = tuple(_to_python_int(k) for k in key)
+        array = np.asarray(self.dataobj[key[self.num_new_axes :]]).astype(self.dtype, copy=False)
+        if self.num_new_axes == 0:
+            return array
+        array = array.reshape((1,) * self.num_new_axes + array.shape)
+        return array[key[: self.num_new_axes] + (slice(None),) * (array.ndim - self.num_new_axes)]
+
+    def __repr__(self):
+        return f"LazyArray(shape={self.shape}, dtype={self.dtype})"
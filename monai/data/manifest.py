@@ -0,0 +1,242 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+from multiprocessing import Pool
+from typing import Optional, Sequence
+
+import nibabel as nib
+import numpy as np
+from PIL import Image
+
+from monai.utils import ensure_tuple, process_bar
+
+__all__ = ["scan_datalist", "load_manifest"]
+
+_MANIFEST_VERSION = 1
+
+
+def _iter_slabs(dataobj, axis: int, slab_voxels: int):
+    """
+    Read the array-like `dataobj` in slabs along `axis`, the last spatial dimension,
+    each slab has about `slab_voxels` voxels. Yields the start index and the slab.
+    """
+    shape = dataobj.shape
+    step = max(1, slab_voxels // max(1, int(np.prod(shape)) // shape[axis]))
+    for start in range(0, shape[axis], step):
+        slicer = (slice(None),) * axis + (slice(start, start + step),)
+        yield start, np.asarray(dataobj[slicer])
+
+
+def _scan_array(dataobj, spatial_rank: int, record: dict, intensity: bool, foreground: bool, options: dict):
+    """
+    Compute the intensity statistics and the foreground bounding box of `dataobj` slab by slab,
+    the memory usage is bounded by `slab_voxels` and `max_samples`.
+    """
+    total = int(np.prod(dataobj.shape))
+    stride = max(1, total // options["max_samples"])
+    count, value_sum, value_sq_sum = 0, 0.0, 0.0
+    v_min, v_max = np.inf, -np.inf
+    samples = list()
+    box_start = np.full(spatial_rank, np.iinfo(np.int64).max)
+    box_end = np.full(spatial_rank, -1)
+    axis = spatial_rank - 1
+    for start, slab in _iter_slabs(dataobj, axis, options["slab_voxels"]):
+        if intensity:
+            values = slab.astype(np.float64).ravel()
+            count += values.size
+            value_sum += float(values.sum())
+            value_sq_sum += float(np.square(values).sum())
+            v_min, v_max = min(v_min, float(values.min())), max(v_max, float(values.max()))
+            samples.append(values[::stride])
+        if foreground:
+            mask = slab > 0
+            if mask.ndim > spatial_rank:
+                mask = mask.reshape(mask.shape[:spatial_rank] + (-1,)).any(-1)
+            nonzero = np.nonzero(mask)
+            if nonzero[0].size > 0:
+                offset = np.zeros(spatial_rank, dtype=np.int64)
+                offset[axis] = start
+                box_start = np.minimum(box_start, [int(i.min()) for i in nonzero] + offset)
+                box_end = np.maximum(box_end, [int(i.max()) + 1 for i in nonzero] + offset)
+    if intensity:
+        mean = value_sum / max(count, 1)
+        samples = np.concatenate(samples) if samples else np.zeros(0)
+        percentiles = options["percentiles"]
+        record["intensity"] = {
+            "min": v_min,
+            "max": v_max,
+            "mean": mean,
+            "std": float(np.sqrt(max(value_sq_sum / max(count, 1) - mean ** 2, 0.0))),
+            "percentiles": dict(zip(map(str, percentiles), np.percentile(samples, percentiles).tolist())),
+        }
+    if foreground:
+        found = box_end[0] >= 0
+        record["foreground_box"] = [box_start.tolist(), box_end.tolist()] if found else None
+
+
+def _scan_file(args):
+    """
+    Scan a file of the datalist in a worker process, only the header is read if no statistics are required.
+    """
+    filename, intensity, foreground, options = args
+    stat = os.stat(filename)
+    record = {"filename": filename, "mtime": stat.st_mtime_ns, "size": stat.st_size}
+    try:
+        img = nib.load(filename)
+        header = img.header
+        dataobj = img.dataobj
+        record["shape"] = [int(i) for i in img.shape]
+        record["spacing"] = [float(i) for i in header.get_zooms()]
+        record["affine"] = img.affine.tolist()
+        record["dtype"] = str(header.get_data_dtype())
+    except nib.filebasedimages.ImageFileError:
+        # non Nifti format, PIL only reads the header when opening an image
+        with Image.open(filename) as img:
+            record["shape"] = [int(i) for i in img.size]
+            record["spacing"] = [1.0] * len(img.size)
+            record["affine"] = np.eye(len(img.size) + 1).tolist()
+            record["dtype"] = img.mode
+            # the spatial dimensions of PIL are (width, height)
+            dataobj = np.swapaxes(np.asarray(img), 0, 1) if intensity or foreground else None
+    spatial_rank = min(len(record["shape"]), 3)
+    record["spatial_shape"] = record["shape"][:spatial_rank]
+    if intensity or foreground:
+        _scan_array(dataobj, spatial_rank, record, intensity, foreground, options)
+    return record
+
+
+def _is_valid(record: Optional[dict], intensity: bool, foreground: bool, options: dict) -> bool:
+    """
+    Check whether a record of the previous manifest can be reused for the file.
+    """
+    if record is None:
+        return False
+    try:
+        stat = os.stat(record["filename"])
+    except OSError:
+        return False
+    if stat.st_mtime_ns != record["mtime"] or stat.st_size != record["size"]:
+        return False
+    if intensity and (
+        "intensity" not in record or set(record["intensity"]["percentiles"]) != set(map(str, options["percentiles"]))
+    ):
+        return False
+    return not foreground or "foreground_box" in record
+
+
+def load_manifest(manifest_file: str):
+    """
+    Load the items of a manifest file saved by :py:func:`scan_datalist`.
+    """
+    with open(manifest_file) as f:
+        return json.load(f)["items"]
+
+
+def scan_datalist(
+    datalist: Sequence[dict],
+    keys: Sequence[str] = ("image", "label"),
+    manifest_file: Optional[str] = None,
+    num_workers: int = 0,
+    intensity_keys: Sequence[str] = (),
+    foreground_keys: Sequence[str] = (),
+    percentiles: Sequence[float] = (0.5, 50.0, 99.5),
+    slab_voxels: int = 2 ** 24,
+    max_samples: int = 2 ** 20,
+):
+    """
+    Scan the files of a datalist (for example, the result of :py:func:`monai.data.load_decathalon_datalist`),
+    and summarize every file in a record of:
+
+        - ``filename``, ``mtime`` and ``size``: to detect the changes of the file.
+        - ``shape``, ``spatial_shape``, ``spacing``, ``affine`` and ``dtype``: read from the image header only.
+        - ``intensity`` (only for `intensity_keys`): ``min``, ``max``, ``mean``, ``std`` and ``percentiles``
+          of the voxel values, the percentiles are computed from a regular subsample of at most `max_samples`
+          voxels.
+        - ``foreground_box`` (only for `foreground_keys`): ``[start, end]`` of the bounding box of the voxels
+          greater than 0 (for example, the labels), None if there is no foreground.
+
+    The voxel values are read in slabs of about `slab_voxels` voxels, so that the memory usage is bounded.
+    The files are scanned by a process pool of `num_workers` processes.
+
+    If `manifest_file` is provided, the records are saved into the json file, and the records of an existing
+    manifest file are reused for the files not changed since the last scan.
+
+    For example, to sample the batches by the shapes of the images::
+
+        manifest = scan_datalist(datalist, keys=["image"], manifest_file="manifest.json", num_workers=8)
+        sampler = ShapeBucketBatchSampler([i["image"]["spatial_shape"] for i in manifest], batch_size=4)
+
+    Args:
+        datalist: the data items, dictionaries of the file paths, the value of a key can be a list of files
+            and the records of the key are a list too.
+        keys: the keys of the file paths to scan, the missing keys in a data item are skipped.
+        manifest_file: the json file to save the records and to reuse the previous records.
+        num_workers: the number of worker processes, if 0 scan the files in the current process.
+        intensity_keys: the keys to compute the intensity statistics.
+        foreground_keys: the keys to compute the foreground bounding boxes.
+        percentiles: the intensity percentiles to compute, in the range of [0, 100].
+        slab_voxels: the number of voxels to read at once when computing the statistics.
+        max_samples: the maximum number of voxels of a file to compute the percentiles.
+
+    Returns:
+        a list of the scanned items, each item is a dictionary of the records of `keys`.
+
+    """
+    options = {"percentiles": list(percentiles), "slab_voxels": slab_voxels, "max_samples": max_samples}
+    previous = dict()
+    if manifest_file is not None and os.path.isfile(manifest_file):
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+        if manifest.get("version") == _MANIFEST_VERSION:
+            previous = {r["filename"]: r for item in manifest["items"] for v in item.values() for r in ensure_tuple(v)}
+
+    tasks = list()
+    records = dict()
+    for item in datalist:
+        for key in keys:
+            if key not in item:
+                continue
+            intensity, foreground = key in intensity_keys, key in foreground_keys
+            for filename in ensure_tuple(item[key]):
+                if filename in records:
+                    continue
+                if _is_valid(previous.get(filename), intensity, foreground, options):
+                    records[filename] = previous[filename]
+                else:
+                    records[filename] = None
+                    tasks.append((filename, intensity, foreground, options))
+
+    if tasks:
+        print(f"Scan {len(tasks)} files...")
+        if num_workers > 0:
+            with Pool(num_workers) as p:
+                for i, record in enumerate(p.imap(_scan_file, tasks)):
+                    records[record["filename"]] = record
+                    process_bar(i + 1, len(tasks))
+        else:
+            for i, task in enumerate(tasks):
+                records[task[0]] = _scan_file(task)
+                process_bar(i + 1, len(tasks))
+
+    def _records(files):
+        return [records[i] for i in files] if isinstance(files, (list, tuple)) else records[files]
+
+    items = [{key: _records(item[key]) for key in keys if key in item} for item in datalist]
+    if manifest_file is not None:
+        # NOTE: Writing to a temporary file and then using a nearly atomic rename operation
+        #       to make the manifest more robust to manual killing of the process
+        temp_file = f"{manifest_file}.temp_write_cache{os.getpid()}"
+        with open(temp_file, "w") as f:
+            json.dump({"version": _MANIFEST_VERSION, "items": items}, f)
+        os.replace(temp_file, manifest_file)
+    return items
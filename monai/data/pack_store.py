@@ -0,0 +1,180 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+__all__ = ["PackedCacheStore"]
+
+# index record: 16 bytes md5 digest of the key, offset and length of the payload in the pack file
+_RECORD = struct.Struct("<16sQQ")
+
+
+class PackedCacheStore:
+    """
+    Append-only key-value store of binary payloads in two files of a folder:
+
+        - ``cache.pack``: the concatenated payloads.
+        - ``cache.index``: fixed size records of (key digest, offset, length) of the payloads.
+
+    A payload is always appended and synced (`os.fsync`) to the pack file before its index record, and an index
+    record is written by a single `write` call, so the index only refers to the complete payloads, even after
+    a system crash, a partially written record (for example, the process is killed) is ignored. The appends are
+    serialized by an exclusive `fcntl.lockf` lock on the index file and the index is read with a shared lock,
+    so that multiple processes (DataLoader workers, different runs) can share the store, the threads of
+    a process are serialized by a `threading.Lock`.
+
+    Loading the store reads the whole index file once, a lookup is a dictionary query followed by
+    one positioned read of the pack file. The index appended by the other processes is loaded
+    incrementally when a key is not found.
+
+    Args:
+        path: the folder of the store, created if not existing.
+
+    Raises:
+        RuntimeError: PackedCacheStore requires fcntl (POSIX systems).
+
+    """
+
+    def __init__(self, path):
+        if fcntl is None:
+            raise RuntimeError("PackedCacheStore requires fcntl (POSIX systems).")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.pack_file = self.path / "cache.pack"
+        self.index_file = self.path / "cache.index"
+        self._index: Dict[bytes, Tuple[int, int]] = dict()
+        self._index_size = 0
+        self._pid: Optional[int] = None
+        self._pack_fd: Optional[int] = None
+        self._index_fd: Optional[int] = None
+        # the `fcntl` locks are held by the process, the lock serializes the threads of the process
+        self._lock = threading.Lock()
+
+    def _open(self):
+        # the file descriptors are not shared with the forked processes
+        if self._pid == os.getpid():
+            return
+        if self._pid is not None:
+            # a forked process may inherit the lock held by another thread of the parent process
+            self._lock = threading.Lock()
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pack_fd = os.open(self.pack_file, os.O_RDWR | os.O_CREAT, 0o644)
+            self._index_fd = os.open(self.index_file, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+
+    def _read_index(self):
+        """
+        Read the index records appended after the last loaded one, with a shared lock of the index file.
+        """
+        with self._lock:
+            fcntl.lockf(self._index_fd, fcntl.LOCK_SH)
+            try:
+                self._load_index()
+            finally:
+                fcntl.lockf(self._index_fd, fcntl.LOCK_UN)
+
+    def _load_index(self):
+        """
+        Read the index records appended after the last loaded one, the caller holds the locks of the index.
+        """
+        size = os.fstat(self._index_fd).st_size
+        size -= (size - self._index_size) % _RECORD.size  # ignore a partially written record
+        if size <= self._index_size:
+            return
+        buffer = os.pread(self._index_fd, size - self._index_size, self._index_size)
+        for digest, offset, length in _RECORD.iter_unpack(buffer):
+            self._index[digest] = (offset, length)
+        self._index_size = size
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read the payload of `key`, a hex digest string, returns None if the key is not in the store.
+        """
+        self._open()
+        digest = bytes.fromhex(key)
+        if digest not in self._index:
+            self._read_index()
+        if digest not in self._index:
+            return None
+        offset, length = self._index[digest]
+        return os.pread(self._pack_fd, length, offset)
+
+    def put(self, key: str, payload: bytes):
+        """
+        Append the payload of `key`, a hex digest string. Does nothing if the key is already in the store.
+        """
+        self._open()
+        digest = bytes.fromhex(key)
+        with self._lock:
+            fcntl.lockf(self._index_fd, fcntl.LOCK_EX)
+            try:
+                self._load_index()
+                if digest in self._index:
+                    return
+                offset = os.lseek(self._pack_fd, 0, os.SEEK_END)
+                written = 0
+                while written < len(payload):
+                    written += os.pwrite(self._pack_fd, payload[written:], offset + written)
+                # the payload must be on the disk before the index record referring to it
+                os.fsync(self._pack_fd)
+                # drop a partially written record before committing a new one
+                os.ftruncate(self._index_fd, self._index_size)
+                os.pwrite(self._index_fd, _RECORD.pack(digest, offset, len(payload)), self._index_size)
+                self._index[digest] = (offset, len(payload))
+                self._index_size += _RECORD.size
+            finally:
+                fcntl.lockf(self._index_fd, fcntl.LOCK_UN)
+
+    def __contains__(self, key: str) -> bool:
+        self._open()
+        digest = bytes.fromhex(key)
+        if digest not in self._index:
+            self._read_index()
+        return digest in self._index
+
+    def __len__(self):
+        self._open()
+        self._read_index()
+        return len(self._index)
+
+    def close(self):
+        """
+        Close the files of the store opened by the current process.
+        """
+        if self._pid == os.getpid():
+            os.close(self._pack_fd)
+            os.close(self._index_fd)
+        self._pid = self._pack_fd = self._index_fd = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_pid"] = state["_pack_fd"] = state["_index_fd"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __del__(self):
+        if getattr(self, "_pid", None) is not None:
+            self.close()
@@ -0,0 +1,175 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+from collections import deque
+from multiprocessing.pool import ThreadPool
+from typing import Callable, Optional
+
+import numpy as np
+import torch
+from torch.utils.data import IterableDataset
+
+from monai.transforms import Randomizable
+from monai.transforms.utils import apply_transform
+
+__all__ = ["PatchQueueDataset"]
+
+
+class _DeferredResult:
+    """
+    A volume loaded in the current thread when requested, with the same `get` interface of `AsyncResult`.
+    """
+
+    def __init__(self, func: Callable, index: int):
+        self.func = func
+        self.index = index
+
+    def get(self):
+        return self.func(self.index)
+
+
+class PatchQueueDataset(IterableDataset, Randomizable):
+    """
+    Yields random patches from a queue of preprocessed volumes, so that the cost of loading and preprocessing
+    a volume is shared by `samples_per_volume` patches.
+
+    The dataset keeps `num_volumes` volumes of the input dataset resident in memory and repeatedly applies
+    the random patch `transform` (for example, ``RandSpatialCropd`` or ``RandCropByPosNegLabeld``) to a randomly
+    selected resident volume. A volume is retired after producing `samples_per_volume` patches and replaced by
+    the next volume, which is loaded ahead by `num_workers` background threads. The patches are collected in a
+    shuffle buffer of `buffer_size` items and yielded in a random order, so that a batch mixes the patches of
+    different volumes.
+
+    For example::
+
+        volumes = CacheDataset(data, Compose([LoadNiftid(keys), AddChanneld(keys), Spacingd(keys, pixdim)]))
+        patches = PatchQueueDataset(
+            volumes,
+            transform=RandCropByPosNegLabeld(keys, label_key="label", size=(96, 96, 96), num_samples=4),
+            samples_per_volume=64,
+            num_volumes=8,
+        )
+        loader = DataLoader(patches, batch_size=4, num_workers=2)
+
+    When used by a DataLoader with multiple workers, the volumes are split between the workers.
+
+    """
+
+    def __init__(
+        self,
+        dataset,
+        transform: Callable,
+        samples_per_volume: int = 16,
+        num_volumes: int = 4,
+        buffer_size: int = 64,
+        num_workers: int = 1,
+        shuffle: bool = True,
+    ):
+        """
+        Args:
+            dataset (Dataset): the dataset of preprocessed volumes, typically a `Dataset` or `CacheDataset`
+                running the deterministic transforms.
+            transform: the random patch transform applied to a volume, it returns a patch or a list of patches.
+            samples_per_volume: the number of patches to draw from every volume.
+            num_volumes: the number of volumes resident in memory to draw the patches from.
+            buffer_size: the number of patches in the shuffle buffer, 1 to yield the patches immediately.
+            num_workers: the number of threads to load the next volumes in the background.
+                If 0 the volumes are loaded in the iterating thread. Default is 1.
+            shuffle: whether to shuffle the order of the volumes in every epoch. Default is True.
+
+        Raises:
+            ValueError: samples_per_volume, num_volumes and buffer_size must be positive.
+
+        """
+        if min(samples_per_volume, num_volumes, buffer_size) <= 0:
+            raise ValueError("samples_per_volume, num_volumes and buffer_size must be positive.")
+        self.dataset = dataset
+        self.transform = transform
+        self.samples_per_volume = samples_per_volume
+        self.num_volumes = num_volumes
+        self.buffer_size = buffer_size
+        self.num_workers = num_workers
+        self.shuffle = shuffle
+        self._index = 0
+
+    def __len__(self):
+        return len(self.dataset) * self.samples_per_volume
+
+    def set_random_state(self, seed: Optional[int] = None, state: Optional[np.random.RandomState] = None):
+        super().set_random_state(seed=seed, state=state)
+        if isinstance(self.transform, Randomizable):
+            self.transform.set_random_state(seed=self.R.randint(np.iinfo(np.int32).max))
+        return self
+
+    def randomize(self, data_len: int):
+        self._index = self.R.randint(data_len)
+
+    def _volume_indices(self):
+        worker_info = torch.utils.data.get_worker_info()
+        iter_start, iter_end = 0, len(self.dataset)
+        if worker_info is not None:
+            # split workload, and use different random states in the workers
+            per_worker = int(math.ceil((iter_end - iter_start) / float(worker_info.num_workers)))
+            iter_start = iter_start + worker_info.id * per_worker
+            iter_end = min(iter_start + per_worker, iter_end)
+            self.set_random_state(seed=worker_info.seed % (2 ** 32))
+        indices = np.arange(iter_start, iter_end)
+        return self.R.permutation(indices) if self.shuffle else indices
+
+    def _pop_patch(self, buffer: list):
+        self.randomize(len(buffer))
+        # swap with the last patch to pop in O(1)
+        buffer[self._index], buffer[-1] = buffer[-1], buffer[self._index]
+        return buffer.pop()
+
+    def __iter__(self):
+        indices = deque(self._volume_indices())
+        pool = ThreadPool(self.num_workers) if self.num_workers > 0 else None
+        num_queued = 2 * self.num_volumes if pool is not None else self.num_volumes
+
+        def _load(index):
+            return self.dataset[int(index)]
+
+        pending: deque = deque()
+        resident: list = list()  # [volume, number of remaining patches]
+        buffer: list = list()
+        try:
+            while True:
+                # the background threads load ahead one set of volumes in addition to the resident ones
+                while indices and len(pending) + len(resident) < num_queued:
+                    index = indices.popleft()
+                    if pool is not None:
+                        pending.append(pool.apply_async(_load, (index,)))
+                    else:
+                        pending.append(_DeferredResult(_load, index))
+                while pending and len(resident) < self.num_volumes:
+                    resident.append([pending.popleft().get(), self.samples_per_volume])
+                if not resident:
+                    break
+
+                self.randomize(len(resident))
+                volume = resident[self._index]
+                patches = apply_transform(self.transform, volume[0])
+                if not isinstance(patches, list):
+                    patches = [patches]
+                patches = patches[: volume[1]]
+                volume[1] -= len(patches)
+                if volume[1] <= 0:
+                    resident.pop(self._index)
+                buffer.extend(patches)
+                while len(buffer) >= self.buffer_size:
+                    yield self._pop_patch(buffer)
+            while buffer:
+                yield self._pop_patch(buffer)
+        finally:
+            if pool is not None:
+                pool.terminate()
@@ -0,0 +1,98 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Sequence
+
+import numpy as np
+from torch.utils.data import Sampler
+
+from monai.transforms import Randomizable
+
+__all__ = ["ShapeBucketBatchSampler"]
+
+
+class ShapeBucketBatchSampler(Sampler, Randomizable):
+    """
+    Batch sampler grouping the items of similar spatial shapes into the same batch, so that
+    :py:func:`monai.data.pad_list_data_collate` only pads every batch to the largest shape in the batch.
+
+    In every epoch, the shuffled indices are split into pools of `batch_size * pool_batches` items,
+    the items of a pool are sorted by the number of voxels and the shape, then cut into batches,
+    finally the order of all the batches is shuffled. A larger pool groups the shapes more tightly
+    while a smaller pool keeps more randomness of the batch compositions.
+
+    For example, with the spatial shapes of a dataset manifest (see :py:func:`monai.data.scan_datalist`)::
+
+        sampler = ShapeBucketBatchSampler(shapes=[item["image"]["spatial_shape"] for item in manifest], batch_size=4)
+        loader = DataLoader(dataset, batch_sampler=sampler, collate_fn=pad_list_data_collate)
+
+    Args:
+        shapes: the spatial shapes of the items of the dataset, in the order of the dataset.
+        batch_size: the number of items in a batch.
+        shuffle: whether to shuffle the items and the batches in every epoch, if False the items are
+            sorted in the pools of the original order and the batches are yielded in order.
+        drop_last: whether to drop the last incomplete batch of every pool.
+        pool_batches: the number of batches in a pool of items to sort.
+
+    Raises:
+        ValueError: batch_size and pool_batches must be positive.
+
+    """
+
+    def __init__(
+        self,
+        shapes: Sequence[Sequence[int]],
+        batch_size: int,
+        shuffle: bool = True,
+        drop_last: bool = False,
+        pool_batches: int = 100,
+    ):
+        if batch_size <= 0 or pool_batches <= 0:
+            raise ValueError("batch_size and pool_batches must be positive.")
+        self.shapes = [tuple(int(i) for i in s) for s in shapes]
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.pool_batches = pool_batches
+        self._order = np.arange(len(self.shapes))
+
+    def randomize(self, data_len: int):
+        self._order = self.R.permutation(data_len)
+
+    def _sort_key(self, index: int):
+        shape = self.shapes[index]
+        return int(np.prod(shape)), shape
+
+    def __iter__(self):
+        if self.shuffle:
+            self.randomize(len(self.shapes))
+        else:
+            self._order = np.arange(len(self.shapes))
+        pool_size = self.batch_size * self.pool_batches
+        batches = list()
+        for start in range(0, len(self._order), pool_size):
+            pool = sorted(self._order[start : start + pool_size].tolist(), key=self._sort_key)
+            for i in range(0, len(pool), self.batch_size):
+                batch = pool[i : i + self.batch_size]
+                if len(batch) < self.batch_size and self.drop_last:
+                    continue
+                batches.append(batch)
+        if self.shuffle:
+            batches = [batches[i] for i in self.R.permutation(len(batches))]
+        return iter(batches)
+
+    def __len__(self):
+        num_batches = 0
+        pool_size = self.batch_size * self.pool_batches
+        for start in range(0, len(self.shapes), pool_size):
+            size = min(pool_size, len(self.shapes) - start)
+            num_batches += size // self.batch_size if self.drop_last else -(-size // self.batch_size)
+        return num_batches
@@ -0,0 +1,214 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from typing import Sequence
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # python < 3.8
+    shared_memory = None
+
+__all__ = ["SharedCache", "pack_item", "unpack_item"]
+
+_ALIGNMENT = 64
+
+
+class _ArrayRef:
+    """
+    Placeholder of a numpy array in the skeleton of a cached item,
+    records the location of the array data in the shared memory block.
+    """
+
+    __slots__ = ("offset", "shape", "dtype")
+
+    def __init__(self, offset: int, shape, dtype):
+        self.offset = offset
+        self.shape = shape
+        self.dtype = dtype
+
+    def __getstate__(self):
+        return self.offset, self.shape, self.dtype
+
+    def __setstate__(self, state):
+        self.offset, self.shape, self.dtype = state
+
+
+def _build_skeleton(item, arrays: list, offset: int):
+    """
+    Replace the numpy arrays in `item` (recursively into dict, list and tuple) with `_ArrayRef`,
+    the replaced arrays are appended to `arrays`.
+
+    Returns:
+        the skeleton of the item and the end offset of the arrays.
+    """
+    if isinstance(item, np.ndarray) and item.dtype != object:
+        offset = (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+        arrays.append((offset, item))
+        return _ArrayRef(offset, item.shape, item.dtype), offset + item.nbytes
+    if isinstance(item, dict):
+        skeleton = dict()
+        for k, v in item.items():
+            skeleton[k], offset = _build_skeleton(v, arrays, offset)
+        return skeleton, offset
+    if isinstance(item, (list, tuple)):
+        skeleton = list()
+        for v in item:
+            v, offset = _build_skeleton(v, arrays, offset)
+            skeleton.append(v)
+        return type(item)(skeleton) if isinstance(item, tuple) else skeleton, offset
+    return item, offset
+
+
+def _fill_skeleton(skeleton, buffer, copy: bool = False):
+    """
+    Reconstruct an item from its skeleton, the arrays are read-only views of `buffer`,
+    or writable copies if `copy` is True.
+    """
+    if isinstance(skeleton, _ArrayRef):
+        array = np.ndarray(skeleton.shape, dtype=skeleton.dtype, buffer=buffer, offset=skeleton.offset)
+        if copy:
+            return array.copy()
+        array.flags.writeable = False
+        return array
+    if isinstance(skeleton, dict):
+        return {k: _fill_skeleton(v, buffer, copy) for k, v in skeleton.items()}
+    if isinstance(skeleton, list):
+        return [_fill_skeleton(v, buffer, copy) for v in skeleton]
+    if isinstance(skeleton, tuple):
+        return tuple(_fill_skeleton(v, buffer, copy) for v in skeleton)
+    return skeleton
+
+
+def _write_arrays(buffer, arrays: list):
+    for offset, array in arrays:
+        dst = np.ndarray(array.shape, dtype=array.dtype, buffer=buffer, offset=offset)
+        dst[...] = array
+
+
+def pack_item(item):
+    """
+    Copy the numpy arrays of `item` into a new shared memory block, so that the item can be sent
+    to another process without pickling the array data. The block must be released by :py:func:`unpack_item`.
+
+    Returns:
+        the name of the shared memory block and the picklable skeleton of the item.
+
+    Raises:
+        RuntimeError: shared memory requires python >= 3.8.
+
+    """
+    if shared_memory is None:
+        raise RuntimeError("pack_item requires multiprocessing.shared_memory (python >= 3.8).")
+    arrays: list = list()
+    skeleton, nbytes = _build_skeleton(item, arrays, 0)
+    shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+    _write_arrays(shm.buf, arrays)
+    shm.close()
+    return shm.name, skeleton
+
+
+def unpack_item(name: str, skeleton):
+    """
+    Reconstruct an item packed by :py:func:`pack_item` with writable copies of the arrays,
+    and release the shared memory block.
+    """
+    # attach with the default tracking, so that `unlink` balances the registration of the creator
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        return _fill_skeleton(skeleton, shm.buf, copy=True)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _attach_shared_memory(name: str):
+    """
+    Attach to an existing shared memory block without taking the ownership of it.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # python < 3.13 has no `track` argument
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedCache:
+    """
+    A read-only sequence of data items, the numpy arrays of all the items are packed into
+    one POSIX shared memory block (`multiprocessing.shared_memory`), the rest of the items
+    are kept in a compact picklable index.
+
+    Indexing the cache returns a new item (dict, list and tuple containers are recreated) with
+    read-only array views of the shared memory, so the DataLoader worker processes,
+    either forked or spawned, share the same physical memory of the arrays instead of
+    duplicating the cache in every worker by copy-on-write.
+
+    The shared memory block is released when the cache is closed or garbage collected
+    in the process that created it.
+
+    Args:
+        items: the data items to cache, typically dictionaries of numpy arrays.
+
+    Raises:
+        RuntimeError: shared memory requires python >= 3.8.
+
+    """
+
+    def __init__(self, items: Sequence):
+        if shared_memory is None:
+            raise RuntimeError("SharedCache requires multiprocessing.shared_memory (python >= 3.8).")
+        arrays: list = list()
+        offset = 0
+        self._skeletons = list()
+        for item in items:
+            skeleton, offset = _build_skeleton(item, arrays, offset)
+            self._skeletons.append(skeleton)
+        self.nbytes = offset
+        self._shm = shared_memory.SharedMemory(create=True, size=max(self.nbytes, 1))
+        self.name = self._shm.name
+        self._owner_pid = os.getpid()
+        _write_arrays(self._shm.buf, arrays)
+
+    def __len__(self):
+        return len(self._skeletons)
+
+    def __getitem__(self, index: int):
+        if self._shm is None:
+            self._shm = _attach_shared_memory(self.name)
+        return _fill_skeleton(self._skeletons[index], self._shm.buf)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_shm"] = None  # attach by name in the other processes
+        state["_owner_pid"] = None
+        return state
+
+    def close(self):
+        """
+        Close the access to the shared memory, and release the memory block if called by the creator.
+        The cache can't be used after closing.
+        """
+        shm, self._shm = self._shm, None
+        if shm is None:
+            return
+        try:
+            shm.close()
+        except BufferError:
+            # array views are still referenced, the mapping is released with them
+            pass
+        if self._owner_pid == os.getpid():
+            shm.unlink()
+
+    def __del__(self):
+        if getattr(self, "_shm", None) is not None:
+            self.close()
@@ -9,8 +9,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional
+from typing import Optional, Sequence, Callable
 
+import hashlib
+import json
 import os
 import warnings
 import math
@@ -20,9 +22,12 @@ import torch
 from torch.utils.data._utils.collate import default_collate
 import numpy as np
 from monai.utils import ensure_tuple_size
+from monai.utils.profiling import TransformProfiler
 from monai.networks.layers.simplelayers import GaussianFilter
 
 import enum
+import functools
+import types
 
 
 class InterpolationCode(enum.IntEnum):
@@ -209,6 +214,14 @@ def get_valid_patch_size(dims, patch_size):
     return tuple(min(ms, ps or ms) for ms, ps in zip(dims, patch_size))
 
 
+STACKED_KEYS = "stacked_keys"
+"""
+The key of the list of the keys whose values are the samples stacked along the first dimension,
+in the dictionary data generated by the transforms in the batched mode (for example,
+:py:class:`monai.transforms.RandCropByPosNegLabeld` with ``batched=True``).
+"""
+
+
 def list_data_collate(batch):
     """
     Enhancement for PyTorch DataLoader default collate.
@@ -217,11 +230,171 @@ def list_data_collate(batch):
 
     Note:
         Need to use this collate if apply some transforms that can generate batch data.
+        The strided numpy views are made contiguous before collating.
+        The values of the :py:data:`STACKED_KEYS` of the dictionary data are concatenated along the first
+        dimension instead of being stacked again, the other values are repeated for every sample.
+
+    Raises:
+        ValueError: the batch mixes the stacked data (with :py:data:`STACKED_KEYS`) and the other data.
 
     """
     elem = batch[0]
+    stacked = [isinstance(i, dict) and STACKED_KEYS in i for i in batch]
+    if any(stacked):
+        if not all(stacked):
+            raise ValueError(
+                f"the items of the batch must all have '{STACKED_KEYS}' or none of them, got {stacked.count(True)} "
+                f"stacked items of {len(batch)}, use either the batched or the list outputs of the transforms."
+            )
+        return _stacked_data_collate(batch)
     data = [i for k in batch for i in k] if isinstance(elem, list) else batch
-    return default_collate(data)
+    return default_collate([_contiguous(i) for i in data])
+
+
+def _stacked_data_collate(batch):
+    """
+    Collate the dictionary data of the stacked samples, see :py:data:`STACKED_KEYS`.
+
+    Every item holds ``n_i`` samples stacked along the first dimension of the values of its stacked keys,
+    the stacked values of the items are concatenated into ``sum(n_i)`` samples, so that the keys may have
+    different shapes (for example, the channels of the image and the label) as long as the items agree.
+    The other values of an item are repeated ``n_i`` times and collated by `default_collate`.
+    A single item of the batch is converted to tensors without copying the stacked values.
+
+    Raises:
+        ValueError: the items of the batch have different stacked keys.
+
+    """
+    keys = batch[0][STACKED_KEYS]
+    others = list()
+    for item in batch:
+        if list(item[STACKED_KEYS]) != list(keys):
+            raise ValueError(f"all the items of the batch must have the same stacked keys {keys}.")
+        other = {k: v for k, v in item.items() if k not in keys and k != STACKED_KEYS}
+        others.extend([other] * len(item[keys[0]]))
+    collated = default_collate([_contiguous(i) for i in others]) if others and others[0] else dict()
+    for key in keys:
+        values = [i[key] if torch.is_tensor(i[key]) else torch.as_tensor(_contiguous(i[key])) for i in batch]
+        collated[key] = values[0] if len(values) == 1 else torch.cat(values)
+    return collated
+
+
+def _contiguous(data):
+    """
+    Make the strided numpy views in `data` (for example, the outputs of `Flip` and `Orientation`) contiguous,
+    so that they can be converted to tensors.
+    """
+    if isinstance(data, np.ndarray):
+        return data if data.flags.c_contiguous else np.ascontiguousarray(data)
+    if isinstance(data, dict):
+        return {k: _contiguous(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return type(data)(_contiguous(i) for i in data)
+    return data
+
+
+def _pad_to_shape(data, shape, mode: str, value):
+    """
+    Pad `data` (numpy array or torch tensor) at the end of every dimension to `shape`.
+    """
+    pad_width = [(0, max(s - d, 0)) for s, d in zip(shape, data.shape)]
+    if not any(w for _, w in pad_width):
+        return data
+    if isinstance(data, torch.Tensor):
+        # `F.pad` takes the pad width from the last dimension
+        pad = [i for _, w in reversed(pad_width) for i in (0, w)]
+        if mode == "constant":
+            return torch.nn.functional.pad(data, pad, mode=mode, value=value)
+        return torch.nn.functional.pad(data, pad, mode=mode)
+    if mode == "constant":
+        return np.pad(data, pad_width, mode=mode, constant_values=value)
+    return np.pad(data, pad_width, mode=mode)
+
+
+def pad_list_data_collate(batch, mode: str = "constant", value=0, shape_key_postfix: str = "shape"):
+    """
+    Same as :py:func:`list_data_collate`, but the numpy arrays and torch tensors of different shapes are padded
+    at the end of every dimension to the largest shape in the batch, instead of raising errors in
+    `default_collate`. Combined with :py:class:`monai.data.ShapeBucketBatchSampler`, the samples in a batch have
+    similar shapes, so that only a small number of elements are padded.
+
+    For the dictionary data, the shapes before padding of every array or tensor `key` are collated in
+    ``key_{shape_key_postfix}``, a tensor of (batch_size, ndim), the valid region of the i-th sample is
+    ``data[key][i][tuple(slice(0, s) for s in data[f"{key}_shape"][i])]``.
+
+    Use `functools.partial` to customize the arguments, for example:
+    ``DataLoader(dataset, collate_fn=partial(pad_list_data_collate, mode="edge"))``.
+
+    Args:
+        batch: the list of the data samples.
+        mode: the padding mode of `np.pad` or `torch.nn.functional.pad`, default is ``"constant"``.
+        value: the padding value of the ``"constant"`` mode, default is 0.
+        shape_key_postfix: the postfix of the keys of the original shapes in the dictionary data.
+
+    Raises:
+        ValueError: the data to pad must have the same number of dimensions.
+
+    """
+    elem = batch[0]
+    data = [i for k in batch for i in k] if isinstance(elem, list) else list(batch)
+
+    def _pad_items(items):
+        items = list(items)
+        if not all(isinstance(i, (np.ndarray, torch.Tensor)) and i.ndim > 0 for i in items):
+            return items, None
+        shapes = [tuple(i.shape) for i in items]
+        if len(set(shapes)) <= 1:
+            return items, shapes
+        if len({len(i) for i in shapes}) != 1:
+            raise ValueError(f"the data to pad must have the same number of dimensions, got {shapes}.")
+        max_shape = np.max(shapes, axis=0)
+        return [_pad_to_shape(i, max_shape, mode, value) for i in items], shapes
+
+    elem = data[0]
+    if isinstance(elem, dict):
+        data = [dict(d) for d in data]
+        for key in elem:
+            padded, shapes = _pad_items(d[key] for d in data)
+            if shapes is None:
+                continue
+            for d, i, shape in zip(data, padded, shapes):
+                d[key] = i
+                d[f"{key}_{shape_key_postfix}"] = np.asarray(shape)
+    elif isinstance(elem, (tuple, list)):
+        columns = [_pad_items(c)[0] for c in zip(*data)]
+        data = [type(elem)(d) for d in zip(*columns)]
+    else:
+        data = _pad_items(data)[0]
+    return default_collate([_contiguous(i) for i in data])
+
+
+def partition_dataset(data_len: int, num_partitions: int, shuffle: bool = False, seed: int = 0, even: bool = True):
+    """
+    Split the indices of a dataset into `num_partitions` partitions deterministically, for example,
+    to assign the data items to the ranks of distributed training.
+
+    Args:
+        data_len: the number of items of the dataset.
+        num_partitions: the number of partitions.
+        shuffle: whether to shuffle the indices before splitting, with a random state of `seed`.
+        seed: the random seed to shuffle the indices, it must be the same for all the partitions.
+        even: if True, the partitions have the same length, the first indices are repeated
+            to pad the last partitions when `data_len` is not divisible by `num_partitions`.
+
+    Returns:
+        a list of `num_partitions` lists of indices.
+
+    Raises:
+        ValueError: num_partitions must be positive.
+
+    """
+    if num_partitions <= 0:
+        raise ValueError(f"num_partitions must be positive, got {num_partitions}.")
+    indices = np.random.RandomState(seed).permutation(data_len) if shuffle else np.arange(data_len)
+    if even and data_len % num_partitions != 0:
+        padding = num_partitions - data_len % num_partitions
+        indices = np.concatenate([indices, np.resize(indices, padding)])
+    return [indices[i::num_partitions].tolist() for i in range(num_partitions)]
 
 
 def worker_init_fn(worker_id):
@@ -473,3 +646,125 @@ def compute_importance_map(patch_size, mode: str = "constant", sigma_scale: floa
         raise ValueError('mode must be "constant" or "gaussian".')
 
     return importance_map
+
+
+def _describe_object(obj, seen: set):
+    """
+    Convert `obj` into a JSON serializable structure that does not depend on the memory address
+    of the objects, so that the description is stable across runs.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, enum.Enum):
+        return f"{type(obj).__qualname__}.{obj.name}"
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return _describe_object(obj.tolist(), seen) if obj.dtype.hasobject else _describe_array(obj, str(obj.dtype))
+    if torch.is_tensor(obj):
+        tensor = obj.detach().cpu()
+        try:
+            array = tensor.numpy()
+        except TypeError:  # no numpy equivalent, such as bfloat16
+            array = tensor.float().numpy()
+        return _describe_array(array, str(tensor.dtype))
+    if isinstance(obj, (np.dtype, torch.dtype, torch.device)):
+        return str(obj)
+    if isinstance(obj, type):
+        return f"{obj.__module__}.{obj.__qualname__}"
+    if isinstance(obj, (list, tuple)):
+        return [_describe_object(o, seen) for o in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted((_describe_object(o, seen) for o in obj), key=repr)
+    if isinstance(obj, dict):
+        return {str(k): _describe_object(v, seen) for k, v in obj.items()}
+    if isinstance(obj, types.CodeType):
+        # the bytecode doesn't contain the constants and the names of the globals and attributes
+        return {
+            "co_code": hashlib.md5(obj.co_code).hexdigest(),
+            "co_consts": [_describe_object(c, seen) for c in obj.co_consts],
+            "co_names": list(obj.co_names),
+        }
+    if id(obj) in seen:
+        return f"<cycle {type(obj).__qualname__}>"
+    if isinstance(obj, (types.MethodType, types.BuiltinMethodType)) and not isinstance(
+        getattr(obj, "__self__", None), (types.ModuleType, type(None))
+    ):
+        # bound methods: the method and the configuration of the object it is bound to
+        seen.add(id(obj))
+        return {
+            "__method__": _callable_name(obj),
+            "func": _describe_object(getattr(obj, "__func__", None), seen),
+            "self": _describe_object(obj.__self__, seen),
+        }
+    if isinstance(obj, functools.partial):
+        seen.add(id(obj))
+        return {
+            "__partial__": _describe_object(obj.func, seen),
+            "args": _describe_object(obj.args, seen),
+            "keywords": _describe_object(obj.keywords, seen),
+        }
+    code = getattr(obj, "__code__", None)
+    if code is not None:
+        # functions and lambdas: the name, the code, the default arguments and the closure identify the behaviour
+        seen.add(id(obj))
+        return {
+            "__function__": _callable_name(obj),
+            "code": _describe_object(code, seen),
+            "defaults": _describe_object(getattr(obj, "__defaults__", None), seen),
+            "kwdefaults": _describe_object(getattr(obj, "__kwdefaults__", None), seen),
+            "closure": [_describe_object(_cell_contents(c), seen) for c in getattr(obj, "__closure__", None) or ()],
+        }
+    if hasattr(obj, "__dict__"):
+        seen.add(id(obj))
+        desc = {"__class__": f"{type(obj).__module__}.{type(obj).__qualname__}"}
+        desc.update(
+            {
+                str(k): _describe_object(v, seen)
+                for k, v in sorted(vars(obj).items())
+                if not isinstance(v, TransformProfiler)  # profiling doesn't change the results
+            }
+        )
+        return desc
+    if callable(obj):
+        # builtin functions and numpy ufuncs, for example `np.exp` and `np.log` are both of type `numpy.ufunc`
+        return {"__callable__": _callable_name(obj), "__class__": f"{type(obj).__module__}.{type(obj).__qualname__}"}
+    return f"{type(obj).__module__}.{type(obj).__qualname__}"
+
+
+def _describe_array(array: np.ndarray, dtype: str):
+    """
+    Describe an array by its data type, its shape and the md5 digest of its data,
+    instead of its (possibly large) list of values.
+    """
+    data = np.ascontiguousarray(array)
+    return {"__array__": dtype, "shape": list(data.shape), "md5": hashlib.md5(data.tobytes()).hexdigest()}
+
+
+def _callable_name(obj) -> str:
+    name = getattr(obj, "__qualname__", None) or getattr(obj, "__name__", None) or type(obj).__qualname__
+    module = getattr(obj, "__module__", None) or type(obj).__module__
+    return f"{module}.{name}"
+
+
+def _cell_contents(cell):
+    try:
+        return cell.cell_contents
+    except ValueError:  # empty cell
+        return None
+
+
+def get_transform_fingerprint(transforms: Sequence[Callable]) -> str:
+    """
+    Compute a fingerprint of a sequence of transforms, based on the class of every transform
+    and its attributes (typically the constructor arguments). The fingerprint is stable across runs,
+    so that it can be used to identify the results of the transforms stored on disk.
+
+    Args:
+        transforms: a sequence of callable transforms.
+
+    Returns:
+        the md5 hex digest of the transforms' description.
+    """
+    desc = [_describe_object(t, set()) for t in transforms]
+    return hashlib.md5(json.dumps(desc, sort_keys=True).encode("utf-8")).hexdigest()
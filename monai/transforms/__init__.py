@@ -10,6 +10,8 @@
 # limitations under the License.
 
 from .compose import *
+from .batch.array import *
+from .batch.dictionary import *
 from .croppad.array import *
 from .croppad.dictionary import *
 from .intensity.array import *
@@ -0,0 +1,422 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A collection of "vanilla" random transforms for the collated batches of shape (batch_size, num_channels, H[, W, D]).
+The random parameters are drawn independently for every sample of the batch, and the batch is transformed
+by a few tensor operations on the device of the batch, so the augmentations can run in the training loop,
+for example::
+
+    augment = Compose([BatchRandAffined(keys=["image", "label"], prob=0.5, rotate_range=(0.3,)), ...])
+    trainer = SupervisedTrainer(..., prepare_batch=lambda batch: default_prepare_batch(augment(batch)))
+
+https://github.com/Project-MONAI/MONAI/wiki/MONAI_Design
+"""
+
+from typing import Optional
+
+import numpy as np
+import torch
+
+from monai.networks.layers import AffineTransform
+from monai.transforms.compose import Randomizable, Transform
+from monai.transforms.spatial.array import _grid_voxel_matrix
+from monai.transforms.utils import create_rotate, create_scale, create_shear, create_translate
+from monai.utils.misc import ensure_tuple
+
+_torch_interp_modes = {2: "bilinear", 3: "trilinear"}
+
+
+def _per_sample(values, img: torch.Tensor) -> torch.Tensor:
+    """
+    Convert the per sample `values` to a tensor broadcastable to `img` of shape (batch_size, C, ...).
+    """
+    dtype = img.dtype if img.is_floating_point() else torch.float
+    return torch.as_tensor(values, dtype=dtype, device=img.device).reshape([-1] + [1] * (img.ndim - 1))
+
+
+def _float(img: torch.Tensor) -> torch.Tensor:
+    return img if img.is_floating_point() else img.float()
+
+
+class BatchRandFlip(Randomizable, Transform):
+    """
+    Flip every sample of the batch along `spatial_axis` with probability `prob`.
+
+    Args:
+        prob: probability of flipping a sample.
+        spatial_axis (None, int or tuple of ints): spatial axes along which to flip over. Default is None.
+    """
+
+    def __init__(self, prob: float = 0.1, spatial_axis=None):
+        self.prob = min(max(prob, 0.0), 1.0)
+        self.spatial_axis = spatial_axis
+        self._do_transform = np.zeros(0, dtype=bool)
+
+    def randomize(self, batch_size: int):
+        self._do_transform = self.R.rand(batch_size) < self.prob
+
+    def __call__(self, img: torch.Tensor):
+        """
+        Args:
+            img: the batch in shape (batch_size, num_channels, H[, W, ...]).
+        """
+        self.randomize(img.shape[0])
+        return self._transform(img)
+
+    def _transform(self, img: torch.Tensor) -> torch.Tensor:
+        if not np.any(self._do_transform):
+            return img
+        if self.spatial_axis is None:
+            axes = list(range(2, img.ndim))
+        else:
+            axes = [i + 2 if i >= 0 else i for i in ensure_tuple(self.spatial_axis)]
+        mask = torch.as_tensor(self._do_transform, device=img.device).reshape([-1] + [1] * (img.ndim - 1))
+        return torch.where(mask, torch.flip(img, axes), img)
+
+
+class BatchRandRotate90(Randomizable, Transform):
+    """
+    Rotate every sample of the batch by ``randint(max_k) + 1`` times 90 degrees in the plane of `spatial_axes`
+    with probability `prob`. The two spatial axes must have the same size.
+
+    Args:
+        prob: probability of rotating a sample.
+        max_k: number of rotations will be sampled from `np.random.randint(max_k) + 1`.
+        spatial_axes (2 ints): defines the plane to rotate with 2 spatial axes.
+    """
+
+    def __init__(self, prob: float = 0.1, max_k: int = 3, spatial_axes=(0, 1)):
+        self.prob = min(max(prob, 0.0), 1.0)
+        self.max_k = max_k
+        self.spatial_axes = spatial_axes
+        self._rand_k = np.zeros(0, dtype=int)
+
+    def randomize(self, batch_size: int):
+        rand_k = self.R.randint(self.max_k, size=batch_size) + 1
+        self._rand_k = np.where(self.R.rand(batch_size) < self.prob, rand_k % 4, 0)
+
+    def __call__(self, img: torch.Tensor):
+        """
+        Args:
+            img: the batch in shape (batch_size, num_channels, H[, W, ...]).
+        """
+        self.randomize(img.shape[0])
+        return self._transform(img)
+
+    def _transform(self, img: torch.Tensor) -> torch.Tensor:
+        if not np.any(self._rand_k):
+            return img
+        axes = [i + 2 if i >= 0 else i for i in self.spatial_axes]
+        if img.shape[axes[0]] != img.shape[axes[1]]:
+            raise ValueError(f"the rotated spatial axes must have the same size, got shape {tuple(img.shape)}.")
+        output = img.clone()
+        for k in np.unique(self._rand_k):
+            if k == 0:
+                continue
+            index = torch.as_tensor(np.flatnonzero(self._rand_k == k), device=img.device)
+            output[index] = torch.rot90(img[index], int(k), axes)
+        return output
+
+
+class BatchRandScaleIntensity(Randomizable, Transform):
+    """
+    Scale the intensity of every sample of the batch by ``v = v * (1 + factor)`` with probability `prob`,
+    the factor of each sample is picked from ``uniform(factors[0], factors[1])``.
+
+    Args:
+        factors (float, tuple or list): factor range to randomly scale by ``v = v * (1 + factor)``.
+            if single number, factor value is picked from (-factors, factors).
+        prob: probability of scaling a sample.
+    """
+
+    def __init__(self, factors, prob: float = 0.1):
+        self.factors = (-factors, factors) if not isinstance(factors, (list, tuple)) else factors
+        assert len(self.factors) == 2, "factors should be a number or pair of numbers."
+        self.prob = prob
+        self._factor = np.zeros(0)
+
+    def randomize(self, batch_size: int):
+        factor = self.R.uniform(low=self.factors[0], high=self.factors[1], size=batch_size)
+        self._factor = np.where(self.R.rand(batch_size) < self.prob, factor, 0.0)
+
+    def __call__(self, img: torch.Tensor):
+        """
+        Args:
+            img: the batch in shape (batch_size, num_channels, H[, W, ...]).
+        """
+        self.randomize(img.shape[0])
+        return self._transform(img)
+
+    def _transform(self, img: torch.Tensor) -> torch.Tensor:
+        return _float(img) * (1.0 + _per_sample(self._factor, img))
+
+
+class BatchRandShiftIntensity(Randomizable, Transform):
+    """
+    Shift the intensity of every sample of the batch with probability `prob`,
+    the offset of each sample is picked from ``uniform(offsets[0], offsets[1])``.
+
+    Args:
+        offsets (int, float, tuple or list): offset range to randomly shift.
+            if single number, offset value is picked from (-offsets, offsets).
+        prob: probability of shifting a sample.
+    """
+
+    def __init__(self, offsets, prob: float = 0.1):
+        self.offsets = (-offsets, offsets) if not isinstance(offsets, (list, tuple)) else offsets
+        assert len(self.offsets) == 2, "offsets should be a number or pair of numbers."
+        self.prob = prob
+        self._offset = np.zeros(0)
+
+    def randomize(self, batch_size: int):
+        offset = self.R.uniform(low=self.offsets[0], high=self.offsets[1], size=batch_size)
+        self._offset = np.where(self.R.rand(batch_size) < self.prob, offset, 0.0)
+
+    def __call__(self, img: torch.Tensor):
+        """
+        Args:
+            img: the batch in shape (batch_size, num_channels, H[, W, ...]).
+        """
+        self.randomize(img.shape[0])
+        return self._transform(img)
+
+    def _transform(self, img: torch.Tensor) -> torch.Tensor:
+        return _float(img) + _per_sample(self._offset, img)
+
+
+class BatchRandGaussianNoise(Randomizable, Transform):
+    """
+    Add Gaussian noise to every sample of the batch with probability `prob`, the standard deviation
+    of each sample is picked from ``uniform(0, std)``. The noise is generated on the device of the batch
+    by a `torch.Generator` seeded from :py:attr:`self.R`.
+
+    Args:
+        prob: probability to add Gaussian noise to a sample.
+        mean: mean or "centre" of the distribution.
+        std: standard deviation (spread) of distribution.
+    """
+
+    def __init__(self, prob: float = 0.1, mean: float = 0.0, std: float = 0.1):
+        self.prob = prob
+        self.mean = mean
+        self.std = std
+        self._std = np.zeros(0)
+        self._seed = 0
+
+    def randomize(self, batch_size: int):
+        std = self.R.uniform(0, self.std, size=batch_size)
+        self._std = np.where(self.R.rand(batch_size) < self.prob, std, 0.0)
+        self._seed = self.R.randint(np.iinfo(np.int32).max)
+
+    def __call__(self, img: torch.Tensor):
+        """
+        Args:
+            img: the batch in shape (batch_size, num_channels, H[, W, ...]).
+        """
+        self.randomize(img.shape[0])
+        return self._transform(img)
+
+    def _transform(self, img: torch.Tensor) -> torch.Tensor:
+        img = _float(img)
+        if not np.any(self._std):
+            return img
+        generator = torch.Generator(device=img.device)
+        generator.manual_seed(int(self._seed))
+        noise = torch.randn(img.shape, generator=generator, dtype=img.dtype, device=img.device)
+        std = _per_sample(self._std, img)
+        return img + (noise * std + self.mean * (std > 0))
+
+
+class BatchRandAffine(Randomizable, Transform):
+    """
+    Random affine transform of every sample of the batch with probability `prob`, the batch is resampled
+    by a single :py:class:`monai.networks.layers.AffineTransform` call with a (batch_size, N+1, N+1) theta.
+    The affine parameters are the same as :py:class:`monai.transforms.RandAffine`, and every sample is
+    resampled the same as `RandAffine` with its parameters.
+
+    Args:
+        prob: probability of transforming a sample.
+        rotate_range, shear_range, translate_range, scale_range: see :py:class:`monai.transforms.RandAffineGrid`.
+        spatial_size (list or tuple of int): output image spatial size, defaults to the input spatial size.
+        mode ('nearest'|'bilinear'): interpolation order. Defaults to 'bilinear'.
+        padding_mode ('zeros'|'border'|'reflection'): mode of handling out of range indices. Defaults to 'zeros'.
+    """
+
+    def __init__(
+        self,
+        prob: float = 0.1,
+        rotate_range=None,
+        shear_range=None,
+        translate_range=None,
+        scale_range=None,
+        spatial_size=None,
+        mode: str = "bilinear",
+        padding_mode: str = "zeros",
+    ):
+        self.prob = prob
+        self.rotate_range = ensure_tuple(rotate_range)
+        self.shear_range = ensure_tuple(shear_range)
+        self.translate_range = ensure_tuple(translate_range)
+        self.scale_range = ensure_tuple(scale_range)
+        self.spatial_size = spatial_size
+        self.mode = mode
+        self.padding_mode = padding_mode
+        self._matrices = np.zeros((0, 1, 1))
+
+    def _draw(self, ranges, batch_size: int, offset: float = 0.0):
+        ranges = [f for f in ranges if f is not None]
+        if not ranges:
+            return None
+        return np.stack([self.R.uniform(-f, f, size=batch_size) + offset for f in ranges], axis=1)
+
+    def randomize(self, batch_size: int, spatial_dims: int):
+        """
+        Draw the (batch_size, spatial_dims+1, spatial_dims+1) affine matrices applied to the grid coordinates,
+        see also :py:meth:`monai.transforms.AffineGrid.get_matrix`.
+        """
+        do_transform = self.R.rand(batch_size) < self.prob
+        params = (
+            (create_rotate, self._draw(self.rotate_range, batch_size)),
+            (create_shear, self._draw(self.shear_range, batch_size)),
+            (create_translate, self._draw(self.translate_range, batch_size)),
+            (create_scale, self._draw(self.scale_range, batch_size, 1.0)),
+        )
+        self._matrices = np.tile(np.eye(spatial_dims + 1), (batch_size, 1, 1))
+        for b in np.flatnonzero(do_transform):
+            for create, values in params:
+                if values is not None:
+                    self._matrices[b] = self._matrices[b] @ create(spatial_dims, list(values[b]))
+
+    def __call__(self, img: torch.Tensor, spatial_size=None, mode: Optional[str] = None, padding_mode=None):
+        """
+        Args:
+            img: the batch in shape (batch_size, num_channels, H, W[, D]).
+            spatial_size (list or tuple of int): output image spatial size.
+            mode ('nearest'|'bilinear'): interpolation order. Defaults to ``self.mode``.
+            padding_mode ('zeros'|'border'|'reflection'): mode of handling out of range indices.
+                Defaults to ``self.padding_mode``.
+        """
+        self.randomize(img.shape[0], img.ndim - 2)
+        return self._transform(img, spatial_size, mode, padding_mode)
+
+    def get_theta(self, in_shape, spatial_size) -> np.ndarray:
+        """
+        The voxel matrices (in the convention of ``scipy.ndimage.affine_transform``) of the last `randomize`.
+        """
+        return np.stack([_grid_voxel_matrix(m, in_shape, spatial_size) for m in self._matrices])
+
+    def _transform(self, img: torch.Tensor, spatial_size=None, mode=None, padding_mode=None) -> torch.Tensor:
+        img = _float(img)
+        spatial_size = list(spatial_size or self.spatial_size or img.shape[2:])
+        theta = torch.as_tensor(self.get_theta(img.shape[2:], spatial_size), dtype=img.dtype, device=img.device)
+        affine_xform = AffineTransform(
+            normalized=False,
+            mode=mode or self.mode,
+            padding_mode=padding_mode or self.padding_mode,
+            align_corners=True,
+            reverse_indexing=True,
+        )
+        return affine_xform(img, theta, spatial_size=spatial_size)
+
+
+class BatchRandElastic(Randomizable, Transform):
+    """
+    Random elastic deformation and affine of every sample of the batch with probability `prob`.
+    The random displacements (in voxels) are drawn from ``normal(0, 1) * uniform(magnitude_range)``
+    on a control grid of `spacing`, interpolated to the output size and added to the output
+    coordinates before the affine transform of :py:class:`BatchRandAffine`.
+
+    Args:
+        spacing (int or sequence of ints): the spacing of the control grid in voxels.
+        magnitude_range (2 floats): the range of the magnitude of the displacements.
+        prob: probability of transforming a sample.
+        rotate_range, shear_range, translate_range, scale_range: see :py:class:`monai.transforms.RandAffineGrid`.
+        spatial_size (list or tuple of int): output image spatial size, defaults to the input spatial size.
+        mode ('nearest'|'bilinear'): interpolation order. Defaults to 'bilinear'.
+        padding_mode ('zeros'|'border'|'reflection'): mode of handling out of range indices. Defaults to 'zeros'.
+    """
+
+    def __init__(
+        self,
+        spacing,
+        magnitude_range,
+        prob: float = 0.1,
+        rotate_range=None,
+        shear_range=None,
+        translate_range=None,
+        scale_range=None,
+        spatial_size=None,
+        mode: str = "bilinear",
+        padding_mode: str = "zeros",
+    ):
+        self.rand_affine = BatchRandAffine(1.0, rotate_range, shear_range, translate_range, scale_range)
+        self.spacing = spacing
+        self.magnitude_range = magnitude_range
+        self.prob = prob
+        self.spatial_size = spatial_size
+        self.mode = mode
+        self.padding_mode = padding_mode
+        self._do_transform = np.zeros(0, dtype=bool)
+        self._offsets = None
+
+    def set_random_state(self, seed: Optional[int] = None, state: Optional[np.random.RandomState] = None):
+        self.rand_affine.set_random_state(seed, state)
+        super().set_random_state(seed, state)
+        return self
+
+    def randomize(self, batch_size: int, spatial_size):
+        self._do_transform = self.R.rand(batch_size) < self.prob
+        spacing = np.broadcast_to(np.asarray(self.spacing, dtype=np.float64), (len(spatial_size),))
+        control_size = [max(int(np.ceil((d - 1.0) / s)) + 1, 2) for d, s in zip(spatial_size, spacing)]
+        magnitude = self.R.uniform(self.magnitude_range[0], self.magnitude_range[1], size=batch_size)
+        magnitude = np.where(self._do_transform, magnitude, 0.0)
+        offsets = self.R.normal(size=[batch_size, len(spatial_size)] + control_size)
+        self._offsets = (offsets * magnitude.reshape([-1] + [1] * (offsets.ndim - 1))).astype(np.float32)
+        self.rand_affine.randomize(batch_size, len(spatial_size))
+        self.rand_affine._matrices[~self._do_transform] = np.eye(len(spatial_size) + 1)
+
+    def __call__(self, img: torch.Tensor, spatial_size=None, mode: Optional[str] = None, padding_mode=None):
+        """
+        Args:
+            img: the batch in shape (batch_size, num_channels, H, W[, D]).
+            spatial_size (list or tuple of int): output image spatial size.
+            mode ('nearest'|'bilinear'): interpolation order. Defaults to ``self.mode``.
+            padding_mode ('zeros'|'border'|'reflection'): mode of handling out of range indices.
+                Defaults to ``self.padding_mode``.
+        """
+        spatial_size = list(spatial_size or self.spatial_size or img.shape[2:])
+        self.randomize(img.shape[0], spatial_size)
+        return self._transform(img, spatial_size, mode, padding_mode)
+
+    def _transform(self, img: torch.Tensor, spatial_size=None, mode=None, padding_mode=None) -> torch.Tensor:
+        img = _float(img)
+        spatial_size = list(spatial_size or self.spatial_size or img.shape[2:])
+        sr = len(spatial_size)
+        device = img.device
+        offsets = torch.as_tensor(self._offsets, dtype=img.dtype, device=device)
+        displacement = torch.nn.functional.interpolate(
+            offsets, size=spatial_size, mode=_torch_interp_modes[sr], align_corners=True
+        )
+        coords = torch.meshgrid(*[torch.arange(d, dtype=img.dtype, device=device) for d in spatial_size])
+        coords = torch.stack(coords)[None] + displacement
+        theta = self.rand_affine.get_theta(img.shape[2:], spatial_size)
+        theta = torch.as_tensor(theta, dtype=img.dtype, device=device)
+        # the input voxel coordinates of the deformed output coordinates
+        grid = torch.einsum("bij,bj...->bi...", theta[:, :sr, :sr], coords)
+        grid = grid + theta[:, :sr, sr].reshape([-1, sr] + [1] * sr)
+        # normalize for `grid_sample` with `align_corners=True`, in the reversed order of the spatial dimensions
+        in_shape = torch.as_tensor(img.shape[2:], dtype=img.dtype, device=device).reshape([1, sr] + [1] * sr)
+        grid = 2.0 * grid / torch.clamp(in_shape - 1.0, min=1.0) - 1.0
+        grid = grid.flip(1).permute([0] + list(range(2, sr + 2)) + [1])
+        return torch.nn.functional.grid_sample(
+            img, grid, mode=mode or self.mode, padding_mode=padding_mode or self.padding_mode, align_corners=True
+        )
+
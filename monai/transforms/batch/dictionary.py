@@ -0,0 +1,213 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A collection of dictionary-based wrappers around the "vanilla" batch transforms
+defined in :py:class:`monai.transforms.batch.array`.
+
+The random parameters are drawn once per batch from the first key, so that all the keys
+of a sample are transformed the same way.
+
+Class names are ended with 'd' to denote dictionary-based transforms.
+"""
+
+from monai.config.type_definitions import KeysCollection
+from monai.transforms.batch.array import (
+    BatchRandAffine,
+    BatchRandElastic,
+    BatchRandFlip,
+    BatchRandGaussianNoise,
+    BatchRandRotate90,
+    BatchRandScaleIntensity,
+    BatchRandShiftIntensity,
+)
+from monai.transforms.compose import MapTransform, Randomizable
+from monai.utils.misc import ensure_tuple_rep
+
+
+class _BatchRandMapTransform(Randomizable, MapTransform):
+    """
+    Base class of the dictionary-based batch transforms, randomizing the wrapped `transform`
+    with the batch of the first key and applying it to all the keys.
+    """
+
+    def __init__(self, keys: KeysCollection, transform):
+        super().__init__(keys)
+        self.transform = transform
+
+    def set_random_state(self, seed=None, state=None):
+        self.transform.set_random_state(seed, state)
+        super().set_random_state(seed, state)
+        return self
+
+    def randomize(self, img):
+        self.transform.randomize(img.shape[0])
+
+    def __call__(self, data):
+        d = dict(data)
+        self.randomize(d[self.keys[0]])
+        for key in self.keys:
+            d[key] = self.transform._transform(d[key])
+        return d
+
+
+class BatchRandFlipd(_BatchRandMapTransform):
+    """
+    Dictionary-based wrapper of :py:class:`monai.transforms.BatchRandFlip`.
+    """
+
+    def __init__(self, keys: KeysCollection, prob: float = 0.1, spatial_axis=None):
+        super().__init__(keys, BatchRandFlip(prob=prob, spatial_axis=spatial_axis))
+
+
+class BatchRandRotate90d(_BatchRandMapTransform):
+    """
+    Dictionary-based wrapper of :py:class:`monai.transforms.BatchRandRotate90`.
+    """
+
+    def __init__(self, keys: KeysCollection, prob: float = 0.1, max_k: int = 3, spatial_axes=(0, 1)):
+        super().__init__(keys, BatchRandRotate90(prob=prob, max_k=max_k, spatial_axes=spatial_axes))
+
+
+class BatchRandScaleIntensityd(_BatchRandMapTransform):
+    """
+    Dictionary-based wrapper of :py:class:`monai.transforms.BatchRandScaleIntensity`.
+    """
+
+    def __init__(self, keys: KeysCollection, factors, prob: float = 0.1):
+        super().__init__(keys, BatchRandScaleIntensity(factors=factors, prob=prob))
+
+
+class BatchRandShiftIntensityd(_BatchRandMapTransform):
+    """
+    Dictionary-based wrapper of :py:class:`monai.transforms.BatchRandShiftIntensity`.
+    """
+
+    def __init__(self, keys: KeysCollection, offsets, prob: float = 0.1):
+        super().__init__(keys, BatchRandShiftIntensity(offsets=offsets, prob=prob))
+
+
+class BatchRandGaussianNoised(_BatchRandMapTransform):
+    """
+    Dictionary-based wrapper of :py:class:`monai.transforms.BatchRandGaussianNoise`.
+    The same noise is added to all the keys.
+    """
+
+    def __init__(self, keys: KeysCollection, prob: float = 0.1, mean: float = 0.0, std: float = 0.1):
+        super().__init__(keys, BatchRandGaussianNoise(prob=prob, mean=mean, std=std))
+
+
+class BatchRandAffined(_BatchRandMapTransform):
+    """
+    Dictionary-based wrapper of :py:class:`monai.transforms.BatchRandAffine`.
+
+    Args:
+        keys: keys of the corresponding items to be transformed.
+        mode (str or sequence of str): interpolation order of each key. Defaults to 'bilinear'.
+        padding_mode (str or sequence of str): padding mode of each key. Defaults to 'zeros'.
+
+    See also:
+        - :py:class:`monai.transforms.BatchRandAffine` for the other arguments.
+    """
+
+    def __init__(
+        self,
+        keys: KeysCollection,
+        prob: float = 0.1,
+        rotate_range=None,
+        shear_range=None,
+        translate_range=None,
+        scale_range=None,
+        spatial_size=None,
+        mode="bilinear",
+        padding_mode="zeros",
+    ):
+        transform = BatchRandAffine(
+            prob=prob,
+            rotate_range=rotate_range,
+            shear_range=shear_range,
+            translate_range=translate_range,
+            scale_range=scale_range,
+            spatial_size=spatial_size,
+        )
+        super().__init__(keys, transform)
+        self.mode = ensure_tuple_rep(mode, len(self.keys))
+        self.padding_mode = ensure_tuple_rep(padding_mode, len(self.keys))
+
+    def randomize(self, img):
+        self.transform.randomize(img.shape[0], img.ndim - 2)
+
+    def __call__(self, data):
+        d = dict(data)
+        self.randomize(d[self.keys[0]])
+        for idx, key in enumerate(self.keys):
+            d[key] = self.transform._transform(d[key], mode=self.mode[idx], padding_mode=self.padding_mode[idx])
+        return d
+
+
+class BatchRandElasticd(_BatchRandMapTransform):
+    """
+    Dictionary-based wrapper of :py:class:`monai.transforms.BatchRandElastic`.
+
+    Args:
+        keys: keys of the corresponding items to be transformed.
+        mode (str or sequence of str): interpolation order of each key. Defaults to 'bilinear'.
+        padding_mode (str or sequence of str): padding mode of each key. Defaults to 'zeros'.
+
+    See also:
+        - :py:class:`monai.transforms.BatchRandElastic` for the other arguments.
+    """
+
+    def __init__(
+        self,
+        keys: KeysCollection,
+        spacing,
+        magnitude_range,
+        prob: float = 0.1,
+        rotate_range=None,
+        shear_range=None,
+        translate_range=None,
+        scale_range=None,
+        spatial_size=None,
+        mode="bilinear",
+        padding_mode="zeros",
+    ):
+        transform = BatchRandElastic(
+            spacing=spacing,
+            magnitude_range=magnitude_range,
+            prob=prob,
+            rotate_range=rotate_range,
+            shear_range=shear_range,
+            translate_range=translate_range,
+            scale_range=scale_range,
+            spatial_size=spatial_size,
+        )
+        super().__init__(keys, transform)
+        self.mode = ensure_tuple_rep(mode, len(self.keys))
+        self.padding_mode = ensure_tuple_rep(padding_mode, len(self.keys))
+
+    def randomize(self, img):
+        self.transform.randomize(img.shape[0], list(self.transform.spatial_size or img.shape[2:]))
+
+    def __call__(self, data):
+        d = dict(data)
+        self.randomize(d[self.keys[0]])
+        for idx, key in enumerate(self.keys):
+            d[key] = self.transform._transform(d[key], mode=self.mode[idx], padding_mode=self.padding_mode[idx])
+        return d
+
+
+BatchRandFlipD = BatchRandFlipDict = BatchRandFlipd
+BatchRandRotate90D = BatchRandRotate90Dict = BatchRandRotate90d
+BatchRandScaleIntensityD = BatchRandScaleIntensityDict = BatchRandScaleIntensityd
+BatchRandShiftIntensityD = BatchRandShiftIntensityDict = BatchRandShiftIntensityd
+BatchRandGaussianNoiseD = BatchRandGaussianNoiseDict = BatchRandGaussianNoised
+BatchRandAffineD = BatchRandAffineDict = BatchRandAffined
+BatchRandElasticD = BatchRandElasticDict = BatchRandElasticd
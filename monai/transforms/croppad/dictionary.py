@@ -17,8 +17,10 @@ Class names are ended with 'd' to denote dictionary-based transforms.
 
 from typing import Union, Optional, Callable, Iterable
 
+import numpy as np
+
 from monai.config.type_definitions import KeysCollection, IndexSelection
-from monai.data.utils import get_random_patch, get_valid_patch_size
+from monai.data.utils import STACKED_KEYS, get_random_patch, get_valid_patch_size
 from monai.transforms.compose import MapTransform, Randomizable
 from monai.transforms.croppad.array import SpatialCrop, CenterSpatialCrop, SpatialPad
 from monai.transforms.utils import generate_pos_neg_label_crop_centers, generate_spatial_bounding_box
@@ -212,6 +214,14 @@ class RandCropByPosNegLabeld(Randomizable, MapTransform):
             the negative sample(background) center. so the crop center will only exist on valid image area.
         image_threshold: if enabled image_key, use ``image > image_threshold`` to determine
             the valid image content area.
+        fg_indices_key: if provided and in the data, the precomputed foreground indices
+            (see :py:class:`monai.transforms.FgBgToIndicesd`) are used instead of scanning the label,
+            `bg_indices_key` must be provided too. The indices are not copied into the output dictionaries.
+        bg_indices_key: if provided and in the data, the precomputed background indices.
+        batched: if True, return a single dictionary instead of a list, the crops of every key in `keys` are
+            written into one preallocated array of shape (num_samples, C, *size), and the keys of the stacked
+            arrays are listed in ``monai.data.utils.STACKED_KEYS``, so that :py:func:`monai.data.list_data_collate`
+            concatenates them without stacking the crops again. This should be the last transform of the chain.
     """
 
     def __init__(
@@ -224,6 +234,9 @@ class RandCropByPosNegLabeld(Randomizable, MapTransform):
         num_samples: int = 1,
         image_key: Optional[str] = None,
         image_threshold: float = 0.0,
+        fg_indices_key: Optional[str] = None,
+        bg_indices_key: Optional[str] = None,
+        batched: bool = False,
     ):
         super().__init__(keys)
         assert isinstance(label_key, str), "label_key must be a string."
@@ -241,31 +254,67 @@ class RandCropByPosNegLabeld(Randomizable, MapTransform):
         self.num_samples = num_samples
         self.image_key = image_key
         self.image_threshold = image_threshold
+        self.fg_indices_key = fg_indices_key
+        self.bg_indices_key = bg_indices_key
+        self.batched = batched
         self.centers = None
 
-    def randomize(self, label, image):
+    def randomize(self, label, image, fg_indices=None, bg_indices=None):
         self.centers = generate_pos_neg_label_crop_centers(
-            label, self.size, self.num_samples, self.pos_ratio, image, self.image_threshold, self.R
+            label,
+            self.size,
+            self.num_samples,
+            self.pos_ratio,
+            image,
+            self.image_threshold,
+            self.R,
+            fg_indices,
+            bg_indices,
         )
 
     def __call__(self, data):
         d = dict(data)
         label = d[self.label_key]
         image = d[self.image_key] if self.image_key else None
-        self.randomize(label, image)
+        fg_indices = d.get(self.fg_indices_key) if self.fg_indices_key else None
+        bg_indices = d.get(self.bg_indices_key) if self.bg_indices_key else None
+        self.randomize(label, image, fg_indices, bg_indices)
+        # the crop starts of all the centers, clamped in the image
+        size = np.asarray(self.size)
+        starts = np.asarray(self.centers, dtype=np.int64).reshape((-1, len(size))) - size // 2
+        starts = np.clip(starts, 0, np.asarray(label.shape[1:]) - size)
+        slices = [(slice(None),) + tuple(slice(s, s + w) for s, w in zip(start, size)) for start in starts]
+        if self.batched:
+            return self._stacked_crops(d, slices)
         results = [dict() for _ in range(self.num_samples)]
         for key in data.keys():
+            if key in (self.fg_indices_key, self.bg_indices_key):
+                continue
             if key in self.keys:
                 img = d[key]
-                for i, center in enumerate(self.centers):
-                    cropper = SpatialCrop(roi_center=tuple(center), roi_size=self.size)
-                    results[i][key] = cropper(img)
+                for i, crop_slices in enumerate(slices):
+                    results[i][key] = img[crop_slices]
             else:
                 for i in range(self.num_samples):
                     results[i][key] = data[key]
 
         return results
 
+    def _stacked_crops(self, d, slices):
+        """
+        Write the crops of every key into a preallocated (num_samples, C, *size) array.
+        """
+        for key in (self.fg_indices_key, self.bg_indices_key):
+            d.pop(key, None)
+        stacked_keys = [key for key in self.keys if key in d]
+        for key in stacked_keys:
+            img = d[key]
+            output = np.empty((len(slices), img.shape[0]) + tuple(self.size), dtype=img.dtype)
+            for i, crop_slices in enumerate(slices):
+                output[i] = img[crop_slices]
+            d[key] = output
+        d[STACKED_KEYS] = stacked_keys
+        return d
 
 SpatialPadD = SpatialPadDict = SpatialPadd
 SpatialCropD = SpatialCropDict = SpatialCropd
@@ -176,23 +176,42 @@ class NormalizeIntensity(Transform):
         self.nonzero = nonzero
         self.channel_wise = channel_wise
 
-    def _normalize(self, img):
-        slices = (img != 0) if self.nonzero else np.ones(img.shape, dtype=np.bool_)
-        if np.any(slices):
-            if self.subtrahend is not None and self.divisor is not None:
-                img[slices] = (img[slices] - self.subtrahend[slices]) / self.divisor[slices]
-            else:
-                img[slices] = (img[slices] - np.mean(img[slices])) / np.std(img[slices])
-        return img
+    def _normalize(self, img, out):
+        if self.nonzero:
+            out[...] = img
+            slices = img != 0
+            if np.any(slices):
+                if self.subtrahend is not None and self.divisor is not None:
+                    out[slices] = (img[slices] - self.subtrahend[slices]) / self.divisor[slices]
+                else:
+                    values = img[slices]
+                    out[slices] = (values - np.mean(values)) / np.std(values)
+            return out
+        if self.subtrahend is not None and self.divisor is not None:
+            subtrahend, divisor = self.subtrahend, self.divisor
+        else:
+            subtrahend, divisor = np.mean(img), np.std(img)
+        if np.issubdtype(out.dtype, np.floating):
+            # compute into `out` directly, without the temporary arrays
+            np.subtract(img, subtrahend, out=out, casting="unsafe")
+            np.divide(out, divisor, out=out, casting="unsafe")
+        else:
+            out[...] = (img - subtrahend) / divisor
+        return out
 
     def __call__(self, img):
+        """
+        Normalize `img` into a new array of the same dtype, `img` is not modified
+        (it may be a view of the cached data).
+        """
+        img = np.asarray(img)
+        out = np.empty_like(img)
         if self.channel_wise:
             for i, d in enumerate(img):
-                img[i] = self._normalize(d)
+                self._normalize(d, out[i])
         else:
-            img = self._normalize(img)
-
-        return img
+            self._normalize(img, out)
+        return out
 
 
 class ThresholdIntensity(Transform):
@@ -13,6 +13,10 @@ A collection of "vanilla" transforms for IO functions
 https://github.com/Project-MONAI/MONAI/wiki/MONAI_Design
 """
 
+import io
+import os
+import threading
+from collections import OrderedDict
 from typing import Optional
 
 import numpy as np
@@ -20,27 +24,66 @@ import nibabel as nib
 from PIL import Image
 from torch.utils.data._utils.collate import np_str_obj_array_pattern
 
+from monai.data.gzip_index import open_indexed_gzip, read_indexed_gzip
+from monai.data.lazy_array import LazyArray
 from monai.data.utils import correct_nifti_header_if_necessary
 from monai.transforms.compose import Transform
 from monai.utils.misc import ensure_tuple
 
 
+def _nifti_header_size(fileobj) -> int:
+    """
+    Read the `sizeof_hdr` field of a Nifti file object in either byte order, 348 for Nifti1 or 540 for Nifti2.
+    """
+    data = fileobj.read(4)
+    fileobj.seek(0)
+    return min(int.from_bytes(data, "little"), int.from_bytes(data, "big"))
+
+
 class LoadNifti(Transform):
     """
     Load Nifti format file or files from provided path. If loading a list of
     files, stack them together and add a new dimension as first dimension, and
     use the meta data of the first image to represent the stacked result. Note
     that the affine transform of all the images should be same if ``image_only=False``.
+
+    The data array is not copied if no conversion is needed: when the image has no scaling (slope 1 and
+    intercept 0) and `dtype` is None or the on-disk data type, the array of an uncompressed file is memory-mapped
+    in copy-on-write mode (see `nibabel.load`). The stacked images are written into a single preallocated array.
+    The header dictionaries are cached by the path and modification time of the files.
     """
 
+    header_cache_size = 1024
+    _header_cache: OrderedDict = OrderedDict()
+    _header_cache_lock = threading.Lock()
+
     def __init__(
-        self, as_closest_canonical: bool = False, image_only: bool = False, dtype: Optional[np.dtype] = np.float32
+        self,
+        as_closest_canonical: bool = False,
+        image_only: bool = False,
+        dtype: Optional[np.dtype] = np.float32,
+        lazy: bool = False,
+        gzip_index: bool = False,
+        gzip_index_dir=None,
+        gzip_workers: int = 1,
     ):
         """
         Args:
             as_closest_canonical: if True, load the image as closest to canonical axis format.
             image_only: if True return only the image volume, otherwise return image data array and header dict.
-            dtype (np.dtype, optional): if not None convert the loaded image to this data type.
+            dtype (np.dtype, optional): if not None convert the loaded image to this data type,
+                if None keep the on-disk data type of the images without scaling, or float64 if scaled.
+            lazy: if True, return a :py:class:`monai.data.LazyArray` proxy of the image data instead of
+                loading the data, so that the following crop transforms only read the region of interest from
+                the file. Only supported when loading a single file and `as_closest_canonical` is False,
+                otherwise the data is loaded as usual.
+            gzip_index: if True, read the `.gz` files with the persistent seek-point indexes of
+                :py:func:`monai.data.open_indexed_gzip`, requires the `indexed_gzip` package. The lazy proxies
+                only decompress the chunks covering the cropped region, the other images are decompressed
+                by `gzip_workers` threads.
+            gzip_index_dir (str or Path or None): the folder of the index files, if None the index files are
+                beside the images.
+            gzip_workers: the number of threads to decompress a whole `.gz` file with `gzip_index`.
 
         Note:
             The transform returns image data array if `image_only` is True,
@@ -54,6 +97,10 @@ class LoadNifti(Transform):
         self.as_closest_canonical = as_closest_canonical
         self.image_only = image_only
         self.dtype = dtype
+        self.lazy = lazy
+        self.gzip_index = gzip_index
+        self.gzip_index_dir = gzip_index_dir
+        self.gzip_workers = gzip_workers
 
     def __call__(self, filename):
         """
@@ -61,12 +108,13 @@ class LoadNifti(Transform):
             filename (str, list, tuple, file): path file or file-like object or a list of files.
         """
         filename = ensure_tuple(filename)
-        img_array = list()
+        images = list()
         compatible_meta = dict()
+        lazy = self.lazy and len(filename) == 1 and not self.as_closest_canonical
         for name in filename:
-            img = nib.load(name)
+            img = self._load_image(name, lazy)
             img = correct_nifti_header_if_necessary(img)
-            header = dict(img.header)
+            header = self._header_dict(name, img)
             header["filename_or_obj"] = name
             header["affine"] = img.affine
             header["original_affine"] = img.affine.copy()
@@ -79,8 +127,7 @@ class LoadNifti(Transform):
                 img = nib.as_closest_canonical(img)
                 header["affine"] = img.affine
 
-            img_array.append(np.array(img.get_fdata(dtype=self.dtype)))
-            img.uncache()
+            images.append(img)
 
             if self.image_only:
                 continue
@@ -101,11 +148,82 @@ class LoadNifti(Transform):
                     header["affine"], compatible_meta["affine"]
                 ), "affine data of all images should be same."
 
-        img_array = np.stack(img_array, axis=0) if len(img_array) > 1 else img_array[0]
+        if lazy:
+            fileobj = images[0].file_map["image"].fileobj
+            img_array = LazyArray(images[0].dataobj, self._output_dtype(images[0]), fileobj=fileobj)
+        elif len(images) == 1:
+            img_array = self._get_data(images[0])
+        else:
+            img_array = np.empty((len(images),) + images[0].shape, dtype=self._output_dtype(images[0]))
+            for i, img in enumerate(images):
+                # numpy casts the (memory-mapped) data into the output buffer without intermediate copies
+                img_array[i] = np.asanyarray(img.dataobj)
         if self.image_only:
             return img_array
         return img_array, compatible_meta
 
+    def _load_image(self, name, lazy: bool):
+        if not (self.gzip_index and isinstance(name, (str, os.PathLike)) and os.fspath(name).endswith(".gz")):
+            return nib.load(name)
+        if lazy:
+            fileobj = open_indexed_gzip(name, self.gzip_index_dir)
+        else:
+            fileobj = io.BytesIO(read_indexed_gzip(name, self.gzip_index_dir, self.gzip_workers))
+        fileobj.seek(0)
+        image_class = nib.Nifti2Image if _nifti_header_size(fileobj) == 540 else nib.Nifti1Image
+        file_holder = nib.FileHolder(filename=os.fspath(name), fileobj=fileobj)
+        return image_class.from_file_map({"header": file_holder, "image": file_holder})
+
+    @classmethod
+    def _header_dict(cls, name, img):
+        """
+        Return a copy of `dict(img.header)`, cached by the path and the modification time of the file.
+        """
+        if not isinstance(name, (str, os.PathLike)):
+            return dict(img.header)
+        stat = os.stat(name)
+        key = (os.fspath(name), stat.st_mtime_ns, stat.st_size)
+        with cls._header_cache_lock:
+            header = cls._header_cache.get(key)
+            if header is not None:
+                cls._header_cache.move_to_end(key)
+        if header is None:
+            header = dict(img.header)
+            with cls._header_cache_lock:
+                cls._header_cache[key] = header
+                while len(cls._header_cache) > cls.header_cache_size:
+                    cls._header_cache.popitem(last=False)
+        return dict(header)
+
+    @staticmethod
+    def _is_scaled(img) -> bool:
+        return getattr(img.dataobj, "slope", 1.0) != 1.0 or getattr(img.dataobj, "inter", 0.0) != 0.0
+
+    @staticmethod
+    def _disk_dtype(img):
+        dataobj = img.dataobj
+        return dataobj.dtype if isinstance(dataobj, np.ndarray) else img.get_data_dtype()
+
+    def _output_dtype(self, img):
+        if self.dtype is not None:
+            return np.dtype(self.dtype)
+        if self._is_scaled(img):
+            return np.dtype(np.float64)
+        # the arrays in the native byte order are compatible with torch
+        return np.dtype(self._disk_dtype(img)).newbyteorder("=")
+
+    def _get_data(self, img):
+        """
+        Load the data array of `img`, without copying the data if no conversion is needed.
+        """
+        dtype = self._output_dtype(img)
+        if not self._is_scaled(img) and dtype == self._disk_dtype(img):
+            return np.asanyarray(img.dataobj)
+        if np.issubdtype(dtype, np.floating):
+            # scale in the output precision, don't keep the cache of nibabel
+            return img.get_fdata(dtype=dtype, caching="unchanged")
+        return np.asanyarray(img.dataobj).astype(dtype)
+
 
 class LoadPNG(Transform):
     """
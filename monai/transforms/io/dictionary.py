@@ -41,6 +41,10 @@ class LoadNiftid(MapTransform):
         dtype: Optional[np.dtype] = np.float32,
         meta_key_postfix: str = "meta",
         overwriting: bool = False,
+        lazy: bool = False,
+        gzip_index: bool = False,
+        gzip_index_dir=None,
+        gzip_workers: int = 1,
     ):
         """
         Args:
@@ -53,9 +57,16 @@ class LoadNiftid(MapTransform):
                 For example, load nifti file for `image`, store the metadata into `image_meta`.
             overwriting (bool): whether allow to overwrite existing meta data of same key.
                 default is False, which will raise exception if encountering existing key.
+            lazy: if True, the images are :py:class:`monai.data.LazyArray` proxies read by the following
+                crop transforms, see also: :py:class:`monai.transforms.LoadNifti`.
+            gzip_index: if True, read the `.gz` files with the persistent seek-point indexes,
+                see also: :py:class:`monai.transforms.LoadNifti`.
+            gzip_index_dir (str or Path or None): the folder of the index files, if None the index files are
+                beside the images.
+            gzip_workers: the number of threads to decompress a whole `.gz` file with `gzip_index`.
         """
         super().__init__(keys)
-        self.loader = LoadNifti(as_closest_canonical, False, dtype)
+        self.loader = LoadNifti(as_closest_canonical, False, dtype, lazy, gzip_index, gzip_index_dir, gzip_workers)
         if not isinstance(meta_key_postfix, str):
             raise ValueError("meta_key_postfix must be a string.")
         self.meta_key_postfix = meta_key_postfix
@@ -13,6 +13,7 @@ A collection of "vanilla" transforms for spatial operations
 https://github.com/Project-MONAI/MONAI/wiki/MONAI_Design
 """
 
+import functools
 import warnings
 from typing import List, Optional, Union
 
@@ -24,14 +25,16 @@ import torch
 from monai.config import get_torch_version_tuple
 from monai.data.utils import InterpolationCode, compute_shape_offset, to_affine_nd, zoom_affine
 from monai.networks.layers import AffineTransform, GaussianFilter
-from monai.transforms.compose import Randomizable, Transform
+from monai.transforms.compose import LazyTransform, Randomizable, Transform
 from monai.transforms.utils import (
+    PendingAffine,
     create_control_grid,
     create_grid,
     create_rotate,
     create_scale,
     create_shear,
     create_translate,
+    evaluate_pending,
 )
 from monai.utils.misc import ensure_tuple, ensure_tuple_rep, ensure_tuple_size
 
@@ -45,9 +48,147 @@ else:
     _torch_interp = torch.nn.functional.interpolate
 
 
-class Spacing(Transform):
+def _as_pending(img) -> PendingAffine:
+    return img if isinstance(img, PendingAffine) else PendingAffine(img)
+
+
+def _interp_matrix(in_shape, out_shape, align_corners: Optional[bool]) -> np.ndarray:
+    """
+    The voxel matrix of resizing `in_shape` to `out_shape` by `torch.nn.functional.interpolate`.
+    """
+    in_shape, out_shape = np.asarray(in_shape, dtype=np.float64), np.asarray(out_shape, dtype=np.float64)
+    matrix = np.eye(len(in_shape) + 1)
+    if align_corners:
+        scale = np.where(out_shape > 1, (in_shape - 1.0) / np.maximum(out_shape - 1.0, 1.0), 0.0)
+        np.fill_diagonal(matrix[:-1, :-1], scale)
+        return matrix
+    scale = in_shape / out_shape
+    np.fill_diagonal(matrix[:-1, :-1], scale)
+    matrix[:-1, -1] = 0.5 * scale - 0.5
+    return matrix
+
+
+# the `scipy.ndimage` modes supported by the torch backend of `Rotate`, and the `grid_sample` padding modes,
+# the 'constant' mode samples the border values and then fills the coordinates out of the input
+_TORCH_ROTATE_PADDING = {"constant": "border", "nearest": "border", "mirror": "reflection"}
+
+
+def _inside_mask(matrix: np.ndarray, in_shape, out_shape, tol: float = 1e-6) -> np.ndarray:
+    """
+    The mask of the output voxels mapped by the voxel `matrix` into the extent of the input voxels.
+    """
+    indices = np.ogrid[tuple(slice(0, int(d)) for d in out_shape)]
+    mask = np.ones(tuple(int(d) for d in out_shape), dtype=bool)
+    for j, dim in enumerate(in_shape):
+        coord = matrix[j, -1] + sum(matrix[j, k] * idx for k, idx in enumerate(indices))
+        mask &= (coord > -tol) & (coord < dim - 1.0 + tol)
+    return mask
+
+
+@functools.lru_cache(maxsize=8)
+def _gaussian_filter(spatial_dims: int, sigma: float, truncated: float, device=None) -> GaussianFilter:
+    """
+    The Gaussian filters memoized by the parameters, the kernels are not trainable.
+    Only for the fixed sigmas, the sigmas drawn from a continuous range would never hit the cache.
+    """
+    return GaussianFilter(spatial_dims, sigma, truncated).to(device=device)
+
+
+def _grid_voxel_matrix(affine, in_shape, spatial_size) -> np.ndarray:
+    """
+    The voxel matrix equivalent to resampling an image of `in_shape` by :py:class:`Resample`
+    with the grid ``affine @ create_grid(spatial_size)``.
+    """
+    sr = len(spatial_size)
+    center = np.eye(sr + 1)
+    center[:sr, -1] = -(np.asarray(spatial_size, dtype=np.float64) - 1.0) / 2.0
+    in_shape = np.asarray(in_shape, dtype=np.float64)
+    # `Resample` normalizes the grid by `2 / (dim - 1)` and samples with `align_corners=False`
+    uncenter = np.diag(list(in_shape / np.maximum(in_shape - 1.0, 1.0)) + [1.0])
+    uncenter[:sr, -1] = (in_shape - 1.0) / 2.0
+    return uncenter @ np.asarray(affine, dtype=np.float64) @ center
+
+
+def _axis_aligned(matrix: np.ndarray, tol: float = 1e-6):
+    """
+    Decompose the voxel `matrix` into an axis permutation, per axis scales and offsets, if it doesn't
+    rotate or shear. ``perm[k]`` is the output axis sampling the input axis `k` at
+    ``scale[k] * output_index + offset[k]``. Returns None if the matrix is not axis aligned.
+    """
+    sr = matrix.shape[0] - 1
+    linear = matrix[:sr, :sr]
+    nonzero = np.abs(linear) > tol
+    if not np.all(nonzero.sum(0) == 1) or not np.all(nonzero.sum(1) == 1):
+        return None
+    perm = np.argmax(nonzero, axis=1)
+    return perm, linear[np.arange(sr), perm], matrix[:sr, sr]
+
+
+def _resample_axis(data: np.ndarray, axis: int, coords: np.ndarray, mode: str, padding_mode: str, dtype):
+    """
+    Resample `data` along `axis` at the voxel coordinates `coords`, with the same interpolation and padding
+    as ``grid_sample`` with ``align_corners=True``. The nearest neighbour interpolation gathers the values
+    without the type conversion.
+    """
+    n = data.shape[axis]
+    if padding_mode == "reflection":
+        if n > 1:
+            period = 2.0 * (n - 1)
+            coords = np.abs(coords) % period
+            coords = np.where(coords > n - 1, period - coords, coords)
+        else:
+            coords = np.zeros_like(coords)
+    elif padding_mode == "border":
+        coords = np.clip(coords, 0, n - 1)
+    shape = [1] * data.ndim
+    shape[axis] = -1
+    if mode == "nearest":
+        index = np.rint(coords).astype(np.int64)
+        valid = (index >= 0) & (index <= n - 1)
+        output = np.take(data, np.clip(index, 0, n - 1), axis=axis)
+        if not np.all(valid):
+            output = output * valid.reshape(shape).astype(output.dtype)
+        return output
+    index = np.floor(coords).astype(np.int64)
+    weight = (coords - index).astype(dtype)
+    weights = [1 - weight, weight]
+    output = None
+    for i in range(2):
+        valid = (index + i >= 0) & (index + i <= n - 1)
+        w = (weights[i] * valid).reshape(shape)
+        value = np.take(data, np.clip(index + i, 0, n - 1), axis=axis).astype(dtype, copy=False) * w
+        output = value if output is None else output + value
+    return output
+
+
+def _separable_resample(data: np.ndarray, matrix: np.ndarray, spatial_size, mode: str, padding_mode: str, dtype):
+    """
+    Resample the channel-first `data` by the axis aligned voxel `matrix` (see :py:func:`_axis_aligned`)
+    axis by axis, the same as :py:class:`monai.networks.layers.AffineTransform` with
+    ``normalized=False, align_corners=True, reverse_indexing=True``.
+    Returns None if the matrix or the interpolation mode is not supported.
+    """
+    aligned = _axis_aligned(matrix)
+    if aligned is None or mode not in ("nearest", "bilinear") or padding_mode not in ("zeros", "border", "reflection"):
+        return None
+    perm, scale, offset = aligned
+    # resample the axes shrinking the most first
+    ratios = [spatial_size[perm[k]] / data.shape[k + 1] for k in range(len(perm))]
+    for k in np.argsort(ratios, kind="stable"):
+        coords = scale[k] * np.arange(spatial_size[perm[k]], dtype=np.float64) + offset[k]
+        data = _resample_axis(data, int(k) + 1, coords, mode, padding_mode, dtype)
+    inverse = np.argsort(perm)
+    return data.transpose([0] + [int(k) + 1 for k in inverse])
+
+
+class Spacing(LazyTransform, Transform):
     """
     Resample input image into the specified `pixdim`.
+
+    When the voxel transform only scales, translates, flips or permutes the axes (for example,
+    ``diagonal=True`` with an input affine without rotation), the data are resampled axis by axis
+    in float32 (float64 if the input or `dtype` is float64), and the nearest neighbour
+    interpolation gathers the values without converting the data type.
     """
 
     def __init__(
@@ -100,40 +241,28 @@ class Spacing(Transform):
         Returns:
             data_array (resampled into `self.pixdim`), original pixdim, current pixdim.
         """
-        sr = data_array.ndim - 1
-        if sr <= 0:
-            raise ValueError("the array should have at least one spatial dimension.")
-        if affine is None:
-            # default to identity
-            affine = np.eye(sr + 1, dtype=np.float64)
-            affine_ = np.eye(sr + 1, dtype=np.float64)
-        else:
-            affine_ = to_affine_nd(sr, affine)
-        out_d = self.pixdim[:sr]
-        if out_d.size < sr:
-            out_d = np.append(out_d, [1.0] * (out_d.size - sr))
-        if np.any(out_d <= 0):
-            raise ValueError(f"pixdim must be positive, got {out_d}")
-        # compute output affine, shape and offset
-        new_affine = zoom_affine(affine_, out_d, diagonal=self.diagonal)
-        output_shape, offset = compute_shape_offset(data_array.shape[1:], affine_, new_affine)
-        new_affine[:sr, -1] = offset[:sr]
-        transform = np.linalg.inv(affine_) @ new_affine
-        # adapt to the actual rank
-        transform_ = to_affine_nd(sr, transform)
+        affine, new_affine, transform_, output_shape = self._compute_transform(data_array.shape[1:], affine)
         _dtype = dtype or self.dtype or np.float32
 
         # no resampling if it's identity transform
         if np.allclose(transform_, np.diag(np.ones(len(transform_))), atol=1e-3):
             output_data = data_array.copy().astype(_dtype)
-            new_affine = to_affine_nd(affine, new_affine)
             return output_data, affine, new_affine
 
+        # the axis aligned transforms are resampled axis by axis
+        _interp_order, _mode = interp_order or self.interp_order, mode or self.mode
+        compute_dtype = np.float64 if np.float64 in (data_array.dtype, np.dtype(_dtype)) else np.float32
+        output_data = _separable_resample(
+            np.asarray(data_array), transform_, output_shape, _interp_order, _mode, compute_dtype
+        )
+        if output_data is not None:
+            return np.ascontiguousarray(output_data.astype(_dtype, copy=False)), affine, new_affine
+
         # resample
         affine_xform = AffineTransform(
             normalized=False,
-            mode=interp_order or self.interp_order,
-            padding_mode=mode or self.mode,
+            mode=_interp_order,
+            padding_mode=_mode,
             align_corners=True,
             reverse_indexing=True,
         )
@@ -143,11 +272,58 @@ class Spacing(Transform):
             spatial_size=output_shape,
         )
         output_data = output_data.squeeze(0).detach().cpu().numpy().astype(_dtype)
-        new_affine = to_affine_nd(affine, new_affine)
         return output_data, affine, new_affine
 
+    def lazy_call(
+        self,
+        data_array,
+        affine=None,
+        interp_order: Optional[str] = None,
+        mode: Optional[str] = None,
+        dtype: Optional[np.dtype] = None,
+    ):
+        """
+        The same as ``__call__``, but `data_array` is returned as a :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        affine, new_affine, transform_, output_shape = self._compute_transform(data_array.shape[1:], affine)
+        output_data = _as_pending(data_array).then(
+            transform_,
+            output_shape,
+            mode=interp_order or self.interp_order,
+            padding_mode=mode or self.mode,
+            dtype=dtype or self.dtype or np.float32,
+        )
+        return output_data, affine, new_affine
+
+    def _compute_transform(self, spatial_shape, affine):
+        """
+        Compute the original affine, the output affine, the voxel matrix and the output spatial shape.
+        """
+        sr = len(spatial_shape)
+        if sr <= 0:
+            raise ValueError("the array should have at least one spatial dimension.")
+        if affine is None:
+            # default to identity
+            affine = np.eye(sr + 1, dtype=np.float64)
+            affine_ = np.eye(sr + 1, dtype=np.float64)
+        else:
+            affine_ = to_affine_nd(sr, affine)
+        out_d = self.pixdim[:sr]
+        if out_d.size < sr:
+            out_d = np.append(out_d, [1.0] * (out_d.size - sr))
+        if np.any(out_d <= 0):
+            raise ValueError(f"pixdim must be positive, got {out_d}")
+        # compute output affine, shape and offset
+        new_affine = zoom_affine(affine_, out_d, diagonal=self.diagonal)
+        output_shape, offset = compute_shape_offset(spatial_shape, affine_, new_affine)
+        new_affine[:sr, -1] = offset[:sr]
+        transform = np.linalg.inv(affine_) @ new_affine
+        # adapt to the actual rank
+        transform_ = to_affine_nd(sr, transform)
+        return affine, to_affine_nd(affine, new_affine), transform_, output_shape
+
 
-class Orientation(Transform):
+class Orientation(LazyTransform, Transform):
     """
     Change the input image's orientation into the specified based on `axcodes`.
     """
@@ -183,9 +359,37 @@ class Orientation(Transform):
             data_array (ndarray): in shape (num_channels, H[, W, ...]).
             affine (matrix): (N+1)x(N+1) original affine matrix for spatially ND `data_array`. Defaults to identity.
         Returns:
-            data_array (reoriented in `self.axcodes`), original axcodes, current axcodes.
+            data_array (reoriented in `self.axcodes`, a view of the input array), original axcodes, current axcodes.
+        """
+        affine, affine_, spatial_ornt = self._compute_ornt(data_array.ndim - 1, affine)
+        shape = data_array.shape[1:]
+        # the same as `nib.orientations.apply_orientation` skipping the channel dim, the output is a view
+        flips = [i + 1 for i, flip in enumerate(spatial_ornt[:, 1]) if flip == -1]
+        if flips:
+            data_array = np.flip(data_array, flips)
+        data_array = np.transpose(data_array, [0] + [int(i) + 1 for i in np.argsort(spatial_ornt[:, 0])])
+        new_affine = affine_ @ nib.orientations.inv_ornt_aff(spatial_ornt, shape)
+        new_affine = to_affine_nd(affine, new_affine)
+        return data_array, affine, new_affine
+
+    def lazy_call(self, data_array, affine=None):
+        """
+        The same as ``__call__``, but `data_array` is returned as a :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        affine, affine_, spatial_ornt = self._compute_ornt(data_array.ndim - 1, affine)
+        shape = data_array.shape[1:]
+        matrix = nib.orientations.inv_ornt_aff(spatial_ornt, shape)
+        output_shape = [0] * len(shape)
+        for i, (axis, _) in enumerate(spatial_ornt):
+            output_shape[int(axis)] = shape[i]
+        data_array = _as_pending(data_array).then(matrix, output_shape)
+        new_affine = to_affine_nd(affine, affine_ @ matrix)
+        return data_array, affine, new_affine
+
+    def _compute_ornt(self, sr: int, affine):
+        """
+        Compute the original affine, the spatially `sr`-D affine and the orientation transform.
         """
-        sr = data_array.ndim - 1
         if sr <= 0:
             raise ValueError("the array should have at least one spatial dimension.")
         if affine is None:
@@ -204,17 +408,10 @@ class Orientation(Transform):
                     f' given the data array is in spatial {sr}D, got "{self.axcodes}"'
                 )
             spatial_ornt = nib.orientations.ornt_transform(src, dst)
-        ornt = spatial_ornt.copy()
-        ornt[:, 0] += 1  # skip channel dim
-        ornt = np.concatenate([np.array([[0, 1]]), ornt])
-        shape = data_array.shape[1:]
-        data_array = nib.orientations.apply_orientation(data_array, ornt)
-        new_affine = affine_ @ nib.orientations.inv_ornt_aff(spatial_ornt, shape)
-        new_affine = to_affine_nd(affine, new_affine)
-        return data_array, affine, new_affine
+        return affine, affine_, spatial_ornt
 
 
-class Flip(Transform):
+class Flip(LazyTransform, Transform):
     """Reverses the order of elements along the given spatial axis. Preserves shape.
     Uses ``np.flip`` in practice. See numpy.flip for additional details.
     https://docs.scipy.org/doc/numpy/reference/generated/numpy.flip.html
@@ -230,14 +427,30 @@ class Flip(Transform):
         """
         Args:
             img (ndarray): channel first array, must have shape: (num_channels, H[, W, ..., ]),
+
+        Returns:
+            a view of `img` with the reversed spatial axes.
         """
-        flipped = list()
-        for channel in img:
-            flipped.append(np.flip(channel, self.spatial_axis))
-        return np.stack(flipped).astype(img.dtype)
+        if self.spatial_axis is None:
+            axes = list(range(1, img.ndim))
+        else:
+            axes = [i + 1 if i >= 0 else i for i in ensure_tuple(self.spatial_axis)]
+        return np.flip(img, axes)
 
+    def lazy_call(self, img):
+        """
+        The same as ``__call__``, but the output is a :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        shape = img.shape[1:]
+        axes = range(len(shape)) if self.spatial_axis is None else ensure_tuple(self.spatial_axis)
+        matrix = np.eye(len(shape) + 1)
+        for axis in axes:
+            axis = axis % len(shape)
+            matrix[axis, axis], matrix[axis, -1] = -1.0, shape[axis] - 1.0
+        return _as_pending(img).then(matrix, shape)
 
-class Resize(Transform):
+
+class Resize(LazyTransform, Transform):
     """
     Resize the input image to given spatial size.
     Implemented using :py:class:`torch.nn.functional.interpolate`.
@@ -273,7 +486,7 @@ class Resize(Transform):
                 f"got {output_ndim} and {input_ndim}."
             )
         resized = _torch_interp(
-            input=torch.as_tensor(img[None], dtype=torch.float),
+            input=torch.as_tensor(np.ascontiguousarray(img)[None], dtype=torch.float),
             size=self.spatial_size,
             mode=interp_order or self.interp_order,
             align_corners=self.align_corners,
@@ -281,11 +494,23 @@ class Resize(Transform):
         resized = resized.squeeze(0).detach().cpu().numpy()
         return resized
 
+    def lazy_call(self, img, interp_order: Optional[str] = None):
+        """
+        The same as ``__call__``, but the output is a :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        if len(self.spatial_size) != img.ndim - 1:
+            return self(evaluate_pending(img), interp_order=interp_order)
+        matrix = _interp_matrix(img.shape[1:], self.spatial_size, self.align_corners)
+        return _as_pending(img).then(matrix, self.spatial_size, mode=interp_order or self.interp_order)
+
 
-class Rotate(Transform):
+class Rotate(LazyTransform, Transform):
     """
-    Rotates an input image by given angle. Uses scipy.ndimage.rotate. For more details, see
-    https://docs.scipy.org/doc/scipy/reference/generated/scipy.ndimage.rotate.html
+    Rotates an input image by given angle. The nearest and linear interpolations (`interp_order` 0 and 1) with
+    the 'constant', 'nearest' and 'mirror' modes are computed for all the channels at once by
+    :py:class:`monai.networks.layers.AffineTransform`, with the same output shape and boundary handling
+    of ``scipy.ndimage.rotate``. The other options use ``scipy.ndimage.rotate`` channel by channel.
+    For more details, see https://docs.scipy.org/doc/scipy/reference/generated/scipy.ndimage.rotate.html
 
     Args:
         angle: Rotation angle in degrees.
@@ -296,7 +521,7 @@ class Rotate(Transform):
         interp_order: Order of spline interpolation. Range 0-5. Default: InterpolationCode.LINEAR. This is
             different from scipy where default interpolation is InterpolationCode.SPLINE3.
         mode: Points outside boundary filled according to this mode. Options are
-            'constant', 'nearest', 'reflect', 'wrap'. Default: 'constant'.
+            'constant', 'nearest', 'reflect', 'mirror', 'wrap'. Default: 'constant'.
         cval: Values to fill outside boundary. Default: 0.
         prefilter: Apply spline_filter before interpolation. Default: True.
     """
@@ -331,6 +556,11 @@ class Rotate(Transform):
         Args:
             img (ndarray): channel first array, must have shape: (num_channels, H[, W, ..., ]),
         """
+        order = self.interp_order if order is None else order
+        mode = mode or self.mode
+        cval = self.cval if cval is None else cval
+        if int(order) in (0, 1) and mode in _TORCH_ROTATE_PADDING and img.ndim in (3, 4):
+            return self._rotate_torch(img, int(order), mode, cval)
         rotated = list()
         for channel in img:
             rotated.append(
@@ -339,16 +569,80 @@ class Rotate(Transform):
                     angle=self.angle,
                     axes=self.spatial_axes,
                     reshape=self.reshape,
-                    order=self.interp_order if order is None else order,
-                    mode=mode or self.mode,
-                    cval=self.cval if cval is None else cval,
+                    order=order,
+                    mode=mode,
+                    cval=cval,
                     prefilter=self.prefilter if prefilter is None else prefilter,
                 )
             )
         return np.stack(rotated).astype(img.dtype)
 
+    def lazy_call(self, img, order=None, mode: Optional[str] = None, cval=None, prefilter=None):
+        """
+        The same as ``__call__``, but the output is a :py:class:`monai.transforms.utils.PendingAffine`.
+        The spline orders greater than 0 are approximated by the bilinear interpolation,
+        `cval` and `prefilter` are not used.
+        """
+        matrix, output_shape = self._compute_matrix(img.shape[1:])
+        return _as_pending(img).then(
+            matrix,
+            output_shape,
+            mode=self.interp_order if order is None else order,
+            padding_mode=mode or self.mode,
+            dtype=img.dtype,
+        )
+
+    def _compute_matrix(self, spatial_shape):
+        """
+        Compute the voxel matrix and the output spatial shape, the same as ``scipy.ndimage.rotate``.
+        """
+        shape = np.asarray(spatial_shape)
+        axes = sorted(int(a) % len(shape) for a in self.spatial_axes)
+        angle = np.deg2rad(self.angle)
+        c, s = np.cos(angle), np.sin(angle)
+        rot_matrix = np.array([[c, s], [-s, c]])
+        in_plane_shape = shape[axes]
+        if self.reshape:
+            iy, ix = in_plane_shape
+            out_bounds = rot_matrix @ [[0, 0, iy, iy], [0, ix, 0, ix]]
+            out_plane_shape = (np.ptp(out_bounds, axis=1) + 0.5).astype(int)
+        else:
+            out_plane_shape = in_plane_shape
+        out_center = rot_matrix @ ((out_plane_shape - 1) / 2)
+        in_center = (in_plane_shape - 1) / 2
+        matrix = np.eye(len(shape) + 1)
+        matrix[np.ix_(axes, axes)] = rot_matrix
+        matrix[axes, -1] = in_center - out_center
+        output_shape = shape.copy()
+        output_shape[axes] = out_plane_shape
+        return matrix, output_shape
+
+    def _rotate_torch(self, img, order: int, mode: str, cval: float):
+        """
+        Rotate all the channels of `img` in a single `grid_sample` call.
+        """
+        matrix, output_shape = self._compute_matrix(img.shape[1:])
+        dtype = torch.double if img.dtype == np.float64 else torch.float
+        affine_xform = AffineTransform(
+            normalized=False,
+            mode="nearest" if order == 0 else "bilinear",
+            padding_mode=_TORCH_ROTATE_PADDING[mode],
+            align_corners=True,
+            reverse_indexing=True,
+        )
+        output = affine_xform(
+            torch.as_tensor(np.ascontiguousarray(img), dtype=dtype)[None],
+            torch.as_tensor(matrix, dtype=dtype),
+            spatial_size=output_shape,
+        )
+        output = output[0].numpy()
+        if mode == "constant":
+            # no interpolation beyond the edges of the input, the same as `scipy.ndimage`
+            output[:, ~_inside_mask(matrix, img.shape[1:], output_shape)] = cval
+        return output.astype(img.dtype)
+
 
-class Zoom(Transform):
+class Zoom(LazyTransform, Transform):
     """
     Zooms an ND image using :py:class:`torch.nn.functional.interpolate`.
     For details, please see https://pytorch.org/docs/stable/nn.functional.html#interpolate.
@@ -386,7 +680,7 @@ class Zoom(Transform):
         """
         self.zoom = ensure_tuple_rep(self.zoom, img.ndim - 1)  # match the spatial image dim
         zoomed = _torch_interp(
-            input=torch.as_tensor(img[None], dtype=torch.float),
+            input=torch.as_tensor(np.ascontiguousarray(img)[None], dtype=torch.float),
             scale_factor=list(self.zoom),
             mode=interp_order or self.interp_order,
             align_corners=self.align_corners,
@@ -407,8 +701,28 @@ class Zoom(Transform):
         zoomed = np.pad(zoomed, pad_vec, mode="edge")
         return zoomed[tuple(slice_vec)]
 
-
-class Rotate90(Transform):
+    def lazy_call(self, img, interp_order: Optional[str] = None):
+        """
+        The same as ``__call__``, but the output is a :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        self.zoom = ensure_tuple_rep(self.zoom, img.ndim - 1)  # match the spatial image dim
+        shape = np.asarray(img.shape[1:])
+        zoomed_shape = np.floor(shape * np.asarray(self.zoom, dtype=np.float64)).astype(int)
+        if self.align_corners:
+            matrix = _interp_matrix(shape, zoomed_shape, True)
+        else:
+            # `scale_factor` is used directly by `torch.nn.functional.interpolate`
+            matrix = np.diag(list(1.0 / np.asarray(self.zoom, dtype=np.float64)) + [1.0])
+            matrix[:-1, -1] = 0.5 / np.asarray(self.zoom, dtype=np.float64) - 0.5
+        if not self.keep_size:
+            return _as_pending(img).then(matrix, zoomed_shape, mode=interp_order or self.interp_order)
+        # pad or crop the zoomed image at the center to the original size
+        diff = zoomed_shape - shape
+        matrix[:-1, -1] += matrix[:-1, :-1] @ (np.sign(diff) * (np.abs(diff) // 2))
+        return _as_pending(img).then(matrix, shape, mode=interp_order or self.interp_order, padding_mode="border")
+
+
+class Rotate90(LazyTransform, Transform):
     """
     Rotate an array by 90 degrees in the plane specified by `axes`.
     """
@@ -427,14 +741,31 @@ class Rotate90(Transform):
         """
         Args:
             img (ndarray): channel first array, must have shape: (num_channels, H[, W, ..., ]),
-        """
-        rotated = list()
-        for channel in img:
-            rotated.append(np.rot90(channel, self.k, self.spatial_axes))
-        return np.stack(rotated).astype(img.dtype)
 
+        Returns:
+            a view of `img` rotated in the plane of `spatial_axes`.
+        """
+        axes = [i + 1 if i >= 0 else i for i in self.spatial_axes]
+        return np.rot90(img, self.k, axes)
 
-class RandRotate90(Randomizable, Transform):
+    def lazy_call(self, img):
+        """
+        The same as ``__call__``, but the output is a :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        shape = list(img.shape[1:])
+        a, b = (int(i) % len(shape) for i in self.spatial_axes)
+        matrix = np.eye(len(shape) + 1)
+        for _ in range(self.k % 4):
+            # `np.rot90` by 1 time: output[..., i, ..., j, ...] = input[..., j, ..., shape[b] - 1 - i, ...]
+            rot = np.eye(len(shape) + 1)
+            rot[a, a], rot[a, b] = 0.0, 1.0
+            rot[b, b], rot[b, a], rot[b, -1] = 0.0, -1.0, shape[b] - 1.0
+            matrix = matrix @ rot
+            shape[a], shape[b] = shape[b], shape[a]
+        return _as_pending(img).then(matrix, shape)
+
+
+class RandRotate90(Randomizable, LazyTransform, Transform):
     """
     With probability `prob`, input arrays are rotated by 90 degrees
     in the plane specified by `spatial_axes`.
@@ -468,8 +799,17 @@ class RandRotate90(Randomizable, Transform):
         rotator = Rotate90(self._rand_k, self.spatial_axes)
         return rotator(img)
 
+    def lazy_call(self, img):
+        """
+        The same as ``__call__``, but the output is a :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        self.randomize()
+        if not self._do_transform:
+            return img
+        return Rotate90(self._rand_k, self.spatial_axes).lazy_call(img)
+
 
-class RandRotate(Randomizable, Transform):
+class RandRotate(Randomizable, LazyTransform, Transform):
     """Randomly rotates the input arrays.
 
     Args:
@@ -542,8 +882,24 @@ class RandRotate(Randomizable, Transform):
         )
         return rotator(img)
 
+    def lazy_call(self, img, order=None, mode: Optional[str] = None, cval=None, prefilter=None):
+        """
+        The same as ``__call__``, but the output is a :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        self.randomize()
+        if not self._do_transform:
+            return img
+        rotator = Rotate(
+            angle=self.angle,
+            spatial_axes=self.spatial_axes,
+            reshape=self.reshape,
+            interp_order=self.interp_order if order is None else order,
+            mode=mode or self.mode,
+        )
+        return rotator.lazy_call(img)
+
 
-class RandFlip(Randomizable, Transform):
+class RandFlip(Randomizable, LazyTransform, Transform):
     """Randomly flips the image along axes. Preserves shape.
     See numpy.flip for additional details.
     https://docs.scipy.org/doc/numpy/reference/generated/numpy.flip.html
@@ -567,8 +923,17 @@ class RandFlip(Randomizable, Transform):
             return img
         return self.flipper(img)
 
+    def lazy_call(self, img):
+        """
+        The same as ``__call__``, but the output is a :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        self.randomize()
+        if not self._do_transform:
+            return img
+        return self.flipper.lazy_call(img)
+
 
-class RandZoom(Randomizable, Transform):
+class RandZoom(Randomizable, LazyTransform, Transform):
     """Randomly zooms input arrays with given probability within given zoom range.
 
     Args:
@@ -624,6 +989,16 @@ class RandZoom(Randomizable, Transform):
         zoomer = Zoom(self._zoom, align_corners=self.align_corners, keep_size=self.keep_size)
         return zoomer(img, interp_order=interp_order or self.interp_order).astype(_dtype)
 
+    def lazy_call(self, img, interp_order: Optional[str] = None):
+        """
+        The same as ``__call__``, but the output is a :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        self.randomize()
+        if not self._do_transform:
+            return _as_pending(img).then(np.eye(img.ndim), img.shape[1:], dtype=np.float32)
+        zoomer = Zoom(self._zoom, align_corners=self.align_corners, keep_size=self.keep_size)
+        return zoomer.lazy_call(img, interp_order=interp_order or self.interp_order)
+
 
 class AffineGrid(Transform):
     """
@@ -659,7 +1034,20 @@ class AffineGrid(Transform):
             else:
                 raise ValueError("Either specify a grid or a spatial size to create a grid from.")
 
-        spatial_dims = len(grid.shape) - 1
+        affine = torch.as_tensor(np.ascontiguousarray(self.get_matrix(len(grid.shape) - 1)), device=self.device)
+
+        grid = torch.tensor(grid) if not torch.is_tensor(grid) else grid.detach().clone()
+        if self.device:
+            grid = grid.to(self.device)
+        grid = (affine.float() @ grid.reshape((grid.shape[0], -1)).float()).reshape([-1] + list(grid.shape[1:]))
+        if self.as_tensor_output:
+            return grid
+        return grid.cpu().numpy()
+
+    def get_matrix(self, spatial_dims: int) -> np.ndarray:
+        """
+        Returns the (spatial_dims+1)x(spatial_dims+1) affine matrix applied to the grid coordinates.
+        """
         affine = np.eye(spatial_dims + 1)
         if self.rotate_params:
             affine = affine @ create_rotate(spatial_dims, self.rotate_params)
@@ -669,15 +1057,7 @@ class AffineGrid(Transform):
             affine = affine @ create_translate(spatial_dims, self.translate_params)
         if self.scale_params:
             affine = affine @ create_scale(spatial_dims, self.scale_params)
-        affine = torch.as_tensor(np.ascontiguousarray(affine), device=self.device)
-
-        grid = torch.tensor(grid) if not torch.is_tensor(grid) else grid.detach().clone()
-        if self.device:
-            grid = grid.to(self.device)
-        grid = (affine.float() @ grid.reshape((grid.shape[0], -1)).float()).reshape([-1] + list(grid.shape[1:]))
-        if self.as_tensor_output:
-            return grid
-        return grid.cpu().numpy()
+        return affine
 
 
 class RandAffineGrid(Randomizable, Transform):
@@ -757,6 +1137,20 @@ class RandAffineGrid(Randomizable, Transform):
         )
         return affine_grid(spatial_size, grid)
 
+    def get_matrix(self, spatial_dims: int) -> np.ndarray:
+        """
+        Randomize the parameters as ``__call__`` and returns the affine matrix applied to the grid coordinates,
+        see also: :py:meth:`AffineGrid.get_matrix`.
+        """
+        self.randomize()
+        affine_grid = AffineGrid(
+            rotate_params=self.rotate_params,
+            shear_params=self.shear_params,
+            translate_params=self.translate_params,
+            scale_params=self.scale_params,
+        )
+        return affine_grid.get_matrix(spatial_dims)
+
 
 class RandDeformGrid(Randomizable, Transform):
     """
@@ -797,6 +1191,36 @@ class RandDeformGrid(Randomizable, Transform):
         return control_grid
 
 
+def _affine_sampling_grid(matrix: torch.Tensor, spatial_size, start: int, stop: int) -> torch.Tensor:
+    """
+    Generate the ``grid_sample`` grid of the output slab ``[start, stop)`` along the first spatial dimension.
+
+    Args:
+        matrix: the (N+1)x(N+1) matrix mapping the homogeneous centered output coordinates
+            (see :py:func:`monai.transforms.utils.create_grid`) to the normalized input coordinates.
+        spatial_size: the spatial size of the whole output.
+        start: the first index of the slab.
+        stop: the stop index of the slab.
+
+    Returns:
+        a grid of shape (stop - start, *spatial_size[1:], N), in the reversed order of the spatial dimensions
+        as required by ``grid_sample``.
+    """
+    sr = len(spatial_size)
+    slab_size = [stop - start] + list(spatial_size[1:])
+    # the rows of the spatial dimensions in the reversed order, then the homogeneous row
+    rows = torch.cat([matrix[:sr].flip(0), matrix[sr:]])
+    grid = rows[:, sr].expand(slab_size + [sr + 1]).clone()
+    for j, d in enumerate(spatial_size):
+        coords = torch.arange(d, dtype=matrix.dtype, device=matrix.device) - (d - 1.0) / 2.0
+        if j == 0:
+            coords = coords[start:stop]
+        shape = [1] * (sr + 1)
+        shape[j] = -1
+        grid += coords.reshape(shape) * rows[:, j]
+    return grid[..., :sr] / grid[..., sr:]
+
+
 class Resample(Transform):
     def __init__(
         self,
@@ -804,21 +1228,29 @@ class Resample(Transform):
         mode: str = "bilinear",
         as_tensor_output: bool = False,
         device: Optional[torch.device] = None,
+        slab_voxels: int = 2 ** 24,
     ):
         """
         computes output image using values from `img`, locations from `grid` using pytorch.
         supports spatially 2D or 3D (num_channels, H, W[, D]).
 
+        The sampling locations can also be specified by an `affine` matrix and the output `spatial_size`,
+        then the sampling grid is generated in float32 on the fly, slab by slab along the first spatial
+        dimension, so that the memory of the grid is bounded by `slab_voxels`.
+
         Args:
             padding_mode ('zeros'|'border'|'reflection'): mode of handling out of range indices. Defaults to 'zeros'.
             as_tensor_output: whether to return a torch tensor. Defaults to False.
             mode ('nearest'|'bilinear'): interpolation order. Defaults to 'bilinear'.
             device (torch.device): device on which the tensor will be allocated.
+            slab_voxels: the maximum number of the output voxels to generate the sampling grid at once,
+                when the sampling locations are given by `affine`. Defaults to 2 ** 24.
         """
         self.padding_mode = padding_mode
         self.mode = mode
         self.as_tensor_output = as_tensor_output
         self.device = device
+        self.slab_voxels = slab_voxels
 
     def __call__(
         self,
@@ -826,41 +1258,73 @@ class Resample(Transform):
         grid: Optional[Union[np.ndarray, torch.Tensor]] = None,
         padding_mode: Optional[str] = None,
         mode: str = "bilinear",
+        affine: Optional[Union[np.ndarray, torch.Tensor]] = None,
+        spatial_size=None,
     ):
         """
         Args:
             img: shape must be (num_channels, H, W[, D]).
             grid: shape must be (3, H, W) for 2D or (4, H, W, D) for 3D.
             mode ('nearest'|'bilinear'): interpolation order. Defaults to 'bilinear'.
+            affine: the (N+1)x(N+1) matrix applied to the coordinates of :py:func:`monai.transforms.utils.create_grid`
+                of `spatial_size`, used instead of `grid`.
+            spatial_size (list or tuple of int): output image spatial size of `affine`, defaults to the input size.
         """
 
         if not torch.is_tensor(img):
             img = torch.as_tensor(np.ascontiguousarray(img))
-        assert grid is not None, "Error, grid argument must be supplied as an ndarray or tensor "
-        grid = torch.tensor(grid) if not torch.is_tensor(grid) else grid.detach().clone()
         if self.device:
             img = img.to(self.device)
-            grid = grid.to(self.device)
-
-        for i, dim in enumerate(img.shape[1:]):
-            grid[i] = 2.0 * grid[i] / (dim - 1.0)
-        grid = grid[:-1] / grid[-1:]
-        index_ordering: List[int] = [x for x in range(img.ndim - 2, -1, -1)]
-        grid = grid[index_ordering]
-        grid = grid.permute(list(range(grid.ndim))[1:] + [0])
-        out = torch.nn.functional.grid_sample(
-            img[None].float(),
-            grid[None].float(),
-            mode=mode or self.mode,
-            padding_mode=padding_mode or self.padding_mode,
-            align_corners=False,
-        )[0]
+        mode = mode or self.mode
+        padding_mode = padding_mode or self.padding_mode
+        if affine is not None:
+            out = self._resample_affine(img, affine, spatial_size or img.shape[1:], mode, padding_mode)
+        else:
+            assert grid is not None, "Error, grid argument must be supplied as an ndarray or tensor "
+            grid = torch.as_tensor(np.ascontiguousarray(grid)) if not torch.is_tensor(grid) else grid.detach()
+            if self.device:
+                grid = grid.to(self.device)
+            dims = torch.as_tensor(img.shape[1:], dtype=grid.dtype, device=grid.device)
+            scale = (2.0 / (dims - 1.0)).reshape([-1] + [1] * (grid.ndim - 1))
+            # normalize, divide by the homogeneous row and reverse the order of the spatial dimensions
+            grid = (grid[:-1] * scale / grid[-1:]).flip(0)
+            grid = grid.permute(list(range(grid.ndim))[1:] + [0])
+            out = torch.nn.functional.grid_sample(
+                img[None].float(), grid[None].float(), mode=mode, padding_mode=padding_mode, align_corners=False,
+            )[0]
         if self.as_tensor_output:
             return out
         return out.cpu().numpy()
 
-
-class Affine(Transform):
+    def _resample_affine(self, img: torch.Tensor, affine, spatial_size, mode: str, padding_mode: str):
+        """
+        Resample `img` with the sampling grid of `affine` generated slab by slab.
+        """
+        spatial_size = [int(i) for i in spatial_size]
+        sr = len(spatial_size)
+        if sr != img.ndim - 1 or tuple(affine.shape) != (sr + 1, sr + 1):
+            raise ValueError(f"the affine matrix must be {sr + 1}x{sr + 1} for the spatial dimensions of the image.")
+        norm = np.diag([2.0 / (d - 1.0) for d in img.shape[1:]] + [1.0])
+        matrix = norm @ np.asarray(affine.cpu() if torch.is_tensor(affine) else affine, dtype=np.float64)
+        matrix = torch.as_tensor(matrix, dtype=torch.float32, device=img.device)
+        img = img[None].float()
+        slab_len = max(1, self.slab_voxels // max(1, int(np.prod(spatial_size[1:]))))
+        if slab_len >= spatial_size[0]:
+            grid = _affine_sampling_grid(matrix, spatial_size, 0, spatial_size[0])
+            return torch.nn.functional.grid_sample(
+                img, grid[None], mode=mode, padding_mode=padding_mode, align_corners=False
+            )[0]
+        out = torch.empty([img.shape[1]] + spatial_size, dtype=torch.float32, device=img.device)
+        for start in range(0, spatial_size[0], slab_len):
+            stop = min(start + slab_len, spatial_size[0])
+            grid = _affine_sampling_grid(matrix, spatial_size, start, stop)
+            out[:, start:stop] = torch.nn.functional.grid_sample(
+                img, grid[None], mode=mode, padding_mode=padding_mode, align_corners=False
+            )[0]
+        return out
+
+
+class Affine(LazyTransform, Transform):
     """
     transform ``img`` given the affine parameters.
     """
@@ -928,13 +1392,31 @@ class Affine(Transform):
             padding_mode ('zeros'|'border'|'reflection'): mode of handling out of range indices. Defaults to 'zeros'.
             mode ('nearest'|'bilinear'): interpolation order. Defaults to 'bilinear'.
         """
-        grid = self.affine_grid(spatial_size=spatial_size or self.spatial_size)
+        spatial_size = spatial_size or self.spatial_size or img.shape[1:]
+        affine = self.affine_grid.get_matrix(len(spatial_size))
         return self.resampler(
-            img=img, grid=grid, padding_mode=padding_mode or self.padding_mode, mode=mode or self.mode
+            img=img,
+            padding_mode=padding_mode or self.padding_mode,
+            mode=mode or self.mode,
+            affine=affine,
+            spatial_size=spatial_size,
+        )
+
+    def lazy_call(
+        self, img, spatial_size=None, padding_mode: Optional[str] = None, mode: Optional[str] = None,
+    ):
+        """
+        The same as ``__call__``, but the output is a :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        spatial_size = spatial_size or self.spatial_size or img.shape[1:]
+        affine = self.affine_grid.get_matrix(len(spatial_size))
+        matrix = _grid_voxel_matrix(affine, img.shape[1:], spatial_size)
+        return _as_pending(img).then(
+            matrix, spatial_size, mode=mode or self.mode, padding_mode=padding_mode or self.padding_mode
         )
 
 
-class RandAffine(Randomizable, Transform):
+class RandAffine(Randomizable, LazyTransform, Transform):
     """
     Random affine transform.
     """
@@ -1013,13 +1495,31 @@ class RandAffine(Randomizable, Transform):
             mode ('nearest'|'bilinear'): interpolation order. Defaults to 'bilinear'.
         """
         self.randomize()
-        _spatial_size = spatial_size or self.spatial_size
-        if self.do_transform:
-            grid = self.rand_affine_grid(spatial_size=_spatial_size)
-        else:
-            grid = create_grid(_spatial_size)
+        _spatial_size = spatial_size or self.spatial_size or img.shape[1:]
+        sr = len(_spatial_size)
+        affine = self.rand_affine_grid.get_matrix(sr) if self.do_transform else np.eye(sr + 1)
         return self.resampler(
-            img=img, grid=grid, padding_mode=padding_mode or self.padding_mode, mode=mode or self.mode
+            img=img,
+            padding_mode=padding_mode or self.padding_mode,
+            mode=mode or self.mode,
+            affine=affine,
+            spatial_size=_spatial_size,
+        )
+
+    def lazy_call(
+        self, img, spatial_size=None, padding_mode: Optional[str] = None, mode: Optional[str] = None,
+    ):
+        """
+        The same as ``__call__``, but the output is a :py:class:`monai.transforms.utils.PendingAffine`,
+        which is resampled on CPU into a numpy array.
+        """
+        self.randomize()
+        _spatial_size = spatial_size or self.spatial_size or img.shape[1:]
+        sr = len(_spatial_size)
+        affine = self.rand_affine_grid.get_matrix(sr) if self.do_transform else np.eye(sr + 1)
+        matrix = _grid_voxel_matrix(affine, img.shape[1:], _spatial_size)
+        return _as_pending(img).then(
+            matrix, _spatial_size, mode=mode or self.mode, padding_mode=padding_mode or self.padding_mode
         )
 
 
@@ -1122,6 +1622,21 @@ class Rand2DElastic(Randomizable, Transform):
 class Rand3DElastic(Randomizable, Transform):
     """
     Random elastic deformation and affine in 3D
+
+    The random displacement field is computed by smoothing a uniform random field with a Gaussian kernel.
+    Two options reduce the cost of the smoothing for the large images and sigmas:
+
+        - `field_downsample`: the random field is drawn and smoothed on a grid coarser by this factor in
+          every dimension, with the sigma scaled accordingly, and then upsampled by the trilinear
+          interpolation. The amplitude is rescaled to match the full resolution field in expectation.
+        - `num_cached_fields`: a bank of smoothed fields is precomputed for the first `spatial_size`,
+          every call samples a field of the bank and applies random flips and permutations of the axes
+          (the axes of the same size) to it, so the Gaussian smoothing is not computed per call.
+          The sigma of every field of the bank is drawn from `sigma_range` once, when the bank is computed,
+          so the calls share `num_cached_fields` sigmas. The bank uses ``num_cached_fields * 3 * prod(spatial_size)``
+          floats of memory.
+
+    The Gaussian kernel is reused between the calls if ``sigma_range[0] == sigma_range[1]``.
     """
 
     def __init__(
@@ -1138,6 +1653,8 @@ class Rand3DElastic(Randomizable, Transform):
         padding_mode: str = "zeros",
         as_tensor_output: bool = False,
         device: Optional[torch.device] = None,
+        field_downsample: int = 1,
+        num_cached_fields: int = 0,
     ):
         """
         Args:
@@ -1155,6 +1672,10 @@ class Rand3DElastic(Randomizable, Transform):
             as_tensor_output: the computation is implemented using pytorch tensors, this option specifies
                 whether to convert it back to numpy arrays.
             device (torch.device): device on which the tensor will be allocated.
+            field_downsample: the downsampling factor of the grid to compute the random field.
+                Defaults to 1, the random field is computed at the full resolution.
+            num_cached_fields: the number of the precomputed random fields, 0 to compute a new field per call.
+                Defaults to 0.
 
         See also:
             - :py:class:`RandAffineGrid` for the random affine parameters configurations.
@@ -1169,12 +1690,20 @@ class Rand3DElastic(Randomizable, Transform):
         self.padding_mode = padding_mode
         self.mode = mode
         self.device = device
+        self.field_downsample = max(int(field_downsample), 1)
+        self.num_cached_fields = num_cached_fields
 
         self.prob = prob
         self.do_transform = False
         self.rand_offset = None
         self.magnitude = 1.0
         self.sigma = 1.0
+        self._cached_fields = None
+        self._cached_size = None
+        self._cached_sigmas: list = list()
+        self._field_index = 0
+        self._flips = np.zeros(3, dtype=bool)
+        self._permutation = np.arange(3)
 
     def set_random_state(self, seed: Optional[int] = None, state: Optional[np.random.RandomState] = None):
         self.rand_affine_grid.set_random_state(seed, state)
@@ -1184,11 +1713,73 @@ class Rand3DElastic(Randomizable, Transform):
     def randomize(self, grid_size):
         self.do_transform = self.R.rand() < self.prob
         if self.do_transform:
-            self.rand_offset = self.R.uniform(-1.0, 1.0, [3] + list(grid_size)).astype(np.float32)
+            if self.num_cached_fields > 0:
+                self._randomize_cached_field(grid_size)
+            else:
+                field_size = self._field_size(grid_size)
+                self.rand_offset = self.R.uniform(-1.0, 1.0, [3] + list(field_size)).astype(np.float32)
         self.magnitude = self.R.uniform(self.magnitude_range[0], self.magnitude_range[1])
         self.sigma = self.R.uniform(self.sigma_range[0], self.sigma_range[1])
+        if self.do_transform and self.num_cached_fields > 0:
+            # the field of the bank is smoothed with its own sigma
+            self.sigma = self._cached_sigmas[self._field_index]
         self.rand_affine_grid.randomize()
 
+    def _field_size(self, spatial_size):
+        return [int(np.ceil(d / self.field_downsample)) for d in spatial_size]
+
+    def _smooth_field(self, rand_offset: np.ndarray, sigma: float, spatial_size) -> torch.Tensor:
+        """
+        Smooth the random offsets by the Gaussian kernel of `sigma` and upsample to `spatial_size`.
+        """
+        if self.sigma_range[0] == self.sigma_range[1]:
+            gaussian = _gaussian_filter(3, sigma / self.field_downsample, 3.0, self.device)
+        else:
+            gaussian = GaussianFilter(3, sigma / self.field_downsample, 3.0).to(device=self.device)
+        field = gaussian(torch.as_tensor(rand_offset[None], device=self.device))
+        if self.field_downsample > 1:
+            field = _torch_interp(input=field, size=list(spatial_size), mode="trilinear", align_corners=False)
+            # the smoothed white noise of a coarser grid has a larger amplitude
+            field = field * self.field_downsample ** -1.5
+        return field[0]
+
+    def _randomize_cached_field(self, grid_size):
+        grid_size = tuple(int(i) for i in grid_size)
+        if self._cached_fields is None or self._cached_size != grid_size:
+            fields, sigmas = list(), list()
+            for _ in range(self.num_cached_fields):
+                offset = self.R.uniform(-1.0, 1.0, [3] + self._field_size(grid_size)).astype(np.float32)
+                sigmas.append(self.R.uniform(self.sigma_range[0], self.sigma_range[1]))
+                fields.append(self._smooth_field(offset, sigmas[-1], grid_size))
+            self._cached_fields = torch.stack(fields)
+            self._cached_sigmas = sigmas
+            self._cached_size = grid_size
+        self._field_index = self.R.randint(self.num_cached_fields)
+        self._flips = self.R.rand(3) < 0.5
+        # permute the axes of the same size
+        self._permutation = np.arange(3)
+        for size in set(grid_size):
+            axes = np.flatnonzero(np.asarray(grid_size) == size)
+            self._permutation[axes] = self.R.permutation(axes)
+
+    def get_deform_field(self, spatial_size) -> torch.Tensor:
+        """
+        Returns the random displacement field (3, H, W, D) of the last `randomize`.
+        """
+        if self.num_cached_fields <= 0:
+            return self._smooth_field(self.rand_offset, self.sigma, spatial_size) * self.magnitude
+        field = self._cached_fields[self._field_index]
+        # the displacement components are permuted and flipped with the axes
+        perm = torch.as_tensor(self._permutation, device=field.device)
+        field = field[perm].permute([0] + [int(i) + 1 for i in self._permutation])
+        flips = [int(i) for i in np.flatnonzero(self._flips)]
+        if flips:
+            field = torch.flip(field, [i + 1 for i in flips])
+            sign = torch.ones(3, 1, 1, 1, device=field.device, dtype=field.dtype)
+            sign[flips] = -1.0
+            field = field * sign
+        return field * self.magnitude
+
     def __call__(
         self, img, spatial_size=None, padding_mode=None, mode=None,
     ):
@@ -1205,8 +1796,6 @@ class Rand3DElastic(Randomizable, Transform):
         grid = create_grid(spatial_size)
         if self.do_transform:
             grid = torch.as_tensor(np.ascontiguousarray(grid), device=self.device)
-            gaussian = GaussianFilter(3, self.sigma, 3.0).to(device=self.device)
-            offset = torch.as_tensor(self.rand_offset[None], device=self.device)
-            grid[:3] += gaussian(offset)[0] * self.magnitude
+            grid[:3] += self.get_deform_field(spatial_size).to(grid)
             grid = self.rand_affine_grid(grid=grid)
         return self.resampler(img, grid, padding_mode=self.padding_mode, mode=mode or self.mode)
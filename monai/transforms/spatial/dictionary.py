@@ -23,8 +23,7 @@ import torch
 from monai.config.type_definitions import KeysCollection
 from monai.data.utils import InterpolationCode
 
-from monai.networks.layers.simplelayers import GaussianFilter
-from monai.transforms.compose import MapTransform, Randomizable
+from monai.transforms.compose import LazyTransform, MapTransform, Randomizable
 from monai.transforms.spatial.array import (
     Flip,
     Orientation,
@@ -36,13 +35,71 @@ from monai.transforms.spatial.array import (
     Rotate90,
     Spacing,
     Zoom,
+    _as_pending,
+    _grid_voxel_matrix,
     _torch_interp,
 )
 from monai.transforms.utils import create_grid
 from monai.utils.misc import ensure_tuple_rep
 
 
-class Spacingd(MapTransform):
+def _group_keys(keys, signatures):
+    """
+    Group the indices and the keys by the signatures, the keys of the same signature can be
+    resampled together. The groups and the keys in a group follow the order of `keys`.
+    """
+    groups: dict = dict()
+    for idx, (key, signature) in enumerate(zip(keys, signatures)):
+        groups.setdefault(signature, []).append((idx, key))
+    return list(groups.values())
+
+
+def _concat_channels(items, dtype=None):
+    """
+    Concatenate the channel-first arrays or tensors along the channel axis.
+    """
+    if len(items) == 1:
+        return items[0]
+    if any(torch.is_tensor(i) for i in items):
+        items = [i if torch.is_tensor(i) else np.ascontiguousarray(i) for i in items]
+        return torch.cat([torch.as_tensor(i, dtype=torch.float) for i in items])
+    return np.concatenate([np.asarray(i, dtype=dtype) for i in items])
+
+
+def _split_channels(output, items):
+    """
+    Split the `output` of the concatenated `items` along the channel axis.
+    """
+    start = 0
+    for item in items:
+        yield output[start : start + len(item)]
+        start += len(item)
+
+
+def _resample_keys(d, keys, resampler, grid, mode, padding_mode, affine=None, spatial_size=None):
+    """
+    Resample the images of `keys` in `d` with the same `grid`, or `affine` and `spatial_size` (see
+    :py:class:`monai.transforms.Resample`). The images of the same interpolation mode,
+    padding mode and spatial shape are resampled in a single `grid_sample` call.
+    """
+    signatures = [(mode[idx], padding_mode[idx], tuple(d[key].shape[1:])) for idx, key in enumerate(keys)]
+    for group in _group_keys(keys, signatures):
+        idx = group[0][0]
+        items = [d[key] for _, key in group]
+        # `Resample` computes in float32
+        output = resampler(
+            _concat_channels(items, np.float32),
+            grid,
+            padding_mode=padding_mode[idx],
+            mode=mode[idx],
+            affine=affine,
+            spatial_size=spatial_size,
+        )
+        for (_, key), item in zip(group, _split_channels(output, items)):
+            d[key] = item
+
+
+class Spacingd(LazyTransform, MapTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Spacing`.
 
@@ -107,23 +164,55 @@ class Spacingd(MapTransform):
 
     def __call__(self, data):
         d = dict(data)
+        # the keys of the same shape, affine and resampling options are resampled together
+        signatures = list()
         for idx, key in enumerate(self.keys):
-            meta_data = d[f"{key}_{self.meta_key_postfix}"]
+            affine = d[f"{key}_{self.meta_key_postfix}"]["affine"]
+            signatures.append(
+                (
+                    tuple(d[key].shape[1:]),
+                    None if affine is None else np.asarray(affine, dtype=np.float64).tobytes(),
+                    self.interp_order[idx],
+                    self.mode[idx],
+                    self.dtype[idx],
+                )
+            )
+        for group in _group_keys(self.keys, signatures):
+            idx, key = group[0]
+            items = [d[k] for _, k in group]
             # resample array of each corresponding key
             # using affine fetched from d[affine_key]
-            d[key], _, new_affine = self.spacing_transform(
+            output, _, new_affine = self.spacing_transform(
+                data_array=_concat_channels(items),
+                affine=d[f"{key}_{self.meta_key_postfix}"]["affine"],
+                interp_order=self.interp_order[idx],
+                mode=self.mode[idx],
+                dtype=self.dtype[idx],
+            )
+            for i, ((_, k), item) in enumerate(zip(group, _split_channels(output, items))):
+                d[k] = item
+                # set the 'affine' key
+                d[f"{k}_{self.meta_key_postfix}"]["affine"] = new_affine if i == 0 else new_affine.copy()
+        return d
+
+    def lazy_call(self, data):
+        """
+        The same as ``__call__``, but the output data are :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        d = dict(data)
+        for idx, key in enumerate(self.keys):
+            meta_data = d[f"{key}_{self.meta_key_postfix}"]
+            d[key], _, meta_data["affine"] = self.spacing_transform.lazy_call(
                 data_array=d[key],
                 affine=meta_data["affine"],
                 interp_order=self.interp_order[idx],
                 mode=self.mode[idx],
                 dtype=self.dtype[idx],
             )
-            # set the 'affine' key
-            meta_data["affine"] = new_affine
         return d
 
 
-class Orientationd(MapTransform):
+class Orientationd(LazyTransform, MapTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Orientation`.
 
@@ -175,8 +264,18 @@ class Orientationd(MapTransform):
             meta_data["affine"] = new_affine
         return d
 
+    def lazy_call(self, data):
+        """
+        The same as ``__call__``, but the output data are :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        d = dict(data)
+        for key in self.keys:
+            meta_data = d[f"{key}_{self.meta_key_postfix}"]
+            d[key], _, meta_data["affine"] = self.ornt_transform.lazy_call(d[key], affine=meta_data["affine"])
+        return d
 
-class Rotate90d(MapTransform):
+
+class Rotate90d(LazyTransform, MapTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Rotate90`.
     """
@@ -197,8 +296,17 @@ class Rotate90d(MapTransform):
             d[key] = self.rotator(d[key])
         return d
 
+    def lazy_call(self, data):
+        """
+        The same as ``__call__``, but the output data are :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        d = dict(data)
+        for key in self.keys:
+            d[key] = self.rotator.lazy_call(d[key])
+        return d
+
 
-class RandRotate90d(Randomizable, MapTransform):
+class RandRotate90d(Randomizable, LazyTransform, MapTransform):
     """Dictionary-based version :py:class:`monai.transforms.RandRotate90`.
     With probability `prob`, input arrays are rotated by 90 degrees
     in the plane specified by `spatial_axes`.
@@ -240,8 +348,21 @@ class RandRotate90d(Randomizable, MapTransform):
             d[key] = rotator(d[key])
         return d
 
+    def lazy_call(self, data):
+        """
+        The same as ``__call__``, but the output data are :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        self.randomize()
+        if not self._do_transform:
+            return data
+        rotator = Rotate90(self._rand_k, self.spatial_axes)
+        d = dict(data)
+        for key in self.keys:
+            d[key] = rotator.lazy_call(d[key])
+        return d
 
-class Resized(MapTransform):
+
+class Resized(LazyTransform, MapTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.Resize`.
 
@@ -271,8 +392,17 @@ class Resized(MapTransform):
             d[key] = self.resizer(d[key], interp_order=self.interp_order[idx])
         return d
 
+    def lazy_call(self, data):
+        """
+        The same as ``__call__``, but the output data are :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        d = dict(data)
+        for idx, key in enumerate(self.keys):
+            d[key] = self.resizer.lazy_call(d[key], interp_order=self.interp_order[idx])
+        return d
 
-class RandAffined(Randomizable, MapTransform):
+
+class RandAffined(Randomizable, LazyTransform, MapTransform):
     """
     Dictionary-based wrapper of :py:class:`monai.transforms.RandAffine`.
     """
@@ -340,13 +470,37 @@ class RandAffined(Randomizable, MapTransform):
         self.randomize()
 
         spatial_size = self.rand_affine.spatial_size
+        sr = len(spatial_size)
         if self.rand_affine.do_transform:
-            grid = self.rand_affine.rand_affine_grid(spatial_size=spatial_size)
+            affine = self.rand_affine.rand_affine_grid.get_matrix(sr)
         else:
-            grid = create_grid(spatial_size=spatial_size)
+            affine = np.eye(sr + 1)
+
+        _resample_keys(
+            d, self.keys, self.rand_affine.resampler, None, self.mode, self.padding_mode, affine, spatial_size
+        )
+        return d
+
+    def lazy_call(self, data):
+        """
+        The same as ``__call__``, but the output data are :py:class:`monai.transforms.utils.PendingAffine`,
+        which are resampled on CPU into numpy arrays.
+        """
+        d = dict(data)
+        self.randomize()
+
+        spatial_size = self.rand_affine.spatial_size
+        sr = len(spatial_size)
+        if self.rand_affine.do_transform:
+            affine = self.rand_affine.rand_affine_grid.get_matrix(sr)
+        else:
+            affine = np.eye(sr + 1)
 
         for idx, key in enumerate(self.keys):
-            d[key] = self.rand_affine.resampler(d[key], grid, padding_mode=self.padding_mode[idx], mode=self.mode[idx])
+            matrix = _grid_voxel_matrix(affine, d[key].shape[1:], spatial_size)
+            d[key] = _as_pending(d[key]).then(
+                matrix, spatial_size, mode=self.mode[idx], padding_mode=self.padding_mode[idx]
+            )
         return d
 
 
@@ -430,10 +584,7 @@ class Rand2DElasticd(Randomizable, MapTransform):
         else:
             grid = create_grid(spatial_size)
 
-        for idx, key in enumerate(self.keys):
-            d[key] = self.rand_2d_elastic.resampler(
-                d[key], grid, padding_mode=self.padding_mode[idx], mode=self.mode[idx]
-            )
+        _resample_keys(d, self.keys, self.rand_2d_elastic.resampler, grid, self.mode, self.padding_mode)
         return d
 
 
@@ -457,6 +608,8 @@ class Rand3DElasticd(Randomizable, MapTransform):
         padding_mode="zeros",
         as_tensor_output: bool = False,
         device: Optional[torch.device] = None,
+        field_downsample: int = 1,
+        num_cached_fields: int = 0,
     ):
         """
         Args:
@@ -478,9 +631,14 @@ class Rand3DElasticd(Randomizable, MapTransform):
             as_tensor_output: the computation is implemented using pytorch tensors, this option specifies
                 whether to convert it back to numpy arrays.
             device (torch.device): device on which the tensor will be allocated.
+            field_downsample: the downsampling factor of the grid to compute the random field.
+                Defaults to 1, the random field is computed at the full resolution.
+            num_cached_fields: the number of the precomputed random fields, 0 to compute a new field per call.
+                Defaults to 0.
         See also:
             - :py:class:`RandAffineGrid` for the random affine parameters configurations.
             - :py:class:`Affine` for the affine transformation parameters configurations.
+            - :py:class:`Rand3DElastic` for the random field options.
         """
         super().__init__(keys)
         self.rand_3d_elastic = Rand3DElastic(
@@ -494,6 +652,8 @@ class Rand3DElasticd(Randomizable, MapTransform):
             spatial_size=spatial_size,
             as_tensor_output=as_tensor_output,
             device=device,
+            field_downsample=field_downsample,
+            num_cached_fields=num_cached_fields,
         )
         self.padding_mode = ensure_tuple_rep(padding_mode, len(self.keys))
         self.mode = ensure_tuple_rep(mode, len(self.keys))
@@ -514,19 +674,14 @@ class Rand3DElasticd(Randomizable, MapTransform):
         if self.rand_3d_elastic.do_transform:
             device = self.rand_3d_elastic.device
             grid = torch.tensor(grid).to(device)
-            gaussian = GaussianFilter(spatial_dims=3, sigma=self.rand_3d_elastic.sigma, truncated=3.0).to(device)
-            offset = torch.tensor(self.rand_3d_elastic.rand_offset[None], device=device)
-            grid[:3] += gaussian(offset)[0] * self.rand_3d_elastic.magnitude
+            grid[:3] += self.rand_3d_elastic.get_deform_field(spatial_size).to(grid)
             grid = self.rand_3d_elastic.rand_affine_grid(grid=grid)
 
-        for idx, key in enumerate(self.keys):
-            d[key] = self.rand_3d_elastic.resampler(
-                d[key], grid, padding_mode=self.padding_mode[idx], mode=self.mode[idx]
-            )
+        _resample_keys(d, self.keys, self.rand_3d_elastic.resampler, grid, self.mode, self.padding_mode)
         return d
 
 
-class Flipd(MapTransform):
+class Flipd(LazyTransform, MapTransform):
     """Dictionary-based wrapper of :py:class:`monai.transforms.Flip`.
 
     See `numpy.flip` for additional details.
@@ -547,8 +702,17 @@ class Flipd(MapTransform):
             d[key] = self.flipper(d[key])
         return d
 
+    def lazy_call(self, data):
+        """
+        The same as ``__call__``, but the output data are :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        d = dict(data)
+        for key in self.keys:
+            d[key] = self.flipper.lazy_call(d[key])
+        return d
 
-class RandFlipd(Randomizable, MapTransform):
+
+class RandFlipd(Randomizable, LazyTransform, MapTransform):
     """Dictionary-based version :py:class:`monai.transforms.RandFlip`.
 
     See `numpy.flip` for additional details.
@@ -579,8 +743,20 @@ class RandFlipd(Randomizable, MapTransform):
             d[key] = self.flipper(d[key])
         return d
 
+    def lazy_call(self, data):
+        """
+        The same as ``__call__``, but the output data are :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        self.randomize()
+        d = dict(data)
+        if not self._do_transform:
+            return d
+        for key in self.keys:
+            d[key] = self.flipper.lazy_call(d[key])
+        return d
+
 
-class Rotated(MapTransform):
+class Rotated(LazyTransform, MapTransform):
     """Dictionary-based wrapper of :py:class:`monai.transforms.Rotate`.
 
     Args:
@@ -630,8 +806,17 @@ class Rotated(MapTransform):
             )
         return d
 
+    def lazy_call(self, data):
+        """
+        The same as ``__call__``, but the output data are :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        d = dict(data)
+        for idx, key in enumerate(self.keys):
+            d[key] = self.rotator.lazy_call(d[key], order=self.interp_order[idx], mode=self.mode[idx])
+        return d
+
 
-class RandRotated(Randomizable, MapTransform):
+class RandRotated(Randomizable, LazyTransform, MapTransform):
     """Dictionary-based version :py:class:`monai.transforms.RandRotate`
     Randomly rotates the input arrays.
 
@@ -702,8 +887,21 @@ class RandRotated(Randomizable, MapTransform):
             )
         return d
 
+    def lazy_call(self, data):
+        """
+        The same as ``__call__``, but the output data are :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        self.randomize()
+        d = dict(data)
+        if not self._do_transform:
+            return d
+        rotator = Rotate(angle=self.angle, spatial_axes=self.spatial_axes, reshape=self.reshape)
+        for idx, key in enumerate(self.keys):
+            d[key] = rotator.lazy_call(d[key], order=self.interp_order[idx], mode=self.mode[idx])
+        return d
+
 
-class Zoomd(MapTransform):
+class Zoomd(LazyTransform, MapTransform):
     """Dictionary-based wrapper of :py:class:`monai.transforms.Zoom`.
 
     Args:
@@ -737,8 +935,17 @@ class Zoomd(MapTransform):
             d[key] = self.zoomer(d[key], interp_order=self.interp_order[idx])
         return d
 
+    def lazy_call(self, data):
+        """
+        The same as ``__call__``, but the output data are :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        d = dict(data)
+        for idx, key in enumerate(self.keys):
+            d[key] = self.zoomer.lazy_call(d[key], interp_order=self.interp_order[idx])
+        return d
 
-class RandZoomd(Randomizable, MapTransform):
+
+class RandZoomd(Randomizable, LazyTransform, MapTransform):
     """Dict-based version :py:class:`monai.transforms.RandZoom`.
 
     Args:
@@ -800,6 +1007,19 @@ class RandZoomd(Randomizable, MapTransform):
             d[key] = zoomer(d[key], interp_order=self.interp_order[idx])
         return d
 
+    def lazy_call(self, data):
+        """
+        The same as ``__call__``, but the output data are :py:class:`monai.transforms.utils.PendingAffine`.
+        """
+        self.randomize()
+        d = dict(data)
+        if not self._do_transform:
+            return d
+        zoomer = Zoom(self._zoom, align_corners=self.align_corners, keep_size=self.keep_size)
+        for idx, key in enumerate(self.keys):
+            d[key] = zoomer.lazy_call(d[key], interp_order=self.interp_order[idx])
+        return d
+
 
 SpacingD = SpacingDict = Spacingd
 OrientationD = OrientationDict = Orientationd
@@ -21,6 +21,7 @@ import numpy as np
 import torch
 
 from monai.transforms.compose import Transform
+from monai.transforms.utils import map_binary_to_indices
 
 
 class AsChannelFirst(Transform):
@@ -35,6 +36,8 @@ class AsChannelFirst(Transform):
     (spatial_dim_1[, spatial_dim_2, ...], num_channels) into the channel-first format,
     so that the multidimensional image array can be correctly interpreted by the other transforms.
 
+    The output is a view of the input array, the data are not copied.
+
     Args:
         channel_dim: which dimension of input image is the channel, default is the last dimension.
     """
@@ -58,6 +61,8 @@ class AsChannelLast(Transform):
     (num_channels, spatial_dim_1[, spatial_dim_2, ...]) into the channel-last format,
     so that MONAI transforms can construct a chain with other 3rd party transforms together.
 
+    The output is a view of the input array, the data are not copied.
+
     Args:
         channel_dim: which dimension of input image is the channel, default is the first dimension.
     """
@@ -126,6 +131,7 @@ class CastToType(Transform):
 class ToTensor(Transform):
     """
     Converts the input image to a tensor without applying any other transformations.
+    The strided views (for example, the outputs of `Flip` and `Orientation`) are made contiguous here.
     """
 
     def __call__(self, img):
@@ -148,6 +154,7 @@ class ToNumpy(Transform):
 class Transpose(Transform):
     """
     Transposes the input image based on the given `indices` dimension ordering.
+    The output is a view of the input array, the data are not copied.
     """
 
     def __init__(self, indices):
@@ -271,3 +278,38 @@ class SimulateDelay(Transform):
     def __call__(self, img, delay_time=None):
         time.sleep(self.delay_time if delay_time is None else delay_time)
         return img
+
+
+class FgBgToIndices(Transform):
+    """
+    Compute the flattened spatial indices of the foreground and background voxels of a label,
+    see :py:func:`monai.transforms.utils.map_binary_to_indices`.
+    The indices are deterministic, so they can be cached (for example, by :py:class:`monai.data.CacheDataset`)
+    to sample the crop centers of :py:class:`monai.transforms.RandCropByPosNegLabeld` without scanning the label.
+
+    Args:
+        image_threshold: if the image is provided, use ``image > image_threshold`` to
+            determine the valid image content area to select the background.
+        max_num_indices: if not None, subsample the foreground and the background indices to a random subset
+            of at most `max_num_indices` each, to reduce the memory of the cache.
+        seed: the seed of the random subsets, a new random state is seeded for every label so that the subsets
+            only depend on the label. The transform is not :py:class:`monai.transforms.Randomizable`,
+            so that the subsets are computed once and cached with the other indices.
+    """
+
+    def __init__(self, image_threshold: float = 0.0, max_num_indices: Optional[int] = None, seed: int = 0):
+        self.image_threshold = image_threshold
+        self.max_num_indices = max_num_indices
+        self.seed = seed
+
+    def __call__(self, label, image=None):
+        """
+        Args:
+            label (ndarray): channel first label array, the voxels of any non-zero channel are foreground.
+            image (ndarray): if not None, the background voxels must be ``image > image_threshold``.
+
+        Returns:
+            the foreground indices and the background indices.
+        """
+        rand_state = np.random.RandomState(self.seed)
+        return map_binary_to_indices(label, image, self.image_threshold, self.max_num_indices, rand_state)
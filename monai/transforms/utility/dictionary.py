@@ -34,6 +34,7 @@ from monai.transforms.utility.array import (
     SqueezeDim,
     DataStats,
     SimulateDelay,
+    FgBgToIndices,
 )
 
 
@@ -305,6 +306,49 @@ class SimulateDelayd(MapTransform):
         return d
 
 
+class FgBgToIndicesd(MapTransform):
+    """
+    Dictionary-based wrapper of :py:class:`monai.transforms.FgBgToIndices`.
+    The indices of the label `key` are stored in ``{key}_{fg_postfix}`` and ``{key}_{bg_postfix}``,
+    which can be consumed by :py:class:`monai.transforms.RandCropByPosNegLabeld` with
+    `fg_indices_key` and `bg_indices_key`.
+    """
+
+    def __init__(
+        self,
+        keys: KeysCollection,
+        fg_postfix: str = "fg_indices",
+        bg_postfix: str = "bg_indices",
+        image_key: Optional[str] = None,
+        image_threshold: float = 0.0,
+        max_num_indices: Optional[int] = None,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            keys: keys of the label items to compute the indices.
+                See also: :py:class:`monai.transforms.compose.MapTransform`
+            fg_postfix: the postfix of the key to store the foreground indices.
+            bg_postfix: the postfix of the key to store the background indices.
+            image_key: if not None, use ``label == 0 & image > image_threshold`` to select the background.
+            image_threshold: the threshold of the valid image content area.
+            max_num_indices: if not None, subsample the indices to a random subset of at most `max_num_indices` each.
+            seed: the seed of the random subsets.
+        """
+        super().__init__(keys)
+        self.fg_postfix = fg_postfix
+        self.bg_postfix = bg_postfix
+        self.image_key = image_key
+        self.converter = FgBgToIndices(image_threshold, max_num_indices, seed)
+
+    def __call__(self, data):
+        d = dict(data)
+        image = d[self.image_key] if self.image_key else None
+        for key in self.keys:
+            d[f"{key}_{self.fg_postfix}"], d[f"{key}_{self.bg_postfix}"] = self.converter(d[key], image)
+        return d
+
+
 AsChannelFirstD = AsChannelFirstDict = AsChannelFirstd
 AsChannelLastD = AsChannelLastDict = AsChannelLastd
 AddChannelD = AddChannelDict = AddChanneld
@@ -315,3 +359,4 @@ DeleteKeysD = DeleteKeysDict = DeleteKeysd
 SqueezeDimD = SqueezeDimDict = SqueezeDimd
 DataStatsD = DataStatsDict = DataStatsd
 SimulateDelayD = SimulateDelayDict = SimulateDelayd
+FgBgToIndicesD = FgBgToIndicesDict = FgBgToIndicesd
@@ -18,6 +18,7 @@ import numpy as np
 from skimage import measure
 
 from monai.config.type_definitions import IndexSelection
+from monai.networks.layers import AffineTransform
 from monai.utils.misc import ensure_tuple
 
 
@@ -163,6 +164,47 @@ def one_hot(labels, num_classes):
     return onehot.reshape(tuple(labels.shape) + (num_classes,)).astype(labels.dtype)
 
 
+def map_binary_to_indices(
+    label: np.ndarray,
+    image: Optional[np.ndarray] = None,
+    image_threshold: float = 0.0,
+    max_num_indices: Optional[int] = None,
+    rand_state: np.random.RandomState = np.random,
+):
+    """
+    Compute the flattened spatial indices of the foreground and background voxels of `label`,
+    in int32 if the number of the spatial voxels allows, int64 otherwise.
+
+    Args:
+        label (numpy.ndarray): use the label data to get the foreground/background information,
+            expected shape: [C, H, W, D] or [C, H, W].
+        image (numpy.ndarray): if image is not None, use ``label = 0 & image > image_threshold``
+            to select background.
+        image_threshold: if enabled image, use ``image > image_threshold`` to
+            determine the valid image content area.
+        max_num_indices: if not None, the foreground and the background indices are subsampled
+            to a random subset of at most `max_num_indices` each, in ascending order.
+        rand_state (random.RandomState): numpy randomState object to draw the subsets.
+
+    Returns:
+        the foreground indices and the background indices.
+    """
+    label_flat = np.any(label, axis=0).ravel()  # in case label has multiple dimensions
+    fg_indices = np.nonzero(label_flat)[0]
+    if image is not None:
+        img_flat = np.any(image > image_threshold, axis=0).ravel()
+        bg_indices = np.nonzero(np.logical_and(img_flat, ~label_flat))[0]
+    else:
+        bg_indices = np.nonzero(~label_flat)[0]
+    dtype = np.int32 if label_flat.size <= np.iinfo(np.int32).max else np.int64
+    outputs = list()
+    for indices in (fg_indices, bg_indices):
+        if max_num_indices is not None and len(indices) > max_num_indices:
+            indices = np.sort(indices[rand_state.choice(len(indices), max_num_indices, replace=False)])
+        outputs.append(indices.astype(dtype))
+    return outputs[0], outputs[1]
+
+
 def generate_pos_neg_label_crop_centers(
     label: np.ndarray,
     size,
@@ -171,6 +213,8 @@ def generate_pos_neg_label_crop_centers(
     image: Optional[np.ndarray] = None,
     image_threshold: float = 0.0,
     rand_state: np.random.RandomState = np.random,
+    fg_indices: Optional[np.ndarray] = None,
+    bg_indices: Optional[np.ndarray] = None,
 ):
     """Generate valid sample locations based on image with option for specifying foreground ratio
     Valid: samples sitting entirely within image, expected input shape: [C, H, W, D] or [C, H, W]
@@ -185,6 +229,10 @@ def generate_pos_neg_label_crop_centers(
         image_threshold: if enabled image_key, use ``image > image_threshold`` to
             determine the valid image content area.
         rand_state (random.RandomState): numpy randomState object to align with other modules.
+        fg_indices (numpy.ndarray): the precomputed foreground indices of :py:func:`map_binary_to_indices`.
+        bg_indices (numpy.ndarray): the precomputed background indices of :py:func:`map_binary_to_indices`.
+            if both `fg_indices` and `bg_indices` are provided, `label` is only used for its shape,
+            and `image` is ignored.
     """
     max_size = label.shape[1:]
     assert len(max_size) == len(size), f"expected size ({len(max_size)}) does not match label dim ({len(size)})."
@@ -200,13 +248,8 @@ def generate_pos_neg_label_crop_centers(
             valid_end[i] += 1
 
     # Prepare fg/bg indices
-    label_flat = np.any(label, axis=0).ravel()  # in case label has multiple dimensions
-    fg_indices = np.nonzero(label_flat)[0]
-    if image is not None:
-        img_flat = np.any(image > image_threshold, axis=0).ravel()
-        bg_indices = np.nonzero(np.logical_and(img_flat, ~label_flat))[0]
-    else:
-        bg_indices = np.nonzero(~label_flat)[0]
+    if fg_indices is None or bg_indices is None:
+        fg_indices, bg_indices = map_binary_to_indices(label, image, image_threshold)
 
     if not len(fg_indices) or not len(bg_indices):
         if not len(fg_indices) and not len(bg_indices):
@@ -238,7 +281,7 @@ def generate_pos_neg_label_crop_centers(
     return centers
 
 
-def apply_transform(transform: Callable, data, map_items: bool = True):
+def apply_transform(transform: Callable, data, map_items: bool = True, profiler=None, name=None):
     """
     Transform `data` with `transform`.
     If `data` is a list or tuple and `map_data` is True, each item of `data` will be transformed
@@ -250,7 +293,12 @@ def apply_transform(transform: Callable, data, map_items: bool = True):
         data (object): an object to be transformed.
         map_item: whether to apply transform to each item in `data`,
             if `data` is a list or tuple. Defaults to True.
+        profiler (TransformProfiler): if not None, record the call in this :py:class:`monai.utils.TransformProfiler`.
+        name (str or int): the name of the record, or the index of `transform` in its `Compose`.
+            Defaults to the class name of `transform`.
     """
+    if profiler is not None:
+        return profiler.profile(profiler.label(transform, name), apply_transform, transform, data, map_items)
     try:
         if isinstance(data, (list, tuple)) and map_items:
             return [transform(item) for item in data]
@@ -431,3 +479,148 @@ def get_largest_connected_component_mask(img, connectivity: Optional[int] = None
         if item.max() != 0:
             largest_cc[i, ...] = item == (np.argmax(np.bincount(item.flat)[1:]) + 1)
     return torch.as_tensor(largest_cc, device=img.device)
+
+
+_GRID_SAMPLE_PADDING = {"constant": "zeros", "nearest": "border", "edge": "border", "reflect": "reflection"}
+
+
+def _grid_sample_mode(mode):
+    """
+    Convert the interpolation mode of a spatial transform (the order of `scipy.ndimage` or the mode of
+    `torch.nn.functional.interpolate`) into a mode of `torch.nn.functional.grid_sample`.
+    """
+    if mode is None:
+        return None
+    if isinstance(mode, str):
+        return "nearest" if mode == "nearest" else "bilinear"
+    return "nearest" if int(mode) == 0 else "bilinear"
+
+
+def _signed_permutation(matrix: np.ndarray, in_shape, out_shape):
+    """
+    If the voxel `matrix` only permutes and flips the axes, returns the input axis of every output axis
+    and whether it's flipped. Otherwise returns None.
+    """
+    sr = len(out_shape)
+    rounded = np.round(matrix[:sr, :sr])
+    if not np.allclose(matrix[:sr, :sr], rounded, atol=1e-6) or not np.all(np.abs(rounded).sum(0) == 1):
+        return None
+    perm = np.abs(rounded).argmax(0)
+    if len(set(perm.tolist())) != sr:
+        return None
+    flips = rounded[perm, range(sr)] < 0
+    for k, (j, flip) in enumerate(zip(perm, flips)):
+        if out_shape[k] != in_shape[j] or not np.isclose(matrix[j, -1], in_shape[j] - 1.0 if flip else 0.0):
+            return None
+    return perm, flips
+
+
+class PendingAffine:
+    """
+    The deferred result of a sequence of spatial transforms in the lazy mode of
+    :py:class:`monai.transforms.Compose`: the source image, an accumulated affine `matrix` and the output
+    spatial size. The `matrix` maps the voxel coordinates of the output to the voxel coordinates of the source
+    image (the "pull" direction of ``scipy.ndimage.affine_transform``), so that a following spatial transform
+    only multiplies its own voxel matrix to the right, and :py:meth:`resample` interpolates the source image
+    once for the whole sequence.
+
+    Args:
+        img (ndarray or tensor): the channel-first source image in shape (num_channels, H[, W, ...]).
+        matrix (ndarray): (spatial_dims+1)x(spatial_dims+1) voxel matrix, defaults to identity.
+        spatial_size (sequence of int): the output spatial size, defaults to the spatial size of `img`.
+        mode (`nearest|bilinear`): the interpolation mode of the resampling.
+        padding_mode (`zeros|border|reflection`): the padding mode of the resampling.
+        dtype (np.dtype): output data type, defaults to np.float32 if the data is interpolated,
+            otherwise the data type of `img`.
+    """
+
+    def __init__(self, img, matrix=None, spatial_size=None, mode="bilinear", padding_mode="zeros", dtype=None):
+        self.img = img
+        sr = img.ndim - 1
+        self.matrix = np.eye(sr + 1, dtype=np.float64) if matrix is None else np.asarray(matrix, dtype=np.float64)
+        self.spatial_size = tuple(int(i) for i in (img.shape[1:] if spatial_size is None else spatial_size))
+        self.mode = mode
+        self.padding_mode = padding_mode
+        self.dtype = dtype
+
+    @property
+    def shape(self):
+        return (self.img.shape[0],) + self.spatial_size
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def then(self, matrix, spatial_size, mode=None, padding_mode=None, dtype=None):
+        """
+        Append a spatial transform to the pending ones.
+
+        Args:
+            matrix (ndarray): the voxel matrix of the transform, mapping its output voxel coordinates to
+                the voxel coordinates of its input, i.e. the current output of the pending transforms.
+            spatial_size (sequence of int): the output spatial size of the transform.
+            mode: the interpolation mode of the transform, `scipy.ndimage` order or
+                `torch.nn.functional.interpolate` mode. None to keep the current mode.
+            padding_mode: the padding mode of the transform, None to keep the current padding mode.
+            dtype (np.dtype): the output data type of the transform, None to keep the current data type.
+
+        Returns:
+            a new PendingAffine.
+        """
+        return PendingAffine(
+            self.img,
+            self.matrix @ np.asarray(matrix, dtype=np.float64),
+            spatial_size,
+            mode=_grid_sample_mode(mode) or self.mode,
+            padding_mode=_GRID_SAMPLE_PADDING.get(padding_mode, padding_mode) or self.padding_mode,
+            dtype=dtype or self.dtype,
+        )
+
+    def resample(self) -> np.ndarray:
+        """
+        Compute the output image. The axis permutations and flips are applied without interpolation,
+        the other affine transforms are resampled once by :py:class:`monai.networks.layers.AffineTransform`.
+        """
+        img = self.img.cpu().numpy() if torch.is_tensor(self.img) else np.asarray(self.img)
+        in_shape = img.shape[1:]
+        permutation = _signed_permutation(self.matrix, in_shape, self.spatial_size)
+        if permutation is not None:
+            perm, flips = permutation
+            output = np.transpose(img, [0] + [int(j) + 1 for j in perm])
+            output = np.flip(output, [k + 1 for k in np.flatnonzero(flips)])
+            return output.astype(self.dtype or img.dtype, copy=False)
+        sr = len(self.spatial_size)
+        if sr not in (2, 3):
+            raise ValueError(f"the lazy resampling supports spatially 2D or 3D images, got {sr}D.")
+        affine_xform = AffineTransform(
+            normalized=False,
+            mode=self.mode,
+            padding_mode=self.padding_mode,
+            align_corners=True,
+            reverse_indexing=True,
+        )
+        output = affine_xform(
+            torch.as_tensor(np.ascontiguousarray(img), dtype=torch.float)[None],
+            torch.as_tensor(self.matrix, dtype=torch.float),
+            spatial_size=self.spatial_size,
+        )
+        return output[0].numpy().astype(self.dtype or np.float32, copy=False)
+
+    def __repr__(self):
+        return f"PendingAffine(shape={self.shape}, source shape={tuple(self.img.shape)})"
+
+
+def evaluate_pending(data):
+    """
+    Resample the :py:class:`PendingAffine` items in `data`, a PendingAffine, a dictionary, a list or a tuple.
+    The other objects are returned unchanged.
+    """
+    if isinstance(data, PendingAffine):
+        return data.resample()
+    if isinstance(data, dict):
+        if not any(isinstance(v, (PendingAffine, list, tuple)) for v in data.values()):
+            return data
+        return {k: evaluate_pending(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return type(data)(evaluate_pending(i) for i in data)
+    return data
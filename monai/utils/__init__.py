@@ -13,3 +13,4 @@
 from .module import export
 from .decorators import *
 from .misc import *
+from .profiling import *
@@ -0,0 +1,266 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import multiprocessing
+import multiprocessing.context
+import os
+import queue
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+__all__ = ["TransformProfiler", "profiling_segment"]
+
+
+class TransformProfiler:
+    """
+    Collect the wall time, the number of calls and the memory allocation of the transforms applied by
+    :py:func:`monai.transforms.utils.apply_transform` with ``profiler=...``, for example::
+
+        profiler = TransformProfiler(track_memory=True)
+        dataset = CacheDataset(data, Compose(transforms, profiler=profiler))
+        for batch in DataLoader(dataset, num_workers=4):
+            ...
+        print(profiler.table())
+
+    The records of the `DataLoader` worker processes are sent to the process creating the profiler
+    at the end of every profiled `Compose` call (see :py:meth:`flush`), and aggregated by
+    :py:meth:`get_stats` and :py:meth:`table`. The records are grouped by segments, for example
+    ``CacheDataset`` reports the deterministic transforms computing the cached items in the "cached"
+    segment and the transforms running at every access in the "uncached" segment.
+
+    A deep copy of the profiler is the profiler itself, so that the copies of a profiled `Compose`
+    (for example in the threads of :py:class:`monai.data.ThreadDataLoader`) record into the same profiler.
+
+    Args:
+        track_memory: whether to record the peak memory allocated by each call with `tracemalloc`.
+            `tracemalloc` traces the allocations of python and numpy, but not of the torch tensors.
+            The peak is relative to the start of each call on python >= 3.9 and the net allocation
+            of each call on the older versions. Tracing slows down the python allocations, the tracing
+            started by the profiler is stopped by :py:meth:`reset` or at the exit of the profiler context::
+
+                with TransformProfiler(track_memory=True) as profiler:
+                    ...
+    """
+
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self._stats: OrderedDict = OrderedDict()
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._worker_pid = self._pid
+        self._lock = threading.Lock()
+        self._queue: Optional[multiprocessing.Queue] = multiprocessing.Queue()
+        self._tracing = False
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_lock"] = None
+        state["_local"] = None
+        state["_stats"] = OrderedDict()
+        if multiprocessing.context.get_spawning_popen() is None:
+            # the queue can only be pickled for a new process, the other copies can't send their records
+            state["_queue"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop_tracing()
+
+    @staticmethod
+    def label(transform: Callable, name=None) -> str:
+        """
+        The name of `transform` in the records, prefixed by its index if `name` is an int.
+        """
+        if isinstance(name, str):
+            return name
+        obj = getattr(transform, "__self__", transform)  # the transform of a bound method such as `lazy_call`
+        label = getattr(obj, "__name__", None) or type(obj).__name__
+        return label if name is None else f"{name}_{label}"
+
+    @contextmanager
+    def segment(self, name: str):
+        """
+        Context manager recording the calls within the context in the segment `name`.
+        """
+        previous, self._local.segment = self._segment, name
+        try:
+            yield self
+        finally:
+            self._local.segment = previous
+
+    @property
+    def _segment(self) -> str:
+        return getattr(self._local, "segment", "")
+
+    def profile(self, name: str, func: Callable, *args):
+        """
+        Call ``func(*args)`` and record it as a call of `name`.
+        """
+        if not self.track_memory:
+            start = time.perf_counter()
+            result = func(*args)
+            self.record(name, time.perf_counter() - start)
+            return result
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        # the peaks of the nested calls are merged into the enclosing calls, as `reset_peak` is global
+        frames = self._local.__dict__.setdefault("frames", [])
+        current, peak = tracemalloc.get_traced_memory()
+        if frames:
+            frames[-1][1] = max(frames[-1][1], peak)
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        frames.append([current, current])
+        start = time.perf_counter()
+        try:
+            result = func(*args)
+        finally:
+            seconds = time.perf_counter() - start
+            start_bytes, frame_peak = frames.pop()
+            current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (start_bytes, 0)
+            peak = max(frame_peak, peak)
+            if frames:
+                frames[-1][1] = max(frames[-1][1], peak)
+        nbytes = (peak if hasattr(tracemalloc, "reset_peak") else current) - start_bytes
+        self.record(name, seconds, max(nbytes, 0))
+        return result
+
+    def record(self, name: str, seconds: float, nbytes: int = 0):
+        """
+        Record a call of `name` taking `seconds` and allocating `nbytes` in the current segment.
+        """
+        with self._lock:
+            pid = os.getpid()
+            if pid != self._worker_pid:
+                # a forked worker inherits the records of the parent process
+                self._stats = OrderedDict()
+                self._worker_pid = pid
+            stat = self._stats.setdefault((self._segment, name), [0, 0.0, 0])
+            stat[0] += 1
+            stat[1] += seconds
+            stat[2] = max(stat[2], nbytes)
+
+    def flush(self):
+        """
+        Send the records of a worker process to the process creating the profiler, no-op in that process.
+        """
+        pid = os.getpid()
+        if pid == self._pid or pid != self._worker_pid or not self._stats or self._queue is None:
+            return
+        with self._lock:
+            records, self._stats = list(self._stats.items()), OrderedDict()
+        self._queue.put(records)
+
+    def _merge(self, records):
+        for key, (calls, seconds, nbytes) in records:
+            stat = self._stats.setdefault(key, [0, 0.0, 0])
+            stat[0] += calls
+            stat[1] += seconds
+            stat[2] = max(stat[2], nbytes)
+
+    def _collect(self):
+        if self._queue is None:
+            return
+        while True:
+            try:
+                records = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._merge(records)
+
+    def get_stats(self) -> OrderedDict:
+        """
+        The aggregated records of all the processes, a dictionary of ``"segment/name"`` (``"name"`` for the
+        default segment) to the dictionary of `calls`, `total_time` and `mean_time` in seconds,
+        `throughput` in calls per second and `peak_bytes`.
+        """
+        self._collect()
+        stats = OrderedDict()
+        with self._lock:
+            for (segment, name), (calls, seconds, nbytes) in self._stats.items():
+                stats[f"{segment}/{name}" if segment else name] = {
+                    "calls": calls,
+                    "total_time": seconds,
+                    "mean_time": seconds / calls,
+                    "throughput": calls / seconds if seconds > 0 else float("inf"),
+                    "peak_bytes": nbytes,
+                }
+        return stats
+
+    def table(self) -> str:
+        """
+        The aggregated records formatted as a table, sorted by the total time.
+        """
+        stats = sorted(self.get_stats().items(), key=lambda x: x[1]["total_time"], reverse=True)
+        width = max([len(name) for name, _ in stats] + [len("transform")])
+        header = ("calls", "total(s)", "mean(ms)", "calls/s", "peak(MB)")
+        lines = [f"{'transform':<{width}} {header[0]:>8} " + " ".join(f"{h:>10}" for h in header[1:])]
+        for name, s in stats:
+            lines.append(
+                f"{name:<{width}} {s['calls']:>8d} {s['total_time']:>10.3f} {s['mean_time'] * 1e3:>10.3f}"
+                f" {s['throughput']:>10.1f} {s['peak_bytes'] / 2 ** 20:>10.2f}"
+            )
+        return "\n".join(lines)
+
+    def reset(self):
+        """
+        Clear the records and stop the `tracemalloc` tracing started by the profiler.
+        """
+        self._collect()
+        with self._lock:
+            self._stats = OrderedDict()
+        self._stop_tracing()
+
+    def _stop_tracing(self):
+        if self._tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._tracing = False
+
+
+class _NullSegment:
+    """
+    The no-op context of :py:func:`profiling_segment` without a profiler, shared by all the calls.
+    """
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SEGMENT = _NullSegment()
+
+
+def profiling_segment(profiler: Optional[TransformProfiler], name: str):
+    """
+    Context manager of ``profiler.segment(name)``, a shared no-op context if `profiler` is None,
+    so that the calls without profiling don't create a context manager.
+    """
+    if profiler is None:
+        return _NULL_SEGMENT
+    return profiler.segment(name)
@@ -15,6 +15,7 @@ doQuickTests=false
 doNetTests=false
 doDryRun=false
 doZooTests=false
+doBenchmarks=false
 
 doUnitTests=true
 
@@ -54,6 +55,9 @@ do
         --zoo)
             doZooTests=true
         ;;
+        --benchmark)
+            doBenchmarks=true
+        ;;
         --codeformat)
           doBlackFormat=true
           doFlake8Format=true
@@ -87,7 +91,8 @@ do
             echo "ERROR: Incorrect commandline provided"
             echo "Invalid key: $key"
             echo "runtests.sh [--codeformat] [--black] [--black-fix] [--flake8] [--pytype] [--mypy] "
-            echo "            [--nounittests] [--coverage] [--quick] [--net] [--dryrun] [--zoo] [-j number] [--clean]"
+            echo "            [--nounittests] [--coverage] [--quick] [--net] [--dryrun] [--zoo] [--benchmark]"
+            echo "            [-j number] [--clean]"
             echo "      --codeformat      : shorthand to run all code style and static analysis tests"
             echo "      --black           : Run the \"black\" autoformatting tools as a lint checker"
             echo "      --black-fix       : Apply \"black\" autofix feature"
@@ -100,6 +105,7 @@ do
             echo "      --net             : perform training/inference/eval integration testing"
             echo "      --dryrun          : display the commands to the screen without running"
             echo "      --zoo             : not yet implmented"
+            echo "      --benchmark       : time the transforms and compare with the recorded baseline"
             echo "       -j               : number of parallel jobs to run"
             echo "      --clean           : Clean temporary files from tests"
             exit 1
@@ -320,6 +326,12 @@ then
     done
 fi
 
+# transform benchmarks, fails if any transform is slower than the baseline
+if [ "$doBenchmarks" = 'true' ]
+then
+    ${cmdprefix}python3 tests/benchmark_transforms.py
+fi
+
 # run model zoo tests
 if [ "$doZooTests" = 'true' ]
 then
@@ -0,0 +1,356 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmarks of the array and dictionary transforms on the synthetic 3D images of
+:py:func:`monai.data.create_test_image_3d` and the NIfTI files saved from them, for example::
+
+    # record the baseline, on the reference commit
+    python tests/benchmark_transforms.py --save
+    # time the current tree and report the regressions, exits with 1 if any benchmark is slower than the threshold
+    python tests/benchmark_transforms.py --threshold 0.2
+
+The benchmarks run on the CPU without display, the number of torch threads is fixed by ``--threads``.
+The timings are machine dependent, so the baseline should be recorded on the machine running the comparison.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+import nibabel as nib
+import numpy as np
+import torch
+
+import monai
+from monai.data import create_test_image_3d
+from monai.transforms import (
+    CastToType,
+    CastToTyped,
+    CenterSpatialCrop,
+    CenterSpatialCropd,
+    CropForeground,
+    CropForegroundd,
+    FgBgToIndices,
+    FgBgToIndicesd,
+    Flip,
+    Flipd,
+    LoadNifti,
+    LoadNiftid,
+    NormalizeIntensity,
+    NormalizeIntensityd,
+    Orientation,
+    Orientationd,
+    Rand3DElastic,
+    Rand3DElasticd,
+    RandAffine,
+    RandAffined,
+    RandCropByPosNegLabeld,
+    RandFlipd,
+    RandGaussianNoise,
+    RandGaussianNoised,
+    Randomizable,
+    RandSpatialCrop,
+    RandSpatialCropd,
+    Resize,
+    Resized,
+    Rotate90,
+    Rotate90d,
+    ScaleIntensity,
+    ScaleIntensityd,
+    ScaleIntensityRange,
+    ScaleIntensityRanged,
+    Spacing,
+    Spacingd,
+    SpatialPad,
+    SpatialPadd,
+    ThresholdIntensity,
+    ToTensor,
+    ToTensord,
+    Zoom,
+    Zoomd,
+)
+from monai.transforms.utils import create_rotate
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "testing_data", "transform_benchmarks.json")
+AFFINE = np.diag([-1.0, 1.2, 1.5, 1.0])
+OBLIQUE_AFFINE = create_rotate(3, (0.2, 0.1, 0.0)) @ AFFINE
+KEYS = ["image", "label"]
+
+
+def _spatial(transform, affine=AFFINE):
+    """call the array-based spatial `transform` with the `affine` of the benchmark images."""
+    return lambda img: transform(img, affine=affine)
+
+
+# (name, input kind, factory of the transform given the spatial size of the cubic input)
+# the input kinds are "image" (1, S, S, S), "label" (1, S, S, S) of {0, 1}, "file" (the NIfTI file of "image"),
+# "dict" ({"image", "label", "image_meta"}) and "dict_file" ({"image", "label"} of the NIfTI files).
+BENCHMARKS = [
+    ("LoadNifti", "file", lambda s: LoadNifti(image_only=True)),
+    ("Spacing", "image", lambda s: _spatial(Spacing(pixdim=(1.5, 1.5, 2.0)))),
+    ("Spacing_oblique", "image", lambda s: _spatial(Spacing(pixdim=1.2), OBLIQUE_AFFINE)),
+    ("Orientation", "image", lambda s: _spatial(Orientation(axcodes="RAS"))),
+    ("Flip", "image", lambda s: Flip(spatial_axis=0)),
+    ("Rotate90", "image", lambda s: Rotate90(k=1, spatial_axes=(0, 1))),
+    ("Resize", "image", lambda s: Resize(spatial_size=(s // 2,) * 3)),
+    ("Zoom", "image", lambda s: Zoom(zoom=0.8, interp_order="trilinear")),
+    (
+        "RandAffine",
+        "image",
+        lambda s: RandAffine(prob=1.0, rotate_range=(0.3,) * 3, scale_range=(0.1,) * 3, as_tensor_output=False),
+    ),
+    ("Rand3DElastic", "image", lambda s: Rand3DElastic(sigma_range=(5, 7), magnitude_range=(50, 150), prob=1.0)),
+    ("NormalizeIntensity", "image", lambda s: NormalizeIntensity()),
+    ("ScaleIntensity", "image", lambda s: ScaleIntensity()),
+    ("ScaleIntensityRange", "image", lambda s: ScaleIntensityRange(a_min=0.0, a_max=1.0, b_min=-1.0, b_max=1.0)),
+    ("ThresholdIntensity", "image", lambda s: ThresholdIntensity(threshold=0.5)),
+    ("RandGaussianNoise", "image", lambda s: RandGaussianNoise(prob=1.0)),
+    ("SpatialPad", "image", lambda s: SpatialPad(spatial_size=(s + 16,) * 3)),
+    ("CenterSpatialCrop", "image", lambda s: CenterSpatialCrop(roi_size=(s // 2,) * 3)),
+    ("RandSpatialCrop", "image", lambda s: RandSpatialCrop(roi_size=(s // 2,) * 3, random_size=False)),
+    ("CropForeground", "image", lambda s: CropForeground()),
+    ("CastToType", "image", lambda s: CastToType(dtype=np.float16)),
+    ("ToTensor", "image", lambda s: ToTensor()),
+    ("FgBgToIndices", "label", lambda s: FgBgToIndices()),
+    ("LoadNiftid", "dict_file", lambda s: LoadNiftid(keys=KEYS)),
+    ("Spacingd", "dict", lambda s: Spacingd(keys=KEYS, pixdim=(1.5, 1.5, 2.0), interp_order=("bilinear", "nearest"))),
+    ("Orientationd", "dict", lambda s: Orientationd(keys=KEYS, axcodes="RAS")),
+    ("Flipd", "dict", lambda s: Flipd(keys=KEYS, spatial_axis=0)),
+    ("RandFlipd", "dict", lambda s: RandFlipd(keys=KEYS, prob=1.0, spatial_axis=0)),
+    ("Rotate90d", "dict", lambda s: Rotate90d(keys=KEYS, k=1, spatial_axes=(0, 1))),
+    ("Resized", "dict", lambda s: Resized(keys=KEYS, spatial_size=(s // 2,) * 3)),
+    ("Zoomd", "dict", lambda s: Zoomd(keys=KEYS, zoom=0.8)),
+    (
+        "RandAffined",
+        "dict",
+        lambda s: RandAffined(
+            keys=KEYS,
+            spatial_size=(s,) * 3,
+            prob=1.0,
+            rotate_range=(0.3,) * 3,
+            scale_range=(0.1,) * 3,
+            mode=("bilinear", "nearest"),
+            as_tensor_output=False,
+        ),
+    ),
+    (
+        "Rand3DElasticd",
+        "dict",
+        lambda s: Rand3DElasticd(
+            keys=KEYS,
+            spatial_size=(s,) * 3,
+            sigma_range=(5, 7),
+            magnitude_range=(50, 150),
+            prob=1.0,
+            mode=("bilinear", "nearest"),
+        ),
+    ),
+    ("NormalizeIntensityd", "dict", lambda s: NormalizeIntensityd(keys="image")),
+    ("ScaleIntensityd", "dict", lambda s: ScaleIntensityd(keys="image")),
+    ("ScaleIntensityRanged", "dict", lambda s: ScaleIntensityRanged("image", a_min=0.0, a_max=1.0, b_min=-1, b_max=1)),
+    ("RandGaussianNoised", "dict", lambda s: RandGaussianNoised(keys="image", prob=1.0)),
+    ("SpatialPadd", "dict", lambda s: SpatialPadd(keys=KEYS, spatial_size=(s + 16,) * 3)),
+    ("CenterSpatialCropd", "dict", lambda s: CenterSpatialCropd(keys=KEYS, roi_size=(s // 2,) * 3)),
+    ("RandSpatialCropd", "dict", lambda s: RandSpatialCropd(keys=KEYS, roi_size=(s // 2,) * 3, random_size=False)),
+    ("CropForegroundd", "dict", lambda s: CropForegroundd(keys=KEYS, source_key="label")),
+    (
+        "RandCropByPosNegLabeld",
+        "dict",
+        lambda s: RandCropByPosNegLabeld(keys=KEYS, label_key="label", size=(s // 4,) * 3, num_samples=4),
+    ),
+    ("FgBgToIndicesd", "dict", lambda s: FgBgToIndicesd(keys="label")),
+    ("CastToTyped", "dict", lambda s: CastToTyped(keys=KEYS, dtype=np.float16)),
+    ("ToTensord", "dict", lambda s: ToTensord(keys=KEYS)),
+]
+
+
+class BenchmarkInputs:
+    """
+    The synthetic inputs of the benchmarks of a spatial size and an image dtype, the NIfTI files
+    are saved in `temp_dir`.
+    """
+
+    def __init__(self, size: int, dtype: str, temp_dir: str):
+        random_state = np.random.RandomState(0)
+        image, label = create_test_image_3d(
+            size, size, size, rad_max=max(size // 8, 6), noise_max=0.2, num_seg_classes=1, random_state=random_state
+        )
+        if np.issubdtype(np.dtype(dtype), np.integer):
+            image = image * 1000
+        self.image = image[None].astype(dtype)
+        self.label = label[None].astype(np.uint8)
+        self.files = {}
+        for key, data in (("image", self.image), ("label", self.label)):
+            self.files[key] = os.path.join(temp_dir, f"{key}_{size}_{dtype}.nii")
+            nib.save(nib.Nifti1Image(data[0], AFFINE), self.files[key])
+
+    def get(self, kind: str):
+        if kind == "image":
+            return self.image
+        if kind == "label":
+            return self.label
+        if kind == "file":
+            return self.files["image"]
+        if kind == "dict":
+            return {"image": self.image, "label": self.label, "image_meta": {"affine": AFFINE}}
+        if kind == "dict_file":
+            return dict(self.files)
+        raise ValueError(f"unknown benchmark input kind {kind}.")
+
+
+def time_transform(transform, data, repeats: int = 3, warmup: int = 1) -> float:
+    """
+    The median wall time in seconds of ``transform(data)`` over `repeats` calls after `warmup` calls.
+    """
+    for _ in range(warmup):
+        transform(data)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        transform(data)
+        times.append(time.perf_counter() - start)
+    return float(np.median(times))
+
+
+def run_benchmarks(sizes, dtypes, pattern=None, repeats: int = 3, warmup: int = 1, verbose: bool = True):
+    """
+    Time the benchmarks matching the regular expression `pattern` on the inputs of `sizes` and `dtypes`.
+    Returns a dictionary of ``"name/size/dtype"`` to the median time in seconds, or None if the benchmark failed.
+    """
+    results = OrderedDict()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in sizes:
+            for dtype in dtypes:
+                inputs = BenchmarkInputs(size, dtype, temp_dir)
+                for name, kind, factory in BENCHMARKS:
+                    if pattern is not None and re.search(pattern, name) is None:
+                        continue
+                    key = f"{name}/{size}/{dtype}"
+                    try:
+                        transform = factory(size)
+                        if isinstance(transform, Randomizable):
+                            transform.set_random_state(seed=0)
+                        results[key] = time_transform(transform, inputs.get(kind), repeats, warmup)
+                    except Exception as e:  # report the failure, for example out of memory, and continue
+                        results[key] = None
+                        print(f"{key}: failed with {type(e).__name__}: {e}", file=sys.stderr)
+                    if verbose and results[key] is not None:
+                        print(f"{key:<40} {results[key] * 1e3:>10.2f} ms", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold: float = 0.2, min_time: float = 1e-3):
+    """
+    Compare the `results` with the `baseline` of :py:func:`run_benchmarks`. A benchmark regresses
+    if it's slower than the baseline by more than the ratio `threshold` and `min_time` seconds.
+    Returns the report lines and the list of the regressed benchmarks.
+    """
+    lines = [f"{'benchmark':<40} {'baseline(ms)':>12} {'current(ms)':>12} {'ratio':>7}  status"]
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if current is None:
+            status, ratio = "failed", float("nan")
+        elif previous is None:
+            status, ratio = "new", float("nan")
+        else:
+            ratio = current / previous if previous > 0 else float("inf")
+            if ratio > 1.0 + threshold and current - previous > min_time:
+                status = "REGRESSION"
+                regressions.append(key)
+            elif ratio < 1.0 / (1.0 + threshold):
+                status = "faster"
+            else:
+                status = "ok"
+        previous_ms = "-" if previous is None else f"{previous * 1e3:.2f}"
+        current_ms = "-" if current is None else f"{current * 1e3:.2f}"
+        lines.append(f"{key:<40} {previous_ms:>12} {current_ms:>12} {ratio:>7.2f}  {status}")
+    return lines, regressions
+
+
+def environment():
+    """the description of the machine stored with the baseline."""
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "torch_threads": torch.get_num_threads(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "torch": torch.__version__,
+        "monai": monai.__version__,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[128, 256, 512], help="spatial sizes of the inputs")
+    parser.add_argument("--dtypes", nargs="+", default=["float32", "int16"], help="dtypes of the images")
+    parser.add_argument("--filter", default=None, help="regular expression selecting the benchmarks by name")
+    parser.add_argument("--repeats", type=int, default=3, help="number of timed calls of each benchmark")
+    parser.add_argument("--warmup", type=int, default=1, help="number of untimed calls of each benchmark")
+    parser.add_argument("--threads", type=int, default=1, help="number of torch threads")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="the JSON file of the baseline")
+    parser.add_argument("--save", action="store_true", help="save the results into the baseline file")
+    parser.add_argument("--output", default=None, help="JSON file to save the results of this run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative slowdown reported as regression")
+    parser.add_argument("--min-time", type=float, default=1e-3, help="absolute slowdown in seconds ignored")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, kind, _ in BENCHMARKS:
+            print(f"{name:<30} {kind}")
+        return 0
+    if os.environ.get("QUICKTEST", "").lower() == "true":
+        args.sizes = [min(args.sizes)]
+    torch.set_num_threads(args.threads)
+    results = run_benchmarks(args.sizes, args.dtypes, args.filter, args.repeats, args.warmup)
+    record = {"environment": environment(), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(record, f, indent=2)
+
+    baseline = {"environment": {}, "results": {}}
+    if os.path.isfile(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    if args.save:
+        baseline["environment"] = record["environment"]
+        baseline["results"].update({k: v for k, v in results.items() if v is not None})
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"baseline saved to {args.baseline}.")
+        return 0
+    if not baseline["results"]:
+        print(f"no baseline found at {args.baseline}, run with --save to record one.")
+        return 0
+    for key in ("processor", "cpu_count", "torch_threads"):
+        if baseline["environment"].get(key) != record["environment"][key]:
+            print(f"warning: the baseline was recorded with a different {key}: {baseline['environment'].get(key)}.")
+    lines, regressions = compare(results, baseline["results"], args.threshold, args.min_time)
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than the baseline by more than {args.threshold:.0%}.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
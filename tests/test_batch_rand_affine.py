@@ -0,0 +1,61 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+import numpy as np
+import torch
+from parameterized import parameterized
+
+from monai.transforms import BatchRandAffine, BatchRandAffined, Resample
+from monai.transforms.utils import create_grid
+
+TEST_CASES = [
+    [dict(prob=1.0, rotate_range=(0.5,), scale_range=(0.2, 0.2)), (3, 2, 9, 8), None],
+    [dict(prob=0.5, shear_range=(0.2, 0.2), translate_range=(1.0, 2.0)), (4, 1, 9, 8), (7, 10)],
+    [dict(prob=1.0, rotate_range=(0.3, 0.2, 0.1), scale_range=(0.1, 0.1, 0.1)), (2, 1, 6, 7, 5), None],
+]
+
+
+class TestBatchRandAffine(unittest.TestCase):
+    @parameterized.expand(TEST_CASES)
+    def test_samples(self, input_param, shape, spatial_size):
+        img = torch.rand(shape)
+        transform = BatchRandAffine(spatial_size=spatial_size, **input_param).set_random_state(seed=0)
+        result = transform(img)
+        spatial_size = tuple(spatial_size or shape[2:])
+        self.assertTupleEqual(tuple(result.shape), shape[:2] + spatial_size)
+        resampler = Resample(as_tensor_output=False)
+        sr = len(spatial_size)
+        for b in range(shape[0]):
+            grid = transform._matrices[b] @ create_grid(spatial_size).reshape((sr + 1, -1))
+            expected = resampler(img[b].numpy(), grid=grid.reshape((sr + 1,) + spatial_size))
+            np.testing.assert_allclose(result[b].numpy(), expected, rtol=1e-4, atol=1e-4)
+
+    def test_identity(self):
+        img = torch.rand(3, 2, 8, 9)
+        result = BatchRandAffine(prob=0.0, rotate_range=(0.5,))(img)
+        np.testing.assert_allclose(result.numpy(), img.numpy(), atol=1e-5)
+
+    def test_dictionary(self):
+        data = {"image": torch.rand(3, 1, 8, 9), "label": torch.randint(0, 3, (3, 1, 8, 9)).float()}
+        transform = BatchRandAffined(
+            keys=["image", "label"], prob=1.0, rotate_range=(0.5,), mode=("bilinear", "nearest")
+        ).set_random_state(seed=1)
+        result = transform(data)
+        expected = transform.transform._transform(data["label"], mode="nearest")
+        np.testing.assert_allclose(result["label"].numpy(), expected.numpy())
+        self.assertTrue(set(np.unique(result["label"].numpy())).issubset({0.0, 1.0, 2.0}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+import numpy as np
+import torch
+from parameterized import parameterized
+
+from monai.transforms import (
+    BatchRandElastic,
+    BatchRandElasticd,
+    BatchRandFlip,
+    BatchRandFlipd,
+    BatchRandGaussianNoise,
+    BatchRandRotate90,
+    BatchRandScaleIntensity,
+    BatchRandShiftIntensity,
+)
+
+
+class TestBatchTransforms(unittest.TestCase):
+    def test_flip(self):
+        img = torch.rand(6, 2, 5, 4)
+        transform = BatchRandFlip(prob=0.5, spatial_axis=1).set_random_state(seed=0)
+        result = transform(img)
+        for b, flipped in enumerate(transform._do_transform):
+            expected = np.flip(img[b].numpy(), 2) if flipped else img[b].numpy()
+            np.testing.assert_allclose(result[b].numpy(), expected)
+
+    def test_rotate90(self):
+        img = torch.rand(6, 1, 5, 5, 3)
+        transform = BatchRandRotate90(prob=0.8, max_k=3, spatial_axes=(0, 1)).set_random_state(seed=0)
+        result = transform(img)
+        for b, k in enumerate(transform._rand_k):
+            np.testing.assert_allclose(result[b].numpy(), np.rot90(img[b].numpy(), k, (1, 2)))
+        with self.assertRaises(ValueError):
+            BatchRandRotate90(prob=1.0)(torch.rand(2, 1, 5, 4))
+
+    def test_intensity(self):
+        img = torch.rand(8, 2, 4, 4)
+        scale = BatchRandScaleIntensity(factors=0.5, prob=0.5).set_random_state(seed=0)
+        shift = BatchRandShiftIntensity(offsets=2.0, prob=0.5).set_random_state(seed=0)
+        scaled, shifted = scale(img), shift(img)
+        for b in range(img.shape[0]):
+            np.testing.assert_allclose(scaled[b].numpy(), img[b].numpy() * (1.0 + scale._factor[b]), rtol=1e-5)
+            np.testing.assert_allclose(shifted[b].numpy(), img[b].numpy() + shift._offset[b], rtol=1e-5)
+
+    def test_gaussian_noise(self):
+        img = torch.zeros(8, 1, 16, 16)
+        transform = BatchRandGaussianNoise(prob=0.5, std=0.5).set_random_state(seed=0)
+        result = transform(img)
+        for b, std in enumerate(transform._std):
+            self.assertEqual(bool(torch.any(result[b] != 0)), std > 0)
+        transform.set_random_state(seed=0)
+        np.testing.assert_allclose(transform(img).numpy(), result.numpy())
+
+    @parameterized.expand([[(3, 2, 12, 10), None], [(2, 1, 8, 9, 7), (6, 6, 6)]])
+    def test_elastic(self, shape, spatial_size):
+        img = torch.rand(shape)
+        transform = BatchRandElastic(
+            spacing=4, magnitude_range=(1.0, 2.0), prob=1.0, rotate_range=(0.3,), spatial_size=spatial_size
+        )
+        result = transform.set_random_state(seed=0)(img)
+        self.assertTupleEqual(tuple(result.shape), shape[:2] + tuple(spatial_size or shape[2:]))
+        identity = BatchRandElastic(spacing=4, magnitude_range=(1.0, 2.0), prob=0.0, rotate_range=(0.3,))(img)
+        np.testing.assert_allclose(identity.numpy(), img.numpy(), atol=1e-5)
+
+    def test_dictionary(self):
+        data = {"image": torch.rand(4, 1, 10, 10), "label": torch.rand(4, 1, 10, 10)}
+        data["label"].copy_(data["image"])
+        result = BatchRandElasticd(keys=["image", "label"], spacing=3, magnitude_range=(1.0, 3.0), prob=1.0)(data)
+        np.testing.assert_allclose(result["image"].numpy(), result["label"].numpy())
+        result = BatchRandFlipd(keys=["image", "label"], prob=0.5).set_random_state(seed=0)(data)
+        np.testing.assert_allclose(result["image"].numpy(), result["label"].numpy())
+
+
+if __name__ == "__main__":
+    unittest.main()
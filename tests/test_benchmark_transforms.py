@@ -0,0 +1,45 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+from tests.benchmark_transforms import BENCHMARKS, compare, run_benchmarks
+from tests.utils import skip_if_quick
+
+
+class TestBenchmarkTransforms(unittest.TestCase):
+    def test_run(self):
+        pattern = "^(Flip|ScaleIntensityd)$"
+        results = run_benchmarks([16], ["float32", "int16"], pattern=pattern, repeats=1, verbose=False)
+        expected = ["Flip/16/float32", "ScaleIntensityd/16/float32", "Flip/16/int16", "ScaleIntensityd/16/int16"]
+        self.assertListEqual(list(results), expected)
+        self.assertTrue(all(t is not None and t >= 0.0 for t in results.values()))
+
+    @skip_if_quick
+    def test_all(self):
+        results = run_benchmarks([16], ["float32"], repeats=1, warmup=0, verbose=False)
+        self.assertEqual(len(results), len(BENCHMARKS))
+        self.assertListEqual([k for k, v in results.items() if v is None], [])
+
+    def test_compare(self):
+        baseline = {"a/16/float32": 0.1, "b/16/float32": 0.1, "c/16/float32": 1e-4}
+        results = {"a/16/float32": 0.2, "b/16/float32": 0.05, "c/16/float32": 1e-3, "d/16/float32": 0.1}
+        lines, regressions = compare(results, baseline, threshold=0.2, min_time=1e-3)
+        self.assertListEqual(regressions, ["a/16/float32"])
+        self.assertEqual(len(lines), 5)
+        self.assertIn("faster", lines[2])
+        self.assertIn("ok", lines[3])
+        self.assertIn("new", lines[4])
+
+
+if __name__ == "__main__":
+    unittest.main()
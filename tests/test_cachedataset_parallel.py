@@ -11,6 +11,7 @@
 
 import unittest
 import os
+import sys
 import shutil
 import numpy as np
 import tempfile
@@ -19,14 +20,18 @@ from parameterized import parameterized
 from monai.data import CacheDataset
 from monai.transforms import Compose, LoadNiftid
 
-TEST_CASE_1 = [0, 100]
+TEST_CASE_1 = [0, 100, "thread"]
 
-TEST_CASE_2 = [4, 100]
+TEST_CASE_2 = [4, 100, "thread"]
+
+TEST_CASE_3 = [4, 100, "process"]
 
 
 class TestCacheDatasetParallel(unittest.TestCase):
-    @parameterized.expand([TEST_CASE_1, TEST_CASE_2])
-    def test_shape(self, num_workers, dataset_size):
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3])
+    def test_shape(self, num_workers, dataset_size, worker_type):
+        if worker_type == "process" and sys.version_info < (3, 8):
+            self.skipTest("process workers require python >= 3.8")
         test_image = nib.Nifti1Image(np.random.randint(0, 2, size=[128, 128, 128]), np.eye(4))
         tempdir = tempfile.mkdtemp()
         nib.save(test_image, os.path.join(tempdir, "test_image1.nii.gz"))
@@ -44,11 +49,14 @@ class TestCacheDatasetParallel(unittest.TestCase):
             transform=Compose([LoadNiftid(keys=["image", "label", "extra"])]),
             cache_rate=1,
             num_workers=num_workers,
+            worker_type=worker_type,
         )
         shutil.rmtree(tempdir)
         self.assertEqual(len(dataset._cache), dataset.cache_num)
         for i in range(dataset.cache_num):
             self.assertIsNotNone(dataset._cache[i])
+        self.assertTupleEqual(dataset[0]["image"].shape, (128, 128, 128))
+        self.assertEqual(dataset[0]["image_meta"]["filename_or_obj"], test_data[0]["image"])
 
 
 if __name__ == "__main__":
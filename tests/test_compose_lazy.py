@@ -0,0 +1,129 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.data import CacheDataset, PersistentDataset
+from monai.transforms import (
+    Compose,
+    Flip,
+    Flipd,
+    Orientationd,
+    RandAffine,
+    RandAffined,
+    Rotate90,
+    ScaleIntensityd,
+    Spacing,
+    Spacingd,
+    Zoom,
+)
+from monai.transforms.utils import PendingAffine
+
+TEST_CASE_1 = [[Flip(spatial_axis=0), Rotate90(k=1, spatial_axes=(0, 1)), Flip(spatial_axis=1)]]
+
+TEST_CASE_2 = [[Rotate90(k=3, spatial_axes=(1, 2)), Flip(spatial_axis=None), Rotate90(k=2, spatial_axes=(0, 2))]]
+
+
+class TestComposeLazy(unittest.TestCase):
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2])
+    def test_permutations(self, transforms):
+        img = np.arange(2 * 3 * 4 * 5, dtype=np.int16).reshape((2, 3, 4, 5))
+        expected = Compose(transforms)(img)
+        result = Compose(transforms, lazy=True)(img)
+        self.assertEqual(result.dtype, np.int16)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_pending(self):
+        img = np.random.rand(1, 6, 8).astype(np.float32)
+        pending = Zoom(zoom=2.0, interp_order="bilinear", keep_size=False).lazy_call(img)
+        pending = Flip(spatial_axis=0).lazy_call(pending)
+        self.assertIsInstance(pending, PendingAffine)
+        self.assertTupleEqual(pending.shape, (1, 12, 16))
+        self.assertIs(pending.img, img)
+
+    @parameterized.expand([[True], [False]])
+    def test_zoom(self, keep_size):
+        img = np.random.rand(2, 6, 7).astype(np.float32)
+        zoom = Zoom(zoom=(1.5, 2.0), interp_order="bilinear", keep_size=keep_size)
+        expected = zoom(img)
+        result = zoom.lazy_call(img).resample()
+        np.testing.assert_allclose(result, expected, atol=1e-4)
+
+    def test_spacing(self):
+        img = np.random.rand(1, 8, 9, 10)
+        affine = np.diag([1.0, 1.5, 2.0, 1.0])
+        spacing = Spacing(pixdim=(1.3, 1.1, 2.5))
+        expected, _, expected_affine = spacing(img, affine=affine)
+        result, _, new_affine = spacing.lazy_call(img, affine=affine)
+        np.testing.assert_allclose(result.resample(), expected, atol=1e-4)
+        np.testing.assert_allclose(new_affine, expected_affine)
+
+    def test_rand_affine(self):
+        img = np.random.rand(2, 16, 15).astype(np.float32)
+        args = dict(prob=1.0, rotate_range=(np.pi / 3,), scale_range=(0.2, 0.2), spatial_size=(12, 18))
+        rand_affine = RandAffine(as_tensor_output=False, **args).set_random_state(seed=123)
+        expected = rand_affine(img)
+        rand_affine = RandAffine(as_tensor_output=False, **args).set_random_state(seed=123)
+        result = rand_affine.lazy_call(img)
+        np.testing.assert_allclose(result.resample(), expected, atol=1e-3)
+
+    def test_dictionary(self):
+        data = {
+            "image": np.random.rand(1, 10, 12, 8),
+            "image_meta": {"affine": np.array([[-2.0, 0, 0, 0], [0, 1.0, 0, 0], [0, 0, 1.5, 0], [0, 0, 0, 1]])},
+        }
+        transforms = [
+            Spacingd(keys="image", pixdim=(1.0, 1.0, 1.0)),
+            Orientationd(keys="image", axcodes="RAS"),
+            Flipd(keys="image", spatial_axis=2),
+        ]
+        lazy = Compose(transforms + [ScaleIntensityd(keys="image")], lazy=True)
+        result = lazy({"image": data["image"], "image_meta": dict(data["image_meta"])})
+        expected = Compose(transforms + [ScaleIntensityd(keys="image")])(
+            {"image": data["image"], "image_meta": dict(data["image_meta"])}
+        )
+        self.assertIsInstance(result["image"], np.ndarray)
+        self.assertTupleEqual(result["image"].shape, expected["image"].shape)
+        np.testing.assert_allclose(result["image_meta"]["affine"], expected["image_meta"]["affine"])
+        np.testing.assert_allclose(result["image"], expected["image"], atol=1e-4)
+
+    def test_cache_dataset(self):
+        data = [
+            {"image": np.random.rand(1, 10, 12, 8), "image_meta": {"affine": np.diag([-2.0, 1.0, 1.5, 1.0])}}
+            for _ in range(3)
+        ]
+        transforms = [
+            Spacingd(keys="image", pixdim=(1.0, 1.0, 1.0)),
+            Flipd(keys="image", spatial_axis=2),
+            RandAffined(keys="image", spatial_size=(8, 8, 8), prob=1.0, rotate_range=(0.3,), as_tensor_output=False),
+            Flipd(keys="image", spatial_axis=0),
+        ]
+        for dataset_type in (CacheDataset, PersistentDataset):
+            lazy = Compose(transforms, lazy=True)
+            lazy.set_random_state(seed=0)
+            dataset = dataset_type(data, lazy) if dataset_type is CacheDataset else dataset_type(data, lazy, None)
+            result = [dataset[i] for i in range(len(data))]
+            # the pending affines are evaluated before caching and after the random transforms
+            deterministic, random = Compose(transforms[:2], lazy=True), Compose(transforms[2:], lazy=True)
+            random.set_random_state(seed=0)
+            for i, item in enumerate(data):
+                cached = deterministic(dict(item))
+                if dataset_type is CacheDataset:
+                    np.testing.assert_allclose(dataset._cache[i]["image"], cached["image"])
+                self.assertIsInstance(result[i]["image"], np.ndarray)
+                self.assertTupleEqual(result[i]["image"].shape, (1, 8, 8, 8))
+                np.testing.assert_allclose(result[i]["image"], random(cached)["image"], atol=1e-5)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import torch.distributed as dist
+import torch.multiprocessing as mp
+from parameterized import parameterized
+
+from monai.data import DistributedCacheDataset, partition_dataset
+from monai.transforms import AddChanneld, Compose
+
+TEST_CASE_1 = [10, 2, False, True, [[0, 2, 4, 6, 8], [1, 3, 5, 7, 9]]]
+
+TEST_CASE_2 = [5, 2, False, True, [[0, 2, 4], [1, 3, 0]]]
+
+TEST_CASE_3 = [5, 2, False, False, [[0, 2, 4], [1, 3]]]
+
+
+def _run_exchange(rank, world_size, init_file, results):
+    dist.init_process_group("gloo", init_method=f"file://{init_file}", rank=rank, world_size=world_size)
+    data = [{"image": np.full((2, 2), i, dtype=np.float32)} for i in range(8)]
+    dataset = DistributedCacheDataset(
+        data=data, transform=Compose([AddChanneld(keys="image")]), shuffle=True, seed=3, exchange_rate=0.5
+    )
+    values = [int(dataset[i]["image"][0, 0, 0]) for i in range(len(dataset))]
+    dataset.exchange(epoch=1)
+    exchanged = [int(dataset[i]["image"][0, 0, 0]) for i in range(len(dataset))]
+    results[rank] = (values, exchanged, list(dataset.indices))
+    dist.destroy_process_group()
+
+
+class TestDistributedCacheDataset(unittest.TestCase):
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3])
+    def test_partition(self, data_len, num_partitions, shuffle, even, expected):
+        self.assertListEqual(partition_dataset(data_len, num_partitions, shuffle=shuffle, even=even), expected)
+
+    def test_shard(self):
+        data = [{"image": np.full((2, 2), i, dtype=np.float32)} for i in range(9)]
+        shards = [
+            DistributedCacheDataset(data, Compose([AddChanneld(keys="image")]), num_replicas=3, rank=r, seed=1)
+            for r in range(3)
+        ]
+        values = [int(s[i]["image"][0, 0, 0]) for s in shards for i in range(len(s))]
+        self.assertListEqual(sorted(values), list(range(9)))
+        self.assertTupleEqual(shards[0][0]["image"].shape, (1, 2, 2))
+        with self.assertRaises(ValueError):
+            DistributedCacheDataset(data, Compose([AddChanneld(keys="image")]), num_replicas=3, rank=3)
+
+    @unittest.skipUnless(dist.is_available(), "torch.distributed is not available.")
+    def test_exchange(self):
+        world_size = 2
+        with tempfile.TemporaryDirectory() as tempdir:
+            results = mp.Manager().dict()
+            mp.spawn(
+                _run_exchange,
+                args=(world_size, os.path.join(tempdir, "init"), results),
+                nprocs=world_size,
+                join=True,
+            )
+            results = dict(results)
+        before = sorted(v for r in range(world_size) for v in results[r][0])
+        after = sorted(v for r in range(world_size) for v in results[r][1])
+        self.assertListEqual(before, list(range(8)))
+        # the items move between the ranks without being lost or duplicated
+        self.assertListEqual(after, before)
+        for r in range(world_size):
+            self.assertEqual(len(set(results[r][0]) & set(results[r][1])), 2)
+            self.assertListEqual(results[r][1], results[r][2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.transforms import FgBgToIndicesd
+
+TEST_CASE_1 = [
+    {"keys": "label"},
+    {"label": np.array([[[0, 1, 1], [1, 0, 1], [1, 1, 0]]])},
+    np.array([1, 2, 3, 5, 6, 7]),
+    np.array([0, 4, 8]),
+]
+
+TEST_CASE_2 = [
+    {"keys": "label", "image_key": "image", "image_threshold": 1},
+    {
+        "label": np.array([[[0, 1, 1], [1, 0, 1], [1, 1, 0]]]),
+        "image": np.array([[[1, 1, 1], [1, 2, 1], [1, 1, 2]]]),
+    },
+    np.array([1, 2, 3, 5, 6, 7]),
+    np.array([4, 8]),
+]
+
+
+class TestFgBgToIndicesd(unittest.TestCase):
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2])
+    def test_indices(self, input_param, input_data, expected_fg, expected_bg):
+        result = FgBgToIndicesd(**input_param)(input_data)
+        self.assertEqual(result["label_fg_indices"].dtype, np.int32)
+        np.testing.assert_array_equal(result["label_fg_indices"], expected_fg)
+        np.testing.assert_array_equal(result["label_bg_indices"], expected_bg)
+
+    def test_max_num_indices(self):
+        label = np.zeros((1, 10, 10))
+        label[0, :5] = 1
+        results = [FgBgToIndicesd(keys="label", max_num_indices=8, seed=1)({"label": label}) for _ in range(2)]
+        for result in results:
+            fg, bg = result["label_fg_indices"], result["label_bg_indices"]
+            self.assertEqual(len(fg), 8)
+            self.assertEqual(len(bg), 8)
+            self.assertTrue(np.all(fg < 50) and np.all(bg >= 50))
+            np.testing.assert_array_equal(fg, np.unique(fg))
+        np.testing.assert_array_equal(results[0]["label_fg_indices"], results[1]["label_fg_indices"])
+        # a random subset, not a regular stride of the indices
+        self.assertFalse(np.all(np.diff(results[0]["label_fg_indices"]) == 50 // 8))
+
+    def test_seeded_per_label(self):
+        label = np.zeros((1, 10, 10))
+        label[0, :5] = 1
+        transform = FgBgToIndicesd(keys="label", max_num_indices=8, seed=1)
+        first = transform({"label": label})
+        transform({"label": 1 - label})
+        second = transform({"label": label})
+        np.testing.assert_array_equal(first["label_fg_indices"], second["label_fg_indices"])
+        np.testing.assert_array_equal(first["label_bg_indices"], second["label_bg_indices"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -38,6 +38,12 @@ class TestFlip(NumpyImageTestCase2D):
         expected = np.stack(expected)
         self.assertTrue(np.allclose(expected, flip(self.imt[0])))
 
+    def test_view(self):
+        img = self.imt[0]
+        result = Flip(spatial_axis=0)(img)
+        self.assertTrue(np.shares_memory(result, img))
+        np.testing.assert_array_equal(result, img[:, ::-1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,93 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+import torch
+
+from monai.data import get_transform_fingerprint
+from monai.transforms import AddChanneld, Compose, LoadNiftid, ScaleIntensityd
+from monai.utils import TransformProfiler
+
+
+class TestGetTransformFingerprint(unittest.TestCase):
+    def test_stable(self):
+        fp1 = get_transform_fingerprint([LoadNiftid(keys="image"), ScaleIntensityd(keys="image")])
+        fp2 = get_transform_fingerprint([LoadNiftid(keys="image"), ScaleIntensityd(keys="image")])
+        self.assertEqual(fp1, fp2)
+
+    def test_arguments(self):
+        fp1 = get_transform_fingerprint([ScaleIntensityd(keys="image", minv=0.0, maxv=1.0)])
+        fp2 = get_transform_fingerprint([ScaleIntensityd(keys="image", minv=0.0, maxv=2.0)])
+        fp3 = get_transform_fingerprint([AddChanneld(keys="image")])
+        self.assertNotEqual(fp1, fp2)
+        self.assertNotEqual(fp1, fp3)
+        self.assertNotEqual(fp1, get_transform_fingerprint([]))
+
+    def test_functions(self):
+        fp1 = get_transform_fingerprint([lambda x: x + 1])
+        fp2 = get_transform_fingerprint([lambda x: x + 1])
+        fp3 = get_transform_fingerprint([lambda x: x * np.array([2])])
+        self.assertEqual(fp1, fp2)
+        self.assertNotEqual(fp1, fp3)
+        self.assertNotEqual(fp1, get_transform_fingerprint([lambda x: x + 2]))
+        self.assertNotEqual(fp1, get_transform_fingerprint([lambda x: x - 1]))
+
+    def test_closures(self):
+        def scale(factor=1.0):
+            return lambda x: x * factor
+
+        def shift(x, offset=1.0):
+            return x + offset
+
+        self.assertEqual(get_transform_fingerprint([scale(2.0)]), get_transform_fingerprint([scale(2.0)]))
+        self.assertNotEqual(get_transform_fingerprint([scale(2.0)]), get_transform_fingerprint([scale(3.0)]))
+        fp = get_transform_fingerprint([shift])
+        shift.__defaults__ = (2.0,)
+        self.assertNotEqual(fp, get_transform_fingerprint([shift]))
+
+    def test_builtins(self):
+        self.assertNotEqual(get_transform_fingerprint([np.exp]), get_transform_fingerprint([np.log]))
+        self.assertNotEqual(get_transform_fingerprint([abs]), get_transform_fingerprint([round]))
+        self.assertEqual(get_transform_fingerprint([np.exp]), get_transform_fingerprint([np.exp]))
+
+    def test_bound_methods(self):
+        fp1 = get_transform_fingerprint([ScaleIntensityd(keys="image", minv=0.0, maxv=1.0).__call__])
+        fp2 = get_transform_fingerprint([ScaleIntensityd(keys="image", minv=0.0, maxv=2.0).__call__])
+        fp3 = get_transform_fingerprint([ScaleIntensityd(keys="image", minv=0.0, maxv=2.0).__call__])
+        self.assertNotEqual(fp1, fp2)
+        self.assertEqual(fp2, fp3)
+
+    def test_arrays(self):
+        def scale(kernel):
+            return lambda x: x * kernel
+
+        kernel = np.ones((64, 64, 64), dtype=np.float32)
+        fp = get_transform_fingerprint([scale(kernel)])
+        self.assertEqual(fp, get_transform_fingerprint([scale(kernel.copy())]))
+        self.assertNotEqual(fp, get_transform_fingerprint([scale(kernel.astype(np.float64))]))
+        self.assertNotEqual(fp, get_transform_fingerprint([scale(kernel.reshape(64, 4096))]))
+        changed = kernel.copy()
+        changed[0, 0, 0] = 2.0
+        self.assertNotEqual(fp, get_transform_fingerprint([scale(changed)]))
+        tensor = torch.ones(3, 3)
+        fp = get_transform_fingerprint([scale(tensor)])
+        self.assertNotEqual(fp, get_transform_fingerprint([scale(tensor.double())]))
+
+    def test_profiler(self):
+        fp1 = get_transform_fingerprint([Compose([ScaleIntensityd(keys="image")])])
+        fp2 = get_transform_fingerprint([Compose([ScaleIntensityd(keys="image")], profiler=TransformProfiler())])
+        self.assertEqual(fp1, fp2)
+
+
+if __name__ == "__main__":
+    unittest.main()
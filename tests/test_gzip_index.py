@@ -0,0 +1,61 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import nibabel as nib
+import numpy as np
+from parameterized import parameterized
+
+from monai.data import LazyArray, get_gzip_index_path, read_indexed_gzip
+from monai.transforms import LoadNifti
+
+try:
+    import indexed_gzip  # noqa: F401
+
+    has_indexed_gzip = True
+except ImportError:
+    has_indexed_gzip = False
+
+TEST_CASE_1 = [None, 1]
+
+TEST_CASE_2 = ["index_cache", 4]
+
+
+@unittest.skipUnless(has_indexed_gzip, "indexed_gzip is not installed")
+class TestGzipIndex(unittest.TestCase):
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2])
+    def test_load(self, index_dir, workers):
+        tempdir = tempfile.mkdtemp()
+        index_dir = os.path.join(tempdir, index_dir) if index_dir is not None else None
+        test_image = np.random.rand(64, 64, 64).astype(np.float32)
+        filename = os.path.join(tempdir, "test_image.nii.gz")
+        nib.save(nib.Nifti1Image(test_image, np.eye(4)), filename)
+
+        data = read_indexed_gzip(filename, index_dir, num_workers=workers, spacing=2 ** 16)
+        self.assertTrue(get_gzip_index_path(filename, index_dir).is_file())
+        self.assertEqual(len(data), 352 + test_image.nbytes)
+
+        loader = LoadNifti(image_only=True, gzip_index=True, gzip_index_dir=index_dir, gzip_workers=workers)
+        np.testing.assert_allclose(loader(filename), test_image)
+        loader = LoadNifti(image_only=True, lazy=True, gzip_index=True, gzip_index_dir=index_dir)
+        proxy = loader(filename)
+        self.assertIsInstance(proxy, LazyArray)
+        np.testing.assert_allclose(proxy[10:20, 5, :], test_image[10:20, 5, :])
+        del proxy
+        shutil.rmtree(tempdir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import nibabel as nib
+import numpy as np
+from parameterized import parameterized
+
+from monai.data import LazyArray
+from monai.transforms import AddChanneld, Compose, LoadNiftid, SpatialCropd
+
+DATA = np.arange(4 * 5 * 6, dtype=np.int16).reshape(4, 5, 6)
+
+TEST_CASE_1 = [0, (slice(1, 3), Ellipsis, 2)]
+
+TEST_CASE_2 = [1, (slice(None), slice(1, 3), slice(0, 5, 2))]
+
+TEST_CASE_3 = [1, (0, Ellipsis)]
+
+TEST_CASE_4 = [2, (slice(None), 0, slice(1, 4), -1)]
+
+TEST_CASE_5 = [1, (slice(None), np.array([0, 2]))]
+
+
+class TestLazyArray(unittest.TestCase):
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3, TEST_CASE_4, TEST_CASE_5])
+    def test_indexing(self, num_new_axes, key):
+        proxy = LazyArray(DATA, np.float32)
+        expected = DATA.astype(np.float32)
+        for _ in range(num_new_axes):
+            proxy = proxy[None]
+            expected = expected[None]
+            self.assertIsInstance(proxy, LazyArray)
+        self.assertTupleEqual(proxy.shape, expected.shape)
+        result = proxy[key]
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, expected[key])
+        np.testing.assert_allclose(np.asarray(proxy), expected)
+
+    def test_array_attributes(self):
+        proxy = LazyArray(DATA, np.float32)[None]
+        self.assertEqual(proxy.astype(np.int32).dtype, np.int32)
+        self.assertAlmostEqual(float(proxy.mean()), float(DATA.mean()), places=4)
+        np.testing.assert_allclose(proxy.copy(), DATA[None])
+        with self.assertRaises(AttributeError):
+            proxy._unknown
+
+    def test_close(self):
+        fileobj = io.BytesIO()
+        proxy = LazyArray(DATA, fileobj=fileobj)[None]
+        self.assertFalse(fileobj.closed)
+        proxy.close()
+        self.assertTrue(fileobj.closed)
+        fileobj = io.BytesIO()
+        proxy = LazyArray(DATA, fileobj=fileobj)
+        expanded = proxy[None]
+        del proxy
+        self.assertFalse(fileobj.closed)
+        del expanded
+        self.assertTrue(fileobj.closed)
+
+    def test_load_crop(self):
+        tempdir = tempfile.mkdtemp()
+        filename = os.path.join(tempdir, "test_image.nii")
+        nib.save(nib.Nifti1Image(DATA, np.eye(4)), filename)
+        transform = Compose(
+            [
+                LoadNiftid(keys="image", lazy=True),
+                AddChanneld(keys="image"),
+                SpatialCropd(keys="image", roi_start=(1, 1, 1), roi_end=(3, 4, 5)),
+            ]
+        )
+        result = transform({"image": filename})
+        self.assertIsInstance(result["image"], np.ndarray)
+        np.testing.assert_allclose(result["image"], DATA[None, 1:3, 1:4, 1:5])
+        self.assertEqual(result["image"].dtype, np.float32)
+        shutil.rmtree(tempdir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,7 @@ import numpy as np
 from parameterized import parameterized
 
 from monai.data import list_data_collate
+from monai.data.utils import STACKED_KEYS
 
 a = {"image": np.array([1, 2, 3]), "label": np.array([4, 5, 6])}
 b = {"image": np.array([7, 8, 9]), "label": np.array([10, 11, 12])}
@@ -40,6 +41,37 @@ class TestListDataCollate(unittest.TestCase):
             data = result[0]
         self.assertEqual(data.shape, expected_shape)
 
+    def test_views(self):
+        image = np.arange(24).reshape((2, 3, 4))
+        batch = [{"image": np.flip(image, 1)}, {"image": np.rot90(image, 2, (1, 2))}]
+        result = list_data_collate(batch)
+        self.assertEqual(result["image"].shape, torch.Size([2, 2, 3, 4]))
+        np.testing.assert_array_equal(result["image"][0].numpy(), np.flip(image, 1))
+
+    def test_stacked(self):
+        batch = [
+            {
+                "image": np.zeros((2, 1, 4, 4)),
+                "label": np.ones((2, 3, 4, 4)),
+                "index": i,
+                STACKED_KEYS: ["image", "label"],
+            }
+            for i in range(2)
+        ]
+        result = list_data_collate(batch)
+        self.assertEqual(result["image"].shape, torch.Size([4, 1, 4, 4]))
+        self.assertEqual(result["label"].shape, torch.Size([4, 3, 4, 4]))
+        self.assertListEqual(result["index"].tolist(), [0, 0, 1, 1])
+
+    def test_mixed_stacked(self):
+        stacked = {"image": np.zeros((2, 1, 4, 4)), STACKED_KEYS: ["image"]}
+        with self.assertRaises(ValueError):
+            list_data_collate([stacked, {"image": np.zeros((1, 4, 4))}])
+        with self.assertRaises(ValueError):
+            list_data_collate([{"image": np.zeros((1, 4, 4))}, stacked])
+        with self.assertRaises(ValueError):
+            list_data_collate([stacked, {"image": np.zeros((2, 1, 4, 4)), "label": 0, STACKED_KEYS: ["label"]}])
+
 
 if __name__ == "__main__":
     unittest.main()
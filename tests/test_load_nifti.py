@@ -54,6 +54,30 @@ class TestLoadNifti(unittest.TestCase):
         self.assertTupleEqual(result.shape, expected_shape)
         shutil.rmtree(tempdir)
 
+    def test_dtype_mmap(self):
+        test_image = np.random.randint(-100, 100, size=[8, 9, 10]).astype(np.int16)
+        tempdir = tempfile.mkdtemp()
+        filenames = [os.path.join(tempdir, "test_image1.nii"), os.path.join(tempdir, "test_image2.nii")]
+        for name in filenames:
+            nib.save(nib.Nifti1Image(test_image, np.eye(4)), name)
+
+        result, header = LoadNifti(dtype=None)(filenames[0])
+        self.assertIsInstance(result, np.memmap)
+        self.assertEqual(result.dtype, np.int16)
+        np.testing.assert_allclose(result, test_image)
+        self.assertEqual(header["filename_or_obj"], filenames[0])
+        _, header = LoadNifti(dtype=None)(filenames[0])
+        self.assertEqual(header["filename_or_obj"], filenames[0])
+
+        result = LoadNifti(image_only=True, dtype=None)(filenames)
+        self.assertEqual(result.dtype, np.int16)
+        np.testing.assert_allclose(result, np.stack([test_image, test_image]))
+        result = LoadNifti(image_only=True, dtype=np.float32)(filenames)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, np.stack([test_image, test_image]))
+        del result
+        shutil.rmtree(tempdir)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -45,6 +45,16 @@ class TestNormalizeIntensity(NumpyImageTestCase2D):
         expected = np.array([[0.0, -1.0, 0.0, 1.0], [0.0, -1.0, 0.0, 1.0]])
         np.testing.assert_allclose(expected, normalizer(input_data))
 
+    def test_input_unchanged(self):
+        for normalizer in (NormalizeIntensity(), NormalizeIntensity(nonzero=True, channel_wise=True)):
+            input_data = np.array([[0.0, 3.0, 0.0, 4.0], [0.0, 4.0, 0.0, 5.0]], dtype=np.float32)
+            original = input_data.copy()
+            for data in (input_data, input_data[:, ::-1]):
+                result = normalizer(data)
+                self.assertEqual(result.dtype, np.float32)
+                self.assertFalse(np.shares_memory(result, input_data))
+            np.testing.assert_allclose(input_data, original)
+
 
 if __name__ == "__main__":
     unittest.main()
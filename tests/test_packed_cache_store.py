@@ -0,0 +1,86 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+
+from monai.data import PackedCacheStore
+
+
+def _put_items(args):
+    store, start = args
+    for i in range(start, start + 10):
+        store.put(hashlib.md5(str(i).encode()).hexdigest(), str(i).encode() * 100)
+
+
+@unittest.skipIf(sys.platform == "win32", "PackedCacheStore requires fcntl")
+class TestPackedCacheStore(unittest.TestCase):
+    def test_put_get(self):
+        tempdir = tempfile.mkdtemp()
+        store = PackedCacheStore(tempdir)
+        key = hashlib.md5(b"a").hexdigest()
+        self.assertIsNone(store.get(key))
+        store.put(key, b"payload")
+        store.put(key, b"ignored")
+        self.assertIn(key, store)
+        self.assertEqual(store.get(key), b"payload")
+
+        # a partially written index record is ignored and overwritten
+        with open(os.path.join(tempdir, "cache.index"), "ab") as f:
+            f.write(b"broken")
+        reloaded = PackedCacheStore(tempdir)
+        self.assertEqual(len(reloaded), 1)
+        key2 = hashlib.md5(b"b").hexdigest()
+        reloaded.put(key2, b"payload2")
+        self.assertEqual(PackedCacheStore(tempdir).get(key2), b"payload2")
+        self.assertEqual(os.path.getsize(os.path.join(tempdir, "cache.index")), 64)
+        self.assertEqual(pickle.loads(pickle.dumps(reloaded)).get(key), b"payload")
+        store.close()
+        reloaded.close()
+        shutil.rmtree(tempdir)
+
+    def test_processes(self):
+        tempdir = tempfile.mkdtemp()
+        store = PackedCacheStore(tempdir)
+        with Pool(4) as p:
+            p.map(_put_items, [(store, 0), (store, 5), (store, 10), (store, 15)])
+        self.assertEqual(len(store), 25)
+        for i in range(25):
+            self.assertEqual(store.get(hashlib.md5(str(i).encode()).hexdigest()), str(i).encode() * 100)
+        store.close()
+        shutil.rmtree(tempdir)
+
+    def test_threads(self):
+        tempdir = tempfile.mkdtemp()
+        store = PackedCacheStore(tempdir)
+        with ThreadPool(4) as p:
+            p.map(_put_items, [(store, 0), (store, 5), (store, 10), (store, 15)])
+        self.assertEqual(len(store), 25)
+        # no payload is overwritten or written twice
+        pack_size = sum(len(str(i)) * 100 for i in range(25))
+        self.assertEqual(os.path.getsize(os.path.join(tempdir, "cache.pack")), pack_size)
+        reloaded = PackedCacheStore(tempdir)
+        for i in range(25):
+            self.assertEqual(reloaded.get(hashlib.md5(str(i).encode()).hexdigest()), str(i).encode() * 100)
+        store.close()
+        reloaded.close()
+        shutil.rmtree(tempdir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+import torch
+from parameterized import parameterized
+
+from monai.data import pad_list_data_collate
+
+a = {"image": np.ones((1, 2, 3)), "label": 1}
+b = {"image": np.ones((1, 4, 2)), "label": 2}
+TEST_CASE_1 = [[a, b], torch.Size([2, 1, 4, 3]), [[1, 2, 3], [1, 4, 2]]]
+
+c = {"image": torch.ones((1, 3, 3)), "label": 3}
+TEST_CASE_2 = [[[a, b], [c]], torch.Size([3, 1, 4, 3]), [[1, 2, 3], [1, 4, 2], [1, 3, 3]]]
+
+
+class TestPadListDataCollate(unittest.TestCase):
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2])
+    def test_dict(self, input_data, expected_shape, expected_shapes):
+        result = pad_list_data_collate(input_data)
+        self.assertEqual(result["image"].shape, expected_shape)
+        np.testing.assert_allclose(result["image_shape"], expected_shapes)
+        for image, shape in zip(result["image"], result["image_shape"]):
+            valid = tuple(slice(0, int(s)) for s in shape)
+            self.assertEqual(float(image[valid].sum()), float(np.prod(shape)))
+            self.assertEqual(float(image.sum()), float(np.prod(shape)))
+        self.assertNotIn("label_shape", result)
+
+    def test_tuple(self):
+        result = pad_list_data_collate([(np.ones((1, 2)), 0), (np.ones((1, 3)), 1)], mode="edge")
+        self.assertEqual(result[0].shape, torch.Size([2, 1, 3]))
+        np.testing.assert_allclose(result[0][0], [[1, 1, 1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
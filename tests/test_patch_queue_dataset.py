@@ -0,0 +1,51 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from collections import Counter
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.data import DataLoader, Dataset, PatchQueueDataset
+from monai.transforms import RandSpatialCropd
+
+TEST_CASE_1 = [0, 1, 2, 0]
+
+TEST_CASE_2 = [2, 4, 3, 0]
+
+TEST_CASE_3 = [1, 16, 2, 2]
+
+
+class TestPatchQueueDataset(unittest.TestCase):
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3])
+    def test_patches(self, num_workers, buffer_size, num_volumes, loader_workers):
+        data = [{"image": np.full((1, 8, 8), i, dtype=np.float32)} for i in range(5)]
+        dataset = PatchQueueDataset(
+            Dataset(data),
+            transform=RandSpatialCropd(keys="image", roi_size=(4, 4), random_size=False),
+            samples_per_volume=6,
+            num_volumes=num_volumes,
+            buffer_size=buffer_size,
+            num_workers=num_workers,
+        )
+        dataset.set_random_state(seed=123)
+        self.assertEqual(len(dataset), 30)
+        loader = DataLoader(dataset, batch_size=1, num_workers=loader_workers)
+        counts = Counter()
+        for patch in loader:
+            self.assertTupleEqual(tuple(patch["image"].shape), (1, 1, 4, 4))
+            counts[int(patch["image"][0, 0, 0, 0])] += 1
+        self.assertDictEqual(dict(counts), {i: 6 for i in range(5)})
+
+
+if __name__ == "__main__":
+    unittest.main()
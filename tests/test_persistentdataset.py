@@ -17,7 +17,7 @@ import tempfile
 import nibabel as nib
 from parameterized import parameterized
 from monai.data import PersistentDataset
-from monai.transforms import Compose, LoadNiftid, SimulateDelayd
+from monai.transforms import Compose, LoadNiftid, SimulateDelayd, ScaleIntensityd
 
 TEST_CASE_1 = [(128, 128, 128)]
 
@@ -75,6 +75,53 @@ class TestDataset(unittest.TestCase):
         self.assertTupleEqual(data2_postcached["label"].shape, expected_shape)
         self.assertTupleEqual(data2_postcached["extra"].shape, expected_shape)
 
+    def test_npy_format(self):
+        test_image = nib.Nifti1Image(np.random.randint(0, 2, size=[16, 16, 16]), np.eye(4))
+        tempdir = tempfile.mkdtemp()
+        nib.save(test_image, os.path.join(tempdir, "test_image1.nii.gz"))
+        test_data = [{"image": os.path.join(tempdir, "test_image1.nii.gz")}]
+        test_transform = Compose([LoadNiftid(keys="image"), ScaleIntensityd(keys="image", minv=0.0, maxv=2.0)])
+
+        dataset = PersistentDataset(data=test_data, transform=test_transform, cache_dir=tempdir, cache_format="npy")
+        data_precached = dataset[0]
+        data_postcached = dataset[0]
+        self.assertNotIsInstance(data_precached["image"], np.memmap)
+        self.assertIsInstance(data_postcached["image"], np.memmap)
+        self.assertFalse(data_postcached["image"].flags.writeable)
+        np.testing.assert_allclose(data_precached["image"], data_postcached["image"])
+        np.testing.assert_allclose(data_precached["image_meta"]["affine"], data_postcached["image_meta"]["affine"])
+
+        # different transform parameters must not read the stale cache
+        test_transform = Compose([LoadNiftid(keys="image"), ScaleIntensityd(keys="image", minv=0.0, maxv=4.0)])
+        dataset = PersistentDataset(data=test_data, transform=test_transform, cache_dir=tempdir, cache_format="npy")
+        self.assertEqual(len(os.listdir(tempdir)), 2)
+        data_changed = dataset[0]
+        self.assertEqual(len(os.listdir(tempdir)), 3)
+        np.testing.assert_allclose(data_changed["image"], data_precached["image"] * 2.0)
+        shutil.rmtree(tempdir)
+
+    def test_pack_format(self):
+        test_image = nib.Nifti1Image(np.random.randint(0, 2, size=[16, 16, 16]), np.eye(4))
+        tempdir = tempfile.mkdtemp()
+        nib.save(test_image, os.path.join(tempdir, "test_image1.nii.gz"))
+        nib.save(test_image, os.path.join(tempdir, "test_image2.nii.gz"))
+        test_data = [{"image": os.path.join(tempdir, f"test_image{i}.nii.gz")} for i in (1, 2)]
+        test_transform = Compose([LoadNiftid(keys="image"), ScaleIntensityd(keys="image", minv=0.0, maxv=2.0)])
+
+        dataset = PersistentDataset(data=test_data, transform=test_transform, cache_dir=tempdir, cache_format="pack")
+        data_precached = [dataset[0], dataset[1]]
+        self.assertEqual(len(dataset._pack_store), 2)
+        self.assertListEqual(
+            sorted(os.listdir(tempdir)), ["cache.index", "cache.pack", "test_image1.nii.gz", "test_image2.nii.gz"]
+        )
+        dataset = PersistentDataset(data=test_data, transform=test_transform, cache_dir=tempdir, cache_format="pack")
+        for i in (0, 1):
+            data_postcached = dataset[i]
+            self.assertTrue(data_postcached["cached"])
+            np.testing.assert_allclose(data_precached[i]["image"], data_postcached["image"])
+        self.assertEqual(len(dataset._pack_store), 2)
+        shutil.rmtree(tempdir)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -94,6 +94,19 @@ class TestRandAffined(unittest.TestCase):
             else:
                 np.testing.assert_allclose(result, expected, rtol=1e-4, atol=1e-4)
 
+    def test_grouped_keys(self):
+        data = {
+            "img": np.random.rand(2, 5, 6),
+            "seg": np.random.randint(0, 3, (1, 5, 6)),
+            "aux": np.random.rand(1, 5, 6),
+        }
+        keys, mode = ("img", "seg", "aux"), ("bilinear", "nearest", "bilinear")
+        args = dict(prob=1.0, rotate_range=(np.pi / 4,), spatial_size=(4, 4), as_tensor_output=False)
+        res = RandAffined(keys=keys, mode=mode, **args).set_random_state(123)(data)
+        for key, key_mode in zip(keys, mode):
+            expected = RandAffined(keys=key, mode=key_mode, **args).set_random_state(123)(data)
+            np.testing.assert_allclose(res[key], expected[key], rtol=1e-5, atol=1e-5)
+
 
 if __name__ == "__main__":
     unittest.main()
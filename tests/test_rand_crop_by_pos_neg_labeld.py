@@ -12,7 +12,8 @@
 import unittest
 import numpy as np
 from parameterized import parameterized
-from monai.transforms import RandCropByPosNegLabeld
+from monai.data import list_data_collate
+from monai.transforms import FgBgToIndicesd, RandCropByPosNegLabeld
 
 TEST_CASE_1 = [
     {
@@ -68,6 +69,30 @@ class TestRandCropByPosNegLabeld(unittest.TestCase):
         self.assertTupleEqual(result[0]["extral"].shape, expected_shape)
         self.assertTupleEqual(result[0]["label"].shape, expected_shape)
 
+    def test_indices(self):
+        data = {"image": np.random.rand(1, 10, 9, 8), "label": np.random.randint(0, 2, size=[1, 10, 9, 8])}
+        params = {"keys": ["image", "label"], "label_key": "label", "size": [3, 3, 3], "num_samples": 4}
+        expected = RandCropByPosNegLabeld(**params).set_random_state(0)(data)
+        indexed = FgBgToIndicesd(keys="label")(data)
+        cropper = RandCropByPosNegLabeld(**params, fg_indices_key="label_fg_indices", bg_indices_key="label_bg_indices")
+        result = cropper.set_random_state(0)(indexed)
+        for r, e in zip(result, expected):
+            self.assertNotIn("label_fg_indices", r)
+            np.testing.assert_array_equal(r["image"], e["image"])
+            np.testing.assert_array_equal(r["label"], e["label"])
+
+    def test_batched(self):
+        data = {"image": np.random.rand(2, 10, 9, 8), "label": np.random.randint(0, 2, size=[1, 10, 9, 8]), "id": 3}
+        params = {"keys": ["image", "label"], "label_key": "label", "size": [3, 4, 3], "num_samples": 4}
+        expected = list_data_collate([RandCropByPosNegLabeld(**params).set_random_state(0)(data)])
+        stacked = RandCropByPosNegLabeld(**params, batched=True).set_random_state(0)(data)
+        self.assertTupleEqual(stacked["image"].shape, (4, 2, 3, 4, 3))
+        result = list_data_collate([stacked, stacked])
+        self.assertTupleEqual(tuple(result["image"].shape), (8, 2, 3, 4, 3))
+        self.assertTupleEqual(tuple(result["id"].shape), (8,))
+        np.testing.assert_array_equal(result["image"][:4].numpy(), expected["image"].numpy())
+        np.testing.assert_array_equal(result["label"][4:].numpy(), expected["label"].numpy())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,6 +16,7 @@ import torch
 from parameterized import parameterized
 
 from monai.transforms import Rand3DElastic
+from monai.transforms.spatial.array import _gaussian_filter
 
 TEST_CASES = [
     [
@@ -68,6 +69,30 @@ class TestRand3DElastic(unittest.TestCase):
         else:
             np.testing.assert_allclose(result, expected_val, rtol=1e-4, atol=1e-4)
 
+    @parameterized.expand([[{"field_downsample": 2}], [{"num_cached_fields": 3}]])
+    def test_deform_field(self, field_param):
+        g = Rand3DElastic(magnitude_range=(1.0, 1.0), sigma_range=(1.0, 2.0), prob=1.0, **field_param)
+        g.set_random_state(123)
+        for _ in range(3):
+            g.randomize((6, 6, 5))
+            field = g.get_deform_field((6, 6, 5))
+            self.assertTupleEqual(tuple(field.shape), (3, 6, 6, 5))
+        result = g(torch.ones((1, 6, 6, 5)), spatial_size=(6, 6, 5))
+        self.assertTupleEqual(result.shape, (1, 6, 6, 5))
+        if g.num_cached_fields > 0:
+            self.assertTupleEqual(tuple(g._cached_fields.shape), (3, 3, 6, 6, 5))
+            self.assertIn(g.sigma, g._cached_sigmas)
+
+    def test_gaussian_cache(self):
+        _gaussian_filter.cache_clear()
+        g = Rand3DElastic(magnitude_range=(1.0, 1.0), sigma_range=(1.0, 2.0), prob=1.0)
+        g(torch.ones((1, 6, 6, 5)), spatial_size=(6, 6, 5))
+        self.assertEqual(_gaussian_filter.cache_info().currsize, 0)
+        g = Rand3DElastic(magnitude_range=(1.0, 1.0), sigma_range=(1.5, 1.5), prob=1.0)
+        for _ in range(2):
+            g(torch.ones((1, 6, 6, 5)), spatial_size=(6, 6, 5))
+        self.assertEqual(_gaussian_filter.cache_info().hits, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
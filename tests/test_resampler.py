@@ -16,7 +16,7 @@ import torch
 from parameterized import parameterized
 
 from monai.transforms import Resample
-from monai.transforms.utils import create_grid
+from monai.transforms.utils import create_grid, create_rotate, create_scale
 
 TEST_CASES = [
     [
@@ -81,6 +81,19 @@ class TestResample(unittest.TestCase):
         else:
             np.testing.assert_allclose(result, expected_val, rtol=1e-4, atol=1e-4)
 
+    @parameterized.expand([[(5, 6), 2 ** 24], [(7, 5, 6), 2 ** 24], [(7, 5, 6), 40]])
+    def test_affine(self, spatial_size, slab_voxels):
+        sr = len(spatial_size)
+        img = np.random.rand(2, 6, 5, 4)[(slice(None),) + (slice(None),) * sr + (0,) * (3 - sr)]
+        affine = create_rotate(sr, [0.3] * (sr * 2 - 3)) @ create_scale(sr, [1.2] * sr)
+        affine[:sr, sr] = 0.7
+        resampler = Resample(as_tensor_output=False, slab_voxels=slab_voxels)
+        grid = (affine @ create_grid(spatial_size).reshape((sr + 1, -1))).reshape((sr + 1,) + spatial_size)
+        expected = resampler(img, grid=grid)
+        result = resampler(img, affine=affine, spatial_size=spatial_size)
+        self.assertTupleEqual(result.shape, (2,) + spatial_size)
+        np.testing.assert_allclose(result, expected, rtol=1e-4, atol=1e-4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -24,6 +24,13 @@ TEST_CASES = [
     (180, (1, 0), False, 2, "constant", 4, False),
 ]
 
+TEST_CASES_TORCH = [
+    (30, (0, 1), True, 1, "constant", 0),
+    (-20, (1, 0), False, 1, "nearest", 0),
+    (45, (0, 1), True, 1, "constant", 2.5),
+    (60, (1, 0), True, 0, "constant", 0),
+]
+
 
 class TestRotate(NumpyImageTestCase2D):
     @parameterized.expand(TEST_CASES)
@@ -40,6 +47,27 @@ class TestRotate(NumpyImageTestCase2D):
         expected = np.stack(expected).astype(np.float32)
         self.assertTrue(np.allclose(expected, rotated))
 
+    @parameterized.expand(TEST_CASES_TORCH)
+    def test_torch_backend(self, angle, spatial_axes, reshape, order, mode, cval):
+        img = np.stack([self.imt[0, 0], self.imt[0, 0] * 2.0]).astype(np.float32)
+        rotated = Rotate(angle, spatial_axes, reshape, order, mode, cval)(img)
+        expected = np.stack(
+            [scipy.ndimage.rotate(c, angle, spatial_axes, reshape, order=order, mode=mode, cval=cval) for c in img]
+        )
+        self.assertTupleEqual(rotated.shape, expected.shape)
+        self.assertEqual(rotated.dtype, np.float32)
+        if order == 0:
+            # the nearest neighbours may differ at the ties
+            self.assertGreater(np.mean(np.isclose(expected, rotated, atol=1e-4)), 0.99)
+        else:
+            np.testing.assert_allclose(rotated, expected, atol=1e-4)
+
+    def test_torch_backend_3d(self):
+        img = np.random.rand(2, 10, 12, 6).astype(np.float32)
+        rotated = Rotate(35, (0, 2), True)(img)
+        expected = np.stack([scipy.ndimage.rotate(c, 35, (0, 2), True, order=1, mode="constant") for c in img])
+        np.testing.assert_allclose(rotated, expected, atol=1e-4)
+
 
 if __name__ == "__main__":
     unittest.main()
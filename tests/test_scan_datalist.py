@@ -0,0 +1,76 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import nibabel as nib
+import numpy as np
+from parameterized import parameterized
+
+from monai.data import load_manifest, scan_datalist
+
+TEST_CASE_1 = [0, 2 ** 24]
+
+TEST_CASE_2 = [2, 100]
+
+
+class TestScanDatalist(unittest.TestCase):
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2])
+    def test_scan(self, num_workers, slab_voxels):
+        tempdir = tempfile.mkdtemp()
+        datalist = list()
+        for i, shape in enumerate([(10, 12, 8), (6, 7, 9)]):
+            image = np.arange(np.prod(shape), dtype=np.float32).reshape(shape)
+            label = np.zeros(shape, dtype=np.uint8)
+            label[2:4, 3:5, 1:6] = 1
+            item = {"image": os.path.join(tempdir, f"image{i}.nii"), "label": os.path.join(tempdir, f"label{i}.nii")}
+            nib.save(nib.Nifti1Image(image, np.diag([1.5, 2.0, 3.0, 1.0])), item["image"])
+            nib.save(nib.Nifti1Image(label, np.eye(4)), item["label"])
+            datalist.append(item)
+        manifest_file = os.path.join(tempdir, "manifest.json")
+
+        manifest = scan_datalist(
+            datalist,
+            manifest_file=manifest_file,
+            num_workers=num_workers,
+            intensity_keys=["image"],
+            foreground_keys=["label"],
+            percentiles=[0, 100],
+            slab_voxels=slab_voxels,
+        )
+        self.assertListEqual(manifest, load_manifest(manifest_file))
+        self.assertListEqual(manifest[0]["image"]["spatial_shape"], [10, 12, 8])
+        self.assertListEqual(manifest[1]["image"]["spatial_shape"], [6, 7, 9])
+        np.testing.assert_allclose(manifest[0]["image"]["spacing"], [1.5, 2.0, 3.0])
+        intensity = manifest[1]["image"]["intensity"]
+        self.assertEqual(intensity["max"], 6 * 7 * 9 - 1)
+        self.assertAlmostEqual(intensity["mean"], (6 * 7 * 9 - 1) / 2)
+        self.assertEqual(intensity["percentiles"]["100"], 6 * 7 * 9 - 1)
+        self.assertListEqual(manifest[0]["label"]["foreground_box"], [[2, 3, 1], [4, 5, 6]])
+        self.assertNotIn("intensity", manifest[0]["label"])
+
+        # only the changed files are scanned again
+        nib.save(nib.Nifti1Image(np.ones((3, 3, 3), dtype=np.float32), np.eye(4)), datalist[0]["image"])
+        os.utime(datalist[0]["image"], ns=(0, 0))
+        manifest = scan_datalist(
+            datalist, manifest_file=manifest_file, intensity_keys=["image"], foreground_keys=["label"]
+        )
+        self.assertListEqual(manifest[0]["image"]["spatial_shape"], [3, 3, 3])
+        self.assertEqual(manifest[0]["image"]["intensity"]["max"], 1.0)
+        self.assertEqual(manifest[0]["label"], load_manifest(manifest_file)[0]["label"])
+        shutil.rmtree(tempdir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.data import DataLoader, Dataset, ShapeBucketBatchSampler, pad_list_data_collate
+
+SHAPES = [(8, 8), (32, 32), (9, 8), (31, 32), (8, 7), (30, 30), (16, 16), (17, 16), (15, 16)]
+
+TEST_CASE_1 = [3, True, False, 3]
+
+TEST_CASE_2 = [3, False, False, 3]
+
+TEST_CASE_3 = [2, True, True, 4]
+
+
+class TestShapeBucketBatchSampler(unittest.TestCase):
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3])
+    def test_batches(self, batch_size, shuffle, drop_last, expected_len):
+        sampler = ShapeBucketBatchSampler(SHAPES, batch_size=batch_size, shuffle=shuffle, drop_last=drop_last)
+        sampler.set_random_state(seed=0)
+        batches = list(sampler)
+        self.assertEqual(len(batches), expected_len)
+        self.assertEqual(len(sampler), expected_len)
+        indices = sorted(i for b in batches for i in b)
+        self.assertEqual(len(indices), len(set(indices)))
+        if not drop_last:
+            self.assertListEqual(indices, list(range(len(SHAPES))))
+        # the similar shapes are in the same batches
+        for batch in batches if batch_size == 3 else ():
+            sizes = [np.prod(SHAPES[i]) for i in batch]
+            self.assertLess(max(sizes) / min(sizes), 2)
+
+    def test_loader(self):
+        data = [{"image": np.ones((1,) + s, dtype=np.float32)} for s in SHAPES]
+        sampler = ShapeBucketBatchSampler(SHAPES, batch_size=3)
+        loader = DataLoader(Dataset(data), batch_sampler=sampler, collate_fn=pad_list_data_collate)
+        for batch in loader:
+            self.assertEqual(batch["image"].shape[0], 3)
+            expected_shape = tuple(batch["image_shape"][:, 1:].max(0)[0].tolist())
+            self.assertTupleEqual(tuple(batch["image"].shape[2:]), expected_shape)
+
+
+if __name__ == "__main__":
+    unittest.main()
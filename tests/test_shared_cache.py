@@ -0,0 +1,56 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+import sys
+import unittest
+
+import numpy as np
+import torch
+
+from monai.data import CacheDataset, DataLoader, SharedCache
+from monai.transforms import AddChanneld, Compose, ToTensord
+
+
+@unittest.skipIf(sys.version_info < (3, 8), "multiprocessing.shared_memory requires python >= 3.8")
+class TestSharedCache(unittest.TestCase):
+    def test_items(self):
+        items = [
+            {"image": np.arange(24, dtype=np.float32).reshape(2, 3, 4), "meta": {"affine": np.eye(4)}, "name": "a"},
+            {"image": np.ones((3, 3), dtype=np.uint8), "meta": {"affine": np.eye(3)}, "name": "b"},
+        ]
+        cache = SharedCache(items)
+        self.assertEqual(len(cache), 2)
+        for expected, item in zip(items, cache):
+            np.testing.assert_allclose(item["image"], expected["image"])
+            np.testing.assert_allclose(item["meta"]["affine"], expected["meta"]["affine"])
+            self.assertEqual(item["image"].dtype, expected["image"].dtype)
+            self.assertEqual(item["name"], expected["name"])
+            self.assertFalse(item["image"].flags.writeable)
+
+        # the index is picklable and attaches to the same memory
+        attached = pickle.loads(pickle.dumps(cache))
+        np.testing.assert_allclose(attached[0]["image"], items[0]["image"])
+        cache.close()
+
+    def test_cache_dataset(self):
+        data = [{"image": np.full((4, 4), i, dtype=np.float32)} for i in range(4)]
+        transform = Compose([AddChanneld(keys="image"), ToTensord(keys="image")])
+        dataset = CacheDataset(data=data, transform=transform, cache_rate=0.5, shared_memory=True)
+        self.assertIsInstance(dataset._cache, SharedCache)
+        loader = DataLoader(dataset, batch_size=1, num_workers=2)
+        for i, batch in enumerate(loader):
+            self.assertTupleEqual(tuple(batch["image"].shape), (1, 1, 4, 4))
+            torch.testing.assert_allclose(batch["image"], torch.full((1, 1, 4, 4), float(i)))
+
+
+if __name__ == "__main__":
+    unittest.main()
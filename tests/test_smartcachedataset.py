@@ -0,0 +1,51 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.data import SmartCacheDataset
+from monai.transforms import AddChanneld, Compose
+
+TEST_CASE_1 = [0.5, 4, 0, 0, [[0, 1, 2, 3], [2, 3, 4, 5], [4, 5, 6, 7], [6, 7, 8, 9], [8, 9, 0, 1]]]
+
+TEST_CASE_2 = [0.25, 4, 2, 2, [[0, 1, 2, 3], [1, 2, 3, 4], [2, 3, 4, 5]]]
+
+TEST_CASE_3 = [0.5, 10, 0, 0, [list(range(10)), list(range(10))]]
+
+
+class TestSmartCacheDataset(unittest.TestCase):
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3])
+    def test_update_cache(self, replace_rate, cache_num, init_workers, replace_workers, expected_windows):
+        data = [{"image": np.full((2, 2), i, dtype=np.float32)} for i in range(10)]
+        dataset = SmartCacheDataset(
+            data=data,
+            transform=Compose([AddChanneld(keys="image")]),
+            replace_rate=replace_rate,
+            cache_num=cache_num,
+            num_init_workers=init_workers,
+            num_replace_workers=replace_workers,
+        )
+        self.assertEqual(len(dataset), cache_num)
+        dataset.start()
+        for i, expected in enumerate(expected_windows):
+            if i > 0:
+                dataset.update_cache()
+            values = [int(dataset[j]["image"][0, 0, 0]) for j in range(len(dataset))]
+            self.assertListEqual(values, expected)
+            self.assertTupleEqual(dataset[0]["image"].shape, (1, 2, 2))
+        dataset.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,8 +12,10 @@
 import unittest
 
 import numpy as np
+import torch
 from parameterized import parameterized
 
+from monai.networks.layers import AffineTransform
 from monai.transforms import Spacing
 from monai.utils import ensure_tuple
 
@@ -176,6 +178,32 @@ class TestSpacingCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             Spacing(pixdim=(-1, 2.0))(np.zeros((1, 1)))
 
+    @parameterized.expand(
+        [
+            ["bilinear", "border", np.diag([-1.2, 0.8, 2.0, 1.0])],
+            ["bilinear", "zeros", np.array([[0, 1.5, 0, 3], [-0.7, 0, 0, 1], [0, 0, 1.1, -2], [0, 0, 0, 1]])],
+            ["bilinear", "reflection", np.diag([0.6, 0.9, 1.7, 1.0])],
+            ["nearest", "zeros", np.array([[0, 0, 2.0, 1], [0, -0.7, 0, 0], [1.3, 0, 0, 2], [0, 0, 0, 1]])],
+        ]
+    )
+    def test_separable(self, interp_order, mode, affine):
+        img = np.random.randint(0, 5, size=(2, 9, 8, 7)).astype(np.float32)
+        spacing = Spacing(pixdim=(1.0, 1.3, 0.9), interp_order=interp_order, mode=mode)
+        result, _, _ = spacing(img, affine=affine)
+        _, _, transform, output_shape = spacing._compute_transform(img.shape[1:], affine)
+        xform = AffineTransform(
+            normalized=False, mode=interp_order, padding_mode=mode, align_corners=True, reverse_indexing=True
+        )
+        expected = xform(torch.as_tensor(img[None].astype(np.float64)), torch.as_tensor(transform), output_shape)
+        np.testing.assert_allclose(result, expected[0].numpy(), rtol=1e-5, atol=1e-5)
+
+    def test_labels(self):
+        img = np.random.randint(0, 5, size=(1, 9, 8, 7)).astype(np.int64)
+        spacing = Spacing(pixdim=(0.7, 1.3, 2.0), diagonal=True, interp_order="nearest", dtype=np.int64)
+        result, _, _ = spacing(img, affine=np.diag([1.0, -1.0, 1.0, 1.0]))
+        self.assertEqual(result.dtype, np.int64)
+        self.assertTrue(set(np.unique(result)).issubset(set(range(5))))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -59,6 +59,27 @@ class TestSpacingDCase(unittest.TestCase):
         np.testing.assert_allclose(res["image"].shape, (2, 1, 46))
         np.testing.assert_allclose(res["image_meta"]["affine"], np.diag((1, 0.2, 1, 1)))
 
+    def test_grouped_keys(self):
+        data = {
+            "image": np.random.rand(2, 8, 9),
+            "seg": np.random.randint(0, 3, (1, 8, 9)),
+            "aux": np.random.rand(3, 8, 9),
+            "image_meta": {"affine": np.diag((2.0, 1.5, 1.0))},
+            "seg_meta": {"affine": np.diag((2.0, 1.5, 1.0))},
+            "aux_meta": {"affine": np.diag((2.0, 1.5, 1.0))},
+        }
+        keys = ("image", "seg", "aux")
+        interp_order = ("bilinear", "nearest", "bilinear")
+        res = Spacingd(keys=keys, interp_order=interp_order, pixdim=(1.3, 1.1))(
+            {k: dict(v) if isinstance(v, dict) else v for k, v in data.items()}
+        )
+        for key, order in zip(keys, interp_order):
+            expected = Spacingd(keys=key, interp_order=order, pixdim=(1.3, 1.1))(
+                {key: data[key], f"{key}_meta": dict(data[f"{key}_meta"])}
+            )
+            np.testing.assert_allclose(res[key], expected[key])
+            np.testing.assert_allclose(res[f"{key}_meta"]["affine"], expected[f"{key}_meta"]["affine"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,83 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+import torch
+from parameterized import parameterized
+
+from monai.data import ArrayDataset, CacheDataset, ThreadDataLoader
+from monai.transforms import AddChanneld, Compose, RandGaussianNoise, RandGaussianNoised
+from monai.utils import TransformProfiler
+
+TEST_CASE_1 = [0, 2]
+
+TEST_CASE_2 = [3, 2]
+
+TEST_CASE_3 = [2, 1]
+
+
+class TestThreadDataLoader(unittest.TestCase):
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3])
+    def test_values(self, num_workers, batch_size):
+        data = [{"image": np.full((4, 4), i, dtype=np.float32), "index": i} for i in range(10)]
+        transform = Compose([AddChanneld(keys="image"), RandGaussianNoised(keys="image", prob=1.0, std=0.01)])
+        dataset = CacheDataset(data=data, transform=transform)
+
+        results = list()
+        for _ in range(2):
+            torch.manual_seed(0)
+            loader = ThreadDataLoader(dataset, batch_size=batch_size, num_workers=num_workers)
+            batches = list(loader)
+            self.assertEqual(len(batches), len(loader))
+            indices = torch.cat([b["index"] for b in batches]).tolist()
+            self.assertListEqual(indices, list(range(10)))
+            images = torch.cat([b["image"] for b in batches])
+            self.assertTupleEqual(tuple(images.shape), (10, 1, 4, 4))
+            np.testing.assert_allclose(images.mean(dim=(1, 2, 3)), np.arange(10), atol=0.05)
+            results.append(images)
+        if num_workers > 0:
+            torch.testing.assert_allclose(results[0], results[1])
+
+    def test_profiler(self):
+        data = [{"image": np.full((4, 4), i, dtype=np.float32)} for i in range(10)]
+        profiler = TransformProfiler()
+        noise = RandGaussianNoised(keys="image", prob=1.0, std=0.01)
+        transform = Compose([AddChanneld(keys="image"), noise], profiler=profiler)
+        dataset = CacheDataset(data=data, transform=transform)
+        for _ in range(2):
+            self.assertEqual(len(list(ThreadDataLoader(dataset, batch_size=2, num_workers=3))), 5)
+        stats = profiler.get_stats()
+        self.assertEqual(stats["uncached/1_RandGaussianNoised"]["calls"], 20)
+        self.assertEqual(stats["cached/0_AddChanneld"]["calls"], 10)
+        self.assertIs(transform.transforms[1], noise)
+
+    def test_array_dataset(self):
+        images = [np.full((1, 4, 4), i, dtype=np.float32) for i in range(12)]
+        img_transform = Compose([RandGaussianNoise(prob=1.0, std=1.0)])
+        seg_transform = Compose([RandGaussianNoise(prob=1.0, std=1.0)])
+        dataset = ArrayDataset(images, img_transform, images, seg_transform)
+        results = list()
+        for _ in range(2):
+            torch.manual_seed(0)
+            batches = list(ThreadDataLoader(dataset, batch_size=2, num_workers=3))
+            imgs = torch.cat([b[0] for b in batches])
+            segs = torch.cat([b[1] for b in batches])
+            # the nested transforms of every thread are synchronized by the copy of the dataset of the thread
+            torch.testing.assert_allclose(imgs, segs)
+            results.append(imgs)
+        torch.testing.assert_allclose(results[0], results[1])
+        self.assertIs(dataset.dataset.data[0].transform, img_transform)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import copy
+import time
+import tracemalloc
+import unittest
+
+import numpy as np
+from torch.utils.data import DataLoader
+
+from monai.data import CacheDataset, Dataset
+from monai.transforms import AddChanneld, Compose, RandFlipd, ScaleIntensityd
+from monai.transforms.utils import apply_transform
+from monai.utils import TransformProfiler, profiling_segment
+
+
+def _transforms(profiler):
+    return Compose(
+        [AddChanneld(keys="image"), ScaleIntensityd(keys="image"), RandFlipd(keys="image", prob=0.5)],
+        profiler=profiler,
+    )
+
+
+class TestTransformProfiler(unittest.TestCase):
+    def test_compose(self):
+        profiler = TransformProfiler(track_memory=True)
+        transforms = _transforms(profiler)
+        for _ in range(3):
+            transforms({"image": np.random.rand(8, 8)})
+        stats = profiler.get_stats()
+        self.assertListEqual(list(stats), ["0_AddChanneld", "1_ScaleIntensityd", "2_RandFlipd"])
+        for stat in stats.values():
+            self.assertEqual(stat["calls"], 3)
+            self.assertGreaterEqual(stat["total_time"], 0.0)
+        self.assertGreater(stats["1_ScaleIntensityd"]["peak_bytes"], 0)
+        self.assertIn("1_ScaleIntensityd", profiler.table())
+        profiler.reset()
+        self.assertEqual(len(profiler.get_stats()), 0)
+
+    def test_deepcopy(self):
+        profiler = TransformProfiler()
+        transforms = copy.deepcopy(_transforms(profiler))
+        self.assertIs(transforms.profiler, profiler)
+        transforms({"image": np.random.rand(8, 8)})
+        self.assertEqual(profiler.get_stats()["2_RandFlipd"]["calls"], 1)
+
+    def test_segment(self):
+        self.assertIs(profiling_segment(None, "cached"), profiling_segment(None, "uncached"))
+        with profiling_segment(None, "cached") as profiler:
+            self.assertIsNone(profiler)
+        profiler = TransformProfiler()
+        with profiling_segment(profiler, "cached") as segment:
+            self.assertIs(segment, profiler)
+            profiler.record("a", 1.0)
+        profiler.record("a", 1.0)
+        self.assertListEqual(list(profiler.get_stats()), ["cached/a", "a"])
+
+    def test_memory(self):
+        was_tracing = tracemalloc.is_tracing()
+        with TransformProfiler(track_memory=True) as profiler:
+
+            def outer(x):
+                profiler.profile("inner", np.zeros, 2 ** 20)
+                return x
+
+            profiler.profile("outer", outer, 0)
+            stats = profiler.get_stats()
+            self.assertGreaterEqual(stats["inner"]["peak_bytes"], 8 * 2 ** 20)
+            self.assertGreaterEqual(stats["outer"]["peak_bytes"], stats["inner"]["peak_bytes"])
+        self.assertEqual(tracemalloc.is_tracing(), was_tracing)
+
+    def test_apply_transform(self):
+        profiler = TransformProfiler()
+        apply_transform(np.flip, np.zeros(3), profiler=profiler)
+        apply_transform(np.flip, [np.zeros(3)] * 2, profiler=profiler, name="flip")
+        stats = profiler.get_stats()
+        self.assertListEqual(list(stats), ["flip"])
+        self.assertEqual(stats["flip"]["calls"], 2)
+
+    def test_workers(self):
+        profiler = TransformProfiler()
+        dataset = Dataset([{"image": np.random.rand(8, 8)} for _ in range(10)], _transforms(profiler))
+        for _ in DataLoader(dataset, batch_size=2, num_workers=2):
+            pass
+        for _ in range(100):
+            if profiler.get_stats().get("2_RandFlipd", {}).get("calls") == 10:
+                break
+            time.sleep(0.05)
+        self.assertEqual(profiler.get_stats()["2_RandFlipd"]["calls"], 10)
+
+    def test_cache_dataset(self):
+        profiler = TransformProfiler()
+        data = [{"image": np.random.rand(8, 8)} for _ in range(5)]
+        dataset = CacheDataset(data, _transforms(profiler), cache_num=3)
+        for i in range(len(dataset)):
+            dataset[i]
+        stats = profiler.get_stats()
+        self.assertEqual(stats["cached/1_ScaleIntensityd"]["calls"], 3)
+        self.assertEqual(stats["uncached/1_ScaleIntensityd"]["calls"], 2)
+        self.assertEqual(stats["uncached/2_RandFlipd"]["calls"], 5)
+        self.assertNotIn("cached/2_RandFlipd", stats)
+
+
+if __name__ == "__main__":
+    unittest.main()